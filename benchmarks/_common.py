@@ -0,0 +1,59 @@
+"""
+Shared helpers for the offline benchmark scripts in this directory.
+
+Benchmarks are plain scripts (not collected by pytest). Run them from the
+repo root with the package installed (pip install -e .).
+"""
+from __future__ import annotations
+
+import time
+import tracemalloc
+from typing import Any, Callable
+
+from shield_orchestrator.v3.canonical_json import to_canonical_json
+from shield_orchestrator.v3.contracts.envelope import OrchestratorV3Request
+
+
+def make_payload(size_bytes: int, *, depth: int = 1) -> dict[str, Any]:
+    """
+    Deterministic wallet-like payload of roughly `size_bytes` canonical JSON,
+    with its items nested `depth` levels deep.
+    """
+    item_template = {"amount": 12345678, "fee": 0.0001, "memo": "x" * 48, "to": "dgb1qexample"}
+    item_size = len(to_canonical_json(item_template)) + 1
+    items = [dict(item_template, idx=i) for i in range(max(0, size_bytes // item_size))]
+
+    node: Any = items
+    for level in range(max(0, depth - 1)):
+        node = {f"level_{level}": node}
+    return {"outputs": node}
+
+
+def make_request(payload: dict[str, Any] | None = None, *, nonce: str = "n1") -> OrchestratorV3Request:
+    return OrchestratorV3Request(
+        contract_version=3,
+        wallet_id="w1",
+        action="SEND",
+        nonce=nonce,
+        ttl_seconds=60,
+        payload={} if payload is None else payload,
+    )
+
+
+def measure(fn: Callable[[], Any], *, repeat: int = 5) -> tuple[float, int]:
+    """
+    Return (best wall seconds over `repeat` runs, peak traced bytes of one run).
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return best, peak
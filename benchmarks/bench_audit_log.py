@@ -0,0 +1,66 @@
+"""
+Audit log write throughput and lookup cost.
+
+Compares one commit (write + fsync) per record with group commit, measures
+the request-path cost of AuditLog.record(), and random get(context_hash)
+lookups across rotated segments.
+
+    python benchmarks/bench_audit_log.py [--records 5000] [--no-fsync]
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import tempfile
+import time
+
+from _common import make_payload, make_request
+
+from shield_orchestrator.v3.audit_log import AuditLog
+from shield_orchestrator.v3.canonical_request import CanonicalRequest
+from shield_orchestrator.v3.orchestrate import orchestrate
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=5000)
+    parser.add_argument("--no-fsync", action="store_true")
+    args = parser.parse_args()
+
+    requests = [make_request(make_payload(1024), nonce=f"n{i}") for i in range(args.records)]
+    items = [(r, orchestrate(r), CanonicalRequest.from_request(r)) for r in requests]
+
+    print(f"records={args.records} fsync={not args.no_fsync}")
+    print(f"{'mode':>14} {'records_per_s':>14} {'batches':>8} {'record_us':>10}")
+    for mode, batch_size in (("per-record", 1), ("group-commit", 512)):
+        with tempfile.TemporaryDirectory() as directory:
+            # queue_size holds every record, so none is dropped while the writer catches up.
+            with AuditLog(
+                directory,
+                batch_size=batch_size,
+                segment_bytes=4 * 1024 * 1024,
+                queue_size=args.records,
+                fsync=not args.no_fsync,
+            ) as log:
+                t0 = time.perf_counter()
+                for item in items:
+                    log.record(*item)
+                enqueued = time.perf_counter() - t0
+                log.flush()
+                elapsed = time.perf_counter() - t0
+                stats = log.stats()
+
+                if batch_size > 1:
+                    hashes = [response.context_hash for _, response, _ in items]
+                    random.Random(0).shuffle(hashes)
+                    t0 = time.perf_counter()
+                    found = sum(log.read(h) is not None for h in hashes)
+                    lookup = time.perf_counter() - t0
+
+        print(f"{mode:>14} {args.records / elapsed:>14.0f} {stats.batches:>8} {enqueued / args.records * 1e6:>10.1f}")
+
+    print(f"lookups: {found}/{len(hashes)} found over {stats.segments} segments, {lookup / len(hashes) * 1e6:.1f} us each")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Canonical JSON encoder: the original json.dumps() call vs to_canonical_bytes()
+on the reference (stdlib) backend and, when installed, the orjson backend.
+
+    python benchmarks/bench_canonical_json.py [--sizes 1024,102400,1048576]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+
+from _common import make_payload, make_request, measure
+
+from shield_orchestrator.v3 import canonical_json
+from shield_orchestrator.v3.canonical_json import to_canonical_bytes
+
+
+def _original(obj) -> bytes:
+    return json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="1024,102400,1048576")
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    orjson = canonical_json._orjson
+    print(f"orjson={'installed' if orjson is not None else 'missing'}")
+    print(f"{'bytes':>9} {'encoder':>10} {'best_us':>10} {'speedup':>8} {'identical':>9}")
+
+    for size in (int(s) for s in args.sizes.split(",")):
+        material = make_request(make_payload(size), nonce="n1").to_hash_material()
+        expected = _original(material)
+        baseline = measure(lambda: _original(material), repeat=args.repeat)[0]
+        print(f"{size:>9} {'dumps':>10} {baseline * 1e6:>10.1f} {1.0:>8.2f} {'yes':>9}")
+
+        for name, backend in (("reference", None), ("orjson", orjson)):
+            if name == "orjson" and orjson is None:
+                continue
+            canonical_json._orjson = backend
+            try:
+                best = measure(lambda: to_canonical_bytes(material), repeat=args.repeat)[0]
+                identical = "yes" if to_canonical_bytes(material) == expected else "NO"
+            finally:
+                canonical_json._orjson = orjson
+            print(f"{size:>9} {name:>10} {best * 1e6:>10.1f} {baseline / best:>8.2f} {identical:>9}")
+
+
+if __name__ == "__main__":
+    main()
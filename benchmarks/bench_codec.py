@@ -0,0 +1,88 @@
+"""
+Binary envelope codec vs canonical JSON: wire size and encode/decode time.
+
+For each payload size, the request and its response envelope are encoded
+both ways. JSON decode includes rebuilding the envelope objects
+(OrchestratorV3Request(**...) / OrchestratorV3Response.from_hash_material),
+as the service client does. Round trips are checked exact.
+
+    python benchmarks/bench_codec.py [--sizes 0,1024,102400]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import timeit
+
+from _common import make_payload, make_request
+
+from shield_orchestrator.v3.canonical_json import to_canonical_bytes
+from shield_orchestrator.v3.codec import decode_request, decode_response, encode_request, encode_response
+from shield_orchestrator.v3.contracts.envelope import OrchestratorV3Request, OrchestratorV3Response
+from shield_orchestrator.v3.orchestrate import orchestrate
+
+
+def _best_us(fn, number: int) -> float:
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e6
+
+
+def _row(kind: str, size: int, json_bytes: bytes, binary: bytes, timings: list[float]) -> None:
+    json_enc, bin_enc, json_dec, bin_dec = timings
+    print(
+        f"{kind:>8} {size:>8} {len(json_bytes):>10} {len(binary):>9} {len(json_bytes) / len(binary):>6.1f}x"
+        f" {json_enc:>9.1f} {bin_enc:>8.1f} {json_dec:>9.1f} {bin_dec:>8.1f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="0,1024,102400")
+    args = parser.parse_args()
+
+    print(
+        f"{'envelope':>8} {'payload':>8} {'json_bytes':>10} {'bin_bytes':>9} {'ratio':>7}"
+        f" {'json_enc':>9} {'bin_enc':>8} {'json_dec':>9} {'bin_dec':>8}   (times in us)"
+    )
+    for size in (int(s) for s in args.sizes.split(",")):
+        request = make_request(make_payload(size))
+        response = orchestrate(request)
+        number = 2000 if size < 10_000 else 20
+
+        request_json = to_canonical_bytes(request.to_hash_material())
+        request_bin = encode_request(request)
+        assert OrchestratorV3Request(**json.loads(request_json)) == request
+        assert decode_request(request_bin) == request
+        _row(
+            "request",
+            size,
+            request_json,
+            request_bin,
+            [
+                _best_us(lambda: to_canonical_bytes(request.to_hash_material()), number),
+                _best_us(lambda: encode_request(request), number),
+                _best_us(lambda: OrchestratorV3Request(**json.loads(request_json)), number),
+                _best_us(lambda: decode_request(request_bin), number),
+            ],
+        )
+
+        # The response envelope does not carry the payload; its size is independent of it.
+        response_json = to_canonical_bytes(response.to_hash_material())
+        response_bin = encode_response(response)
+        assert OrchestratorV3Response.from_hash_material(json.loads(response_json)) == response
+        assert decode_response(response_bin).context_hash == response.context_hash
+        _row(
+            "response",
+            size,
+            response_json,
+            response_bin,
+            [
+                _best_us(lambda: to_canonical_bytes(response.to_hash_material()), 2000),
+                _best_us(lambda: encode_response(response), 2000),
+                _best_us(lambda: OrchestratorV3Response.from_hash_material(json.loads(response_json)), 2000),
+                _best_us(lambda: decode_response(response_bin), 2000),
+            ],
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+"""
+One-shot vs streaming context_hash: wall time and peak memory.
+
+    python benchmarks/bench_context_hash.py [--sizes 1048576,8388608] [--repeat 5]
+"""
+from __future__ import annotations
+
+import argparse
+
+from _common import make_payload, measure
+
+from shield_orchestrator.v3.context_hash import compute_context_hash, compute_context_hash_streaming
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="1048576,8388608", help="comma-separated payload sizes in bytes")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'size':>10} {'mode':>10} {'best_ms':>10} {'peak_kib':>10}")
+    for size in (int(s) for s in args.sizes.split(",")):
+        material = {"request": make_payload(size)}
+        assert compute_context_hash(material) == compute_context_hash_streaming(material)
+
+        for mode, fn in (("one-shot", compute_context_hash), ("streaming", compute_context_hash_streaming)):
+            best, peak = measure(lambda: fn(material), repeat=args.repeat)
+            print(f"{size:>10} {mode:>10} {best * 1e3:>10.1f} {peak / 1024:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Slotted envelopes + to_hash_material() vs dict-backed dataclasses + asdict().
+
+    python benchmarks/bench_envelope.py [--responses 20000]
+"""
+from __future__ import annotations
+
+import argparse
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+
+from _common import make_request
+
+from shield_orchestrator.v3.context_hash import compute_context_hash
+from shield_orchestrator.v3.orchestrate import orchestrate
+
+
+@dataclass(frozen=True)
+class DictTraceEntry:
+    """Pre-slots TraceEntry layout, for comparison only."""
+    stage: str
+    component: str
+    status: str
+    reason_ids: tuple[str, ...] = ()
+    component_context_hash: str | None = None
+    notes: str | None = None
+
+
+def _footprint(factory, n: int) -> int:
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    keep = [factory(i) for i in range(n)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del keep
+    return (after - before) // n
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--responses", type=int, default=20000)
+    args = parser.parse_args()
+
+    resp = orchestrate(make_request({"x": 1}))
+    trace = resp.trace
+    assert all(compute_context_hash(asdict(t)) == compute_context_hash(t.to_hash_material()) for t in trace)
+
+    n = args.responses
+    t0 = time.perf_counter()
+    for _ in range(n):
+        [asdict(t) for t in trace]
+    asdict_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for _ in range(n):
+        [t.to_hash_material() for t in trace]
+    fast_s = time.perf_counter() - t0
+
+    fields = dict(stage="qwg", component="qwg", status="OK", component_context_hash="0" * 64, notes="stub")
+    slotted = _footprint(lambda i: type(trace[0])(**fields), 100_000)
+    dict_backed = _footprint(lambda i: DictTraceEntry(**fields), 100_000)
+
+    print(f"trace material for {n} responses x {len(trace)} entries")
+    print(f"  asdict():            {asdict_s * 1e3:8.1f} ms ({n / asdict_s:,.0f} responses/s)")
+    print(f"  to_hash_material():  {fast_s * 1e3:8.1f} ms ({n / fast_s:,.0f} responses/s)")
+    print(f"TraceEntry instance:   slotted {slotted} B vs dict-backed {dict_backed} B")
+
+    t0 = time.perf_counter()
+    for i in range(n // 10):
+        orchestrate(make_request({"x": i}))
+    print(f"orchestrate():         {(n // 10) / (time.perf_counter() - t0):,.0f} req/s")
+
+
+if __name__ == "__main__":
+    main()
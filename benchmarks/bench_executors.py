@@ -0,0 +1,99 @@
+"""
+Executor backend scaling with CPU-heavy stand-in bridges.
+
+Each stand-in bridge burns a fixed, deterministic amount of pure-Python CPU
+(a proxy for PQC signature verification) before returning the regular stub
+entry, so responses stay identical across backends.
+
+    python benchmarks/bench_executors.py [--requests 40] [--work 20000] [--workers 1,2,4]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import time
+
+from _common import make_payload, make_request
+
+from shield_orchestrator.bridges.adaptive_core_bridge import AdaptiveCoreBridge
+from shield_orchestrator.bridges.adn_bridge import ADNBridge
+from shield_orchestrator.bridges.dqsn_bridge import DQSNBridge
+from shield_orchestrator.bridges.guardian_wallet_bridge import GuardianWalletBridge
+from shield_orchestrator.bridges.qwg_bridge import QWGBridge
+from shield_orchestrator.bridges.sentinel_bridge import SentinelBridge
+from shield_orchestrator.v3.executors import InlineExecutor, ProcessExecutor, ThreadExecutor
+from shield_orchestrator.v3.orchestrate import _orchestrate
+
+WORK = int(os.environ.get("SHIELD_BENCH_WORK", "20000"))
+
+
+def _burn(seed: str) -> int:
+    acc = 0
+    for i in range(WORK):
+        acc = (acc * 31 + i + len(seed)) & 0xFFFFFFFF
+    return acc
+
+
+def _heavy(base: type) -> type:
+    def evaluate_v3(self, request, *, canonical):
+        _burn(canonical.digest)
+        return base.evaluate_v3(self, request, canonical=canonical)
+
+    return type(f"Heavy{base.__name__}", (base,), {"evaluate_v3": evaluate_v3, "__module__": __name__})
+
+
+HeavySentinelBridge = _heavy(SentinelBridge)
+HeavyDQSNBridge = _heavy(DQSNBridge)
+HeavyADNBridge = _heavy(ADNBridge)
+HeavyGuardianWalletBridge = _heavy(GuardianWalletBridge)
+HeavyQWGBridge = _heavy(QWGBridge)
+
+BRIDGES = (
+    HeavySentinelBridge(),
+    HeavyDQSNBridge(),
+    HeavyADNBridge(),
+    HeavyGuardianWalletBridge(),
+    HeavyQWGBridge(),
+)
+
+
+def _run(executor, requests) -> tuple[float, list]:
+    sink = AdaptiveCoreBridge()
+    t0 = time.perf_counter()
+    responses = [_orchestrate(r, bridges=BRIDGES, sink=sink, executor=executor) for r in requests]
+    return time.perf_counter() - t0, responses
+
+
+def main() -> None:
+    global WORK
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=40)
+    parser.add_argument("--work", type=int, default=WORK, help="CPU loop iterations per bridge call")
+    parser.add_argument("--workers", default="1,2,4")
+    args = parser.parse_args()
+
+    # Propagated to process-pool workers through the environment.
+    os.environ["SHIELD_BENCH_WORK"] = str(args.work)
+    WORK = args.work
+
+    requests = [make_request(make_payload(1024), nonce=f"n{i}") for i in range(args.requests)]
+    baseline_s, baseline = _run(InlineExecutor(), requests)
+
+    print(f"cpus={os.cpu_count()} requests={args.requests} work={args.work}")
+    print(f"{'backend':>8} {'workers':>8} {'req_per_s':>10} {'speedup':>8} {'identical':>9}")
+    print(f"{'inline':>8} {1:>8} {args.requests / baseline_s:>10.1f} {1.0:>8.2f} {'yes':>9}")
+
+    for workers in (int(w) for w in args.workers.split(",")):
+        for name, backend in (("thread", ThreadExecutor), ("process", ProcessExecutor)):
+            with backend(max_workers=workers) as executor:
+                _run(executor, requests[:2])  # warm up the pool
+                elapsed, responses = _run(executor, requests)
+            identical = "yes" if responses == baseline else "NO"
+            print(
+                f"{name:>8} {workers:>8} {args.requests / elapsed:>10.1f} "
+                f"{baseline_s / elapsed:>8.2f} {identical:>9}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Verifying one component's trace entry: flat context_hash vs Merkle proof.
+
+With only the flat context_hash, checking any single entry means
+re-serializing and re-hashing the whole envelope, payload included. In
+Merkle mode the entry is checked against merkle_root with its inclusion
+proof, independent of the payload size.
+
+    python benchmarks/bench_merkle.py [--sizes 1024,102400,1048576]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import timeit
+
+from _common import make_payload, make_request
+
+from shield_orchestrator.v3.canonical_request import CanonicalRequest
+from shield_orchestrator.v3.context_hash import compute_context_hash
+from shield_orchestrator.v3.merkle import TRACE_LEAF_OFFSET, compute_merkle_root, prove, verify_trace_entry
+from shield_orchestrator.v3.orchestrate import _request_for_hash, orchestrate
+
+
+def _best_us(fn, number: int) -> float:
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="1024,102400,1048576")
+    args = parser.parse_args()
+
+    print(f"{'payload':>9} {'flat_us':>10} {'proof_us':>9} {'speedup':>8} {'proof_bytes':>11} {'root_us':>8}")
+    for size in (int(s) for s in args.sizes.split(",")):
+        request = make_request(make_payload(size))
+        response = orchestrate(request, merkle=True)
+        assert response.context_hash == orchestrate(request).context_hash
+
+        position = len(response.trace) - 1  # the last component's entry
+        entry = response.trace[position]
+        digest = CanonicalRequest.from_request(request).digest
+        proof = prove(digest, response, TRACE_LEAF_OFFSET + position)
+
+        def flat() -> None:
+            material = {
+                "request": _request_for_hash(request, include_payload=True),
+                "outcome": response.outcome,
+                "reason_ids": list(response.reason_ids),
+                "trace": [t.to_hash_material() for t in response.trace],
+            }
+            assert compute_context_hash(material) == response.context_hash
+
+        def merkle() -> None:
+            assert verify_trace_entry(entry, position, proof, response.merkle_root)
+
+        number = max(1, 200_000 // max(size, 1))
+        flat_us = _best_us(flat, number)
+        proof_us = _best_us(merkle, 2000)
+        # Cost merkle=True adds to orchestrate(): the root, reusing the request digest.
+        root_us = _best_us(lambda: compute_merkle_root(digest, response), 2000)
+        proof_bytes = len(json.dumps(proof.to_dict(), separators=(",", ":")))
+        print(
+            f"{size:>9} {flat_us:>10.1f} {proof_us:>9.1f} {flat_us / proof_us:>7.0f}x {proof_bytes:>11} {root_us:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
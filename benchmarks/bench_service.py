@@ -0,0 +1,67 @@
+"""
+In-process orchestrate() vs the pre-forked Unix socket service.
+
+The service runs `--workers` processes on this box; `--clients` threads
+share one ServiceClient (one connection each). In-process, the same
+threads share one interpreter and its GIL. Envelopes are checked
+identical to orchestrate(). On a single core the service only adds the
+socket round trip; the gain grows with cores, up to one worker per core.
+
+    python benchmarks/bench_service.py [--workers 4] [--clients 8] [--requests 2000] [--sizes 1024,102400]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from _common import make_payload, make_request
+
+from shield_orchestrator.v3.orchestrate import orchestrate
+from shield_orchestrator.v3.service import OrchestratorService, ServiceClient
+
+
+def _run(call, requests, clients: int) -> tuple[float, float, float, bool]:
+    expected = [orchestrate(r) for r in requests]
+
+    def timed(request):
+        t = time.perf_counter()
+        response = call(request)
+        return time.perf_counter() - t, response
+
+    with ThreadPoolExecutor(max_workers=clients) as pool:
+        t0 = time.perf_counter()
+        results = list(pool.map(timed, requests))
+        elapsed = time.perf_counter() - t0
+
+    latencies = sorted(latency for latency, _ in results)
+    identical = [response for _, response in results] == expected
+    return len(requests) / elapsed, latencies[len(latencies) // 2], latencies[int(len(latencies) * 0.99)], identical
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--sizes", default="1024,102400")
+    args = parser.parse_args()
+
+    path = os.path.join(tempfile.mkdtemp(), "shield.sock")
+    print(f"workers={args.workers} clients={args.clients} requests={args.requests} cpus={os.cpu_count()}")
+    print(f"{'payload':>8} {'mode':>10} {'req_per_s':>10} {'p50_us':>9} {'p99_us':>9} {'identical':>9}")
+    with OrchestratorService(path, workers=args.workers), ServiceClient(path) as client:
+        for size in (int(s) for s in args.sizes.split(",")):
+            payload = make_payload(size)
+            requests = [make_request(payload, nonce=f"n{i}") for i in range(args.requests)]
+            for name, call in (("in_process", orchestrate), ("service", client.orchestrate)):
+                rate, p50, p99, identical = _run(call, requests, args.clients)
+                print(
+                    f"{size:>8} {name:>10} {rate:>10.1f} {p50 * 1e6:>9.1f} {p99 * 1e6:>9.1f} {'yes' if identical else 'NO':>9}"
+                )
+
+
+if __name__ == "__main__":
+    main()
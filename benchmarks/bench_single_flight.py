@@ -0,0 +1,79 @@
+"""
+Retry storm with and without single-flight coalescing.
+
+`--clients` threads each send every one of `--distinct` requests
+`--retries` times, as wallets retrying a slow call would. The QWG stand-in
+costs a fixed round trip (--rtt-ms), like a remote component. Without
+coalescing every duplicate runs the bridge chain; with SingleFlight,
+concurrent duplicates share one evaluation. Envelopes are checked
+identical to orchestrate().
+
+    python benchmarks/bench_single_flight.py [--clients 32] [--distinct 8] [--retries 4] [--rtt-ms 5]
+"""
+from __future__ import annotations
+
+import argparse
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from _common import make_payload, make_request
+
+from shield_orchestrator.bridges.qwg_bridge import QWGBridge
+from shield_orchestrator.v3.orchestrate import Orchestrator, _default_bridges, orchestrate
+from shield_orchestrator.v3.single_flight import SingleFlight
+
+
+class RemoteQWGBridge(QWGBridge):
+    """QWG stub behind a simulated network round trip."""
+
+    def __init__(self, rtt_seconds: float) -> None:
+        self.rtt_seconds = rtt_seconds
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def evaluate_v3(self, request, *, canonical=None):
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.rtt_seconds)
+        return super().evaluate_v3(request, canonical=canonical)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--clients", type=int, default=32)
+    parser.add_argument("--distinct", type=int, default=8)
+    parser.add_argument("--retries", type=int, default=4)
+    parser.add_argument("--rtt-ms", type=float, default=5.0)
+    args = parser.parse_args()
+
+    requests = [make_request(make_payload(1024), nonce=f"n{i}") for i in range(args.distinct)]
+    expected = {id(r): orchestrate(r) for r in requests}
+    work = [r for _ in range(args.retries) for r in requests] * args.clients
+
+    print(f"clients={args.clients} distinct={args.distinct} requests={len(work)} rtt_ms={args.rtt_ms}")
+    print(f"{'mode':>14} {'req_per_s':>10} {'p50_ms':>8} {'p99_ms':>8} {'evaluations':>11} {'identical':>9}")
+    for name, flight in (("independent", None), ("single_flight", SingleFlight())):
+        qwg = RemoteQWGBridge(args.rtt_ms / 1000)
+        orchestrator = Orchestrator((*_default_bridges()[:4], qwg), single_flight=flight)
+
+        def call(request):
+            t = time.perf_counter()
+            response = orchestrator.orchestrate(request)
+            return time.perf_counter() - t, response == expected[id(request)]
+
+        with ThreadPoolExecutor(max_workers=args.clients) as pool:
+            t0 = time.perf_counter()
+            results = list(pool.map(call, work))
+            elapsed = time.perf_counter() - t0
+
+        latencies = sorted(latency for latency, _ in results)
+        p50, p99 = latencies[len(latencies) // 2], latencies[int(len(latencies) * 0.99)]
+        identical = "yes" if all(same for _, same in results) else "NO"
+        print(
+            f"{name:>14} {len(work) / elapsed:>10.1f} {p50 * 1e3:>8.2f} {p99 * 1e3:>8.2f} {qwg.calls:>11} {identical:>9}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Adaptive Core delivery inline vs through BatchingSink.
+
+The stand-in delivery costs a fixed round trip per call (--rtt-ms), like a
+remote report. Inline, every request waits for it; batched, requests only
+enqueue and one round trip carries a whole micro-batch. Envelopes are
+checked identical to the default orchestrator.
+
+    python benchmarks/bench_sink.py [--requests 500] [--rtt-ms 2] [--batch-size 64]
+"""
+from __future__ import annotations
+
+import argparse
+import time
+
+from _common import make_payload, make_request
+
+from shield_orchestrator.bridges.adaptive_core_bridge import AdaptiveCoreBridge
+from shield_orchestrator.v3.orchestrate import Orchestrator, orchestrate
+from shield_orchestrator.v3.sink import BatchingSink
+
+
+class InlineDeliverySink(AdaptiveCoreBridge):
+    """Delivers each report synchronously inside report_v3()."""
+
+    def __init__(self, deliver) -> None:
+        self.deliver = deliver
+
+    def report_v3(self, request, **kwargs):
+        entry = super().report_v3(request, **kwargs)
+        self.deliver([entry])
+        return entry
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--rtt-ms", type=float, default=2.0)
+    parser.add_argument("--batch-size", type=int, default=64)
+    args = parser.parse_args()
+
+    calls = 0
+
+    def deliver(batch) -> None:
+        nonlocal calls
+        calls += 1
+        time.sleep(args.rtt_ms / 1000)
+
+    requests = [make_request(make_payload(1024), nonce=f"n{i}") for i in range(args.requests)]
+    expected = [orchestrate(r) for r in requests]
+
+    print(f"requests={args.requests} rtt_ms={args.rtt_ms} batch_size={args.batch_size}")
+    print(f"{'sink':>8} {'req_per_s':>10} {'p50_us':>9} {'p99_us':>9} {'deliveries':>10} {'identical':>9}")
+    for name, sink in (
+        ("inline", InlineDeliverySink(deliver)),
+        ("batched", BatchingSink(deliver, batch_size=args.batch_size)),
+    ):
+        calls = 0
+        latencies = []
+        with Orchestrator(sink=sink) as orchestrator:
+            t0 = time.perf_counter()
+            responses = []
+            for request in requests:
+                t = time.perf_counter()
+                responses.append(orchestrator.orchestrate(request))
+                latencies.append(time.perf_counter() - t)
+            elapsed = time.perf_counter() - t0
+        # Leaving the block closed the sink, so every report is delivered.
+
+        latencies.sort()
+        p50, p99 = latencies[len(latencies) // 2], latencies[int(len(latencies) * 0.99)]
+        identical = "yes" if responses == expected else "NO"
+        print(
+            f"{name:>8} {args.requests / elapsed:>10.1f} {p50 * 1e6:>9.1f} {p99 * 1e6:>9.1f} {calls:>10} {identical:>9}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Pooled transport load test against the local loopback component server.
+
+Compares one connection per call (no pooling) with the shared keep-alive
+pool, sequentially and from concurrent callers, and checks that remote
+envelopes are identical to the in-process stubs.
+
+    python benchmarks/bench_transport.py [--requests 500] [--callers 1,8,32] [--connections 4] [--pipeline 8]
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from _common import make_payload, make_request
+
+from shield_orchestrator.v3.loopback import LoopbackComponentServer
+from shield_orchestrator.v3.orchestrate import Orchestrator, orchestrate
+from shield_orchestrator.v3.registry import CANONICAL_COMPONENTS
+from shield_orchestrator.v3.transport import RemoteBridge, Transport
+
+
+def _orchestrator(transport: Transport) -> Orchestrator:
+    return Orchestrator(tuple(RemoteBridge(c, transport) for c in CANONICAL_COMPONENTS))
+
+
+def _run(call, requests, callers: int) -> tuple[float, list]:
+    t0 = time.perf_counter()
+    if callers == 1:
+        responses = [call(r) for r in requests]
+    else:
+        with ThreadPoolExecutor(max_workers=callers) as pool:
+            responses = list(pool.map(call, requests))
+    return time.perf_counter() - t0, responses
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--callers", default="1,8,32")
+    parser.add_argument("--connections", type=int, default=4, help="max connections per component")
+    parser.add_argument("--pipeline", type=int, default=8, help="max in-flight requests per connection")
+    args = parser.parse_args()
+
+    requests = [make_request(make_payload(1024), nonce=f"n{i}") for i in range(args.requests)]
+    expected = [orchestrate(r) for r in requests]
+
+    with LoopbackComponentServer() as server:
+        endpoints = server.endpoints()
+
+        def per_call(request):
+            # Baseline: fresh connections for every request.
+            with Transport(endpoints, max_connections=1) as transport:
+                return _orchestrator(transport).orchestrate(request)
+
+        print(f"requests={args.requests} connections={args.connections} pipeline={args.pipeline}")
+        print(f"{'mode':>10} {'callers':>8} {'req_per_s':>10} {'identical':>9}")
+
+        for callers in (int(c) for c in args.callers.split(",")):
+            elapsed, responses = _run(per_call, requests, callers)
+            identical = "yes" if responses == expected else "NO"
+            print(f"{'per-call':>10} {callers:>8} {args.requests / elapsed:>10.1f} {identical:>9}")
+
+            with Transport(endpoints, max_connections=args.connections, max_pipeline=args.pipeline) as transport:
+                with _orchestrator(transport) as orchestrator:
+                    elapsed, responses = _run(orchestrator.orchestrate, requests, callers)
+            identical = "yes" if responses == expected else "NO"
+            print(f"{'pooled':>10} {callers:>8} {args.requests / elapsed:>10.1f} {identical:>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""
+Offline benchmark harness for the v3 orchestrator hot path.
+
+Measures throughput and p50/p99 latency per scenario, writes
+machine-readable JSON, and can gate on regressions against a baseline:
+
+    python benchmarks/run.py --output bench.json
+    python benchmarks/run.py --baseline bench.json --max-regression 0.25
+    python benchmarks/run.py --filter 'orchestrate/payload' --min-time 0.5
+
+Exit status is 1 when any scenario's p50 latency regressed by more than
+--max-regression relative to the baseline.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import re
+import sys
+import time
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from _common import make_payload, make_request
+
+from shield_orchestrator.pipeline import FullShieldPipeline
+from shield_orchestrator.v3.context_hash import compute_context_hash
+from shield_orchestrator.v3.orchestrate import orchestrate
+
+SCHEMA_VERSION = 1
+
+PAYLOAD_SIZES = {"empty": 0, "1kb": 1024, "100kb": 100 * 1024, "10mb": 10 * 1024 * 1024}
+NESTING_DEPTHS = (1, 16, 128)
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    fn: Callable[[], Any]
+    check: Callable[[Any], bool] | None = None
+
+
+def _expect_reason(reason_id: str) -> Callable[[Any], bool]:
+    return lambda resp: resp.reason_ids == (reason_id,)
+
+
+def build_scenarios() -> list[Scenario]:
+    scenarios: list[Scenario] = []
+
+    for label, size in PAYLOAD_SIZES.items():
+        req = make_request(make_payload(size))
+        scenarios.append(Scenario(f"orchestrate/payload={label}", lambda r=req: orchestrate(r), _expect_reason("DENY_BY_POLICY")))
+
+    for depth in NESTING_DEPTHS:
+        req = make_request(make_payload(1024, depth=depth))
+        scenarios.append(Scenario(f"orchestrate/depth={depth}", lambda r=req: orchestrate(r), _expect_reason("DENY_BY_POLICY")))
+
+    unhashable = make_request({"bad": object()})
+    scenarios.append(Scenario("orchestrate/fail=HASHING_FAILED", lambda: orchestrate(unhashable), _expect_reason("HASHING_FAILED")))
+
+    invalid = make_request({"x": 1}, nonce="")
+    scenarios.append(Scenario("orchestrate/fail=INVALID_REQUEST", lambda: orchestrate(invalid), _expect_reason("INVALID_REQUEST")))
+
+    for label in ("1kb", "100kb", "10mb"):
+        material = {"request": make_payload(PAYLOAD_SIZES[label])}
+        scenarios.append(Scenario(f"context_hash/payload={label}", lambda m=material: compute_context_hash(m)))
+
+    pipeline = FullShieldPipeline.from_default_config()
+    event = {"type": "test", "payload": make_payload(1024)}
+    scenarios.append(Scenario("legacy/process_event", lambda: pipeline.process_event(event)))
+
+    return scenarios
+
+
+def _percentile(sorted_samples: list[float], q: float) -> float:
+    index = min(len(sorted_samples) - 1, max(0, round(q * (len(sorted_samples) - 1))))
+    return sorted_samples[index]
+
+
+def run_scenario(scenario: Scenario, *, min_time: float, min_iterations: int, max_iterations: int) -> dict[str, Any]:
+    result = scenario.fn()  # warm-up + correctness check
+    if scenario.check is not None and not scenario.check(result):
+        raise AssertionError(f"{scenario.name}: unexpected result {result!r}")
+
+    samples: list[float] = []
+    started = time.perf_counter()
+    while len(samples) < max_iterations and (
+        len(samples) < min_iterations or time.perf_counter() - started < min_time
+    ):
+        t0 = time.perf_counter()
+        scenario.fn()
+        samples.append(time.perf_counter() - t0)
+    total = time.perf_counter() - started
+
+    samples.sort()
+    return {
+        "iterations": len(samples),
+        "ops_per_sec": len(samples) / total,
+        "p50_us": _percentile(samples, 0.50) * 1e6,
+        "p99_us": _percentile(samples, 0.99) * 1e6,
+        "mean_us": sum(samples) / len(samples) * 1e6,
+    }
+
+
+def find_regressions(results: dict[str, Any], baseline: dict[str, Any], max_regression: float) -> list[str]:
+    regressions = []
+    for name, current in results["scenarios"].items():
+        previous = baseline.get("scenarios", {}).get(name)
+        if previous is None:
+            continue
+        ratio = current["p50_us"] / previous["p50_us"] - 1.0
+        if ratio > max_regression:
+            regressions.append(
+                f"{name}: p50 {previous['p50_us']:.1f}us -> {current['p50_us']:.1f}us (+{ratio:.0%})"
+            )
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--filter", default="", help="regex selecting scenario names")
+    parser.add_argument("--min-time", type=float, default=1.0, help="seconds per scenario")
+    parser.add_argument("--min-iterations", type=int, default=5)
+    parser.add_argument("--max-iterations", type=int, default=100_000)
+    parser.add_argument("--output", help="write JSON results to this path")
+    parser.add_argument("--baseline", help="JSON results to compare against")
+    parser.add_argument("--max-regression", type=float, default=0.20, help="allowed p50 slowdown (0.20 = 20%%)")
+    args = parser.parse_args(argv)
+
+    pattern = re.compile(args.filter)
+    results: dict[str, Any] = {
+        "schema_version": SCHEMA_VERSION,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "scenarios": {},
+    }
+
+    print(f"{'scenario':<36} {'iters':>7} {'ops/s':>10} {'p50_us':>11} {'p99_us':>11}")
+    for scenario in build_scenarios():
+        if not pattern.search(scenario.name):
+            continue
+        r = run_scenario(
+            scenario,
+            min_time=args.min_time,
+            min_iterations=args.min_iterations,
+            max_iterations=args.max_iterations,
+        )
+        results["scenarios"][scenario.name] = r
+        print(f"{scenario.name:<36} {r['iterations']:>7} {r['ops_per_sec']:>10.1f} {r['p50_us']:>11.1f} {r['p99_us']:>11.1f}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = find_regressions(results, baseline, args.max_regression)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        if regressions:
+            return 1
+        print(f"no regressions beyond {args.max_regression:.0%}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,8 @@
 from __future__ import annotations
 
-from dataclasses import asdict
-
 from .base_layer import BaseLayer
-from shield_orchestrator.v3.context_hash import compute_context_hash
+from shield_orchestrator.v3.canonical_request import CanonicalRequest
+from shield_orchestrator.v3.context_hash import compute_spliced_context_hash
 from shield_orchestrator.v3.contracts.envelope import OrchestratorV3Request, TraceEntry
 
 
@@ -18,20 +17,30 @@ class AdaptiveCoreBridge(BaseLayer):
     COMPONENT = "adaptive_core"
     STAGE = "adaptive_core"
 
-    def report_v3(self, request: OrchestratorV3Request, *, outcome: str, reason_ids: tuple[str, ...]) -> TraceEntry:
+    def report_v3(
+        self,
+        request: OrchestratorV3Request,
+        *,
+        outcome: str,
+        reason_ids: tuple[str, ...],
+        canonical: CanonicalRequest | None = None,
+    ) -> TraceEntry:
         """
         Produce a deterministic sink trace entry.
 
         IMPORTANT:
         This is a sink only. It does not change outcome/reason_ids.
         """
-        component_context_hash = compute_context_hash(
+        if canonical is None:
+            canonical = CanonicalRequest.from_request(request)
+
+        component_context_hash = compute_spliced_context_hash(
             {
                 "component": self.COMPONENT,
-                "request": asdict(request),
                 "outcome": outcome,
                 "reason_ids": list(reason_ids),
-            }
+            },
+            {"request": canonical.canonical},
         )
 
         return TraceEntry(
@@ -1,9 +1,8 @@
 from __future__ import annotations
 
-from dataclasses import asdict
-
 from .base_layer import BaseLayer
-from shield_orchestrator.v3.context_hash import compute_context_hash
+from shield_orchestrator.v3.canonical_request import CanonicalRequest
+from shield_orchestrator.v3.context_hash import compute_spliced_context_hash
 from shield_orchestrator.v3.contracts.envelope import OrchestratorV3Request, TraceEntry
 
 
@@ -23,17 +22,23 @@ class QWGBridge(BaseLayer):
     COMPONENT = "qwg"
     STAGE = "qwg"
 
-    def evaluate_v3(self, request: OrchestratorV3Request) -> TraceEntry:
+    def evaluate_v3(
+        self,
+        request: OrchestratorV3Request,
+        *,
+        canonical: CanonicalRequest | None = None,
+    ) -> TraceEntry:
         """
         Evaluate QWG for a v3 orchestrator request.
 
         Returns a deterministic TraceEntry suitable for aggregation.
         """
-        component_context_hash = compute_context_hash(
-            {
-                "component": self.COMPONENT,
-                "request": asdict(request),
-            }
+        if canonical is None:
+            canonical = CanonicalRequest.from_request(request)
+
+        component_context_hash = compute_spliced_context_hash(
+            {"component": self.COMPONENT},
+            {"request": canonical.canonical},
         )
 
         return TraceEntry(
@@ -10,6 +10,29 @@ here creates a circular import during test collection.
 
 Consumers should import directly:
     from shield_orchestrator.v3.orchestrate import orchestrate
+
+Entrypoints whose names do not collide with a submodule are also resolved
+lazily on first attribute access:
+    from shield_orchestrator.v3 import Orchestrator, orchestrate_async, orchestrate_many
 """
 
-__all__ = []
+from typing import Any
+
+_LAZY_EXPORTS = {
+    "Orchestrator": "shield_orchestrator.v3.orchestrate",
+    "default_orchestrator": "shield_orchestrator.v3.orchestrate",
+    "orchestrate_async": "shield_orchestrator.v3.orchestrate",
+    "orchestrate_many": "shield_orchestrator.v3.orchestrate",
+}
+
+__all__ = sorted(_LAZY_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+
+    return getattr(importlib.import_module(module_name), name)
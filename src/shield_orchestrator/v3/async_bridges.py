@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from typing import Any, Protocol, runtime_checkable
+
+from .canonical_request import CanonicalRequest
+from .contracts.envelope import OrchestratorV3Request, TraceEntry
+
+
+@runtime_checkable
+class AsyncComponentBridge(Protocol):
+    """
+    Async bridge protocol used by orchestrate_async().
+
+    Implementations evaluate one Shield v3 component and return its
+    deterministic TraceEntry. They may await network I/O; the orchestrator
+    runs all components concurrently and reassembles the trace in the
+    contract-fixed order.
+    """
+
+    COMPONENT: str
+    STAGE: str
+
+    async def evaluate_v3_async(
+        self,
+        request: OrchestratorV3Request,
+        *,
+        canonical: CanonicalRequest,
+    ) -> TraceEntry: ...
+
+
+class SyncBridgeAdapter:
+    """
+    Expose a synchronous bridge through AsyncComponentBridge.
+
+    The wrapped evaluate_v3() runs inline on the event loop; this is only
+    appropriate for CPU-trivial bridges such as the Phase 3 stubs.
+    """
+
+    def __init__(self, bridge: Any) -> None:
+        self.bridge = bridge
+        self.COMPONENT = bridge.COMPONENT
+        self.STAGE = bridge.STAGE
+
+    async def evaluate_v3_async(
+        self,
+        request: OrchestratorV3Request,
+        *,
+        canonical: CanonicalRequest,
+    ) -> TraceEntry:
+        return self.bridge.evaluate_v3(request, canonical=canonical)
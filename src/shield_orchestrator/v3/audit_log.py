@@ -0,0 +1,450 @@
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import queue
+import struct
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator
+
+from .canonical_json import to_canonical_bytes
+from .canonical_request import CanonicalRequest
+from .contracts.envelope import OrchestratorV3Request, OrchestratorV3Response
+
+# Record frame: body length, CRC32 of key + body, raw context_hash (key).
+RECORD_HEADER = struct.Struct(">II32s")
+# Index slot: raw context_hash, record offset + 1 (0 marks an empty slot).
+INDEX_SLOT = struct.Struct(">32sQ")
+
+_EMPTY_KEY = bytes(32)
+_STOP = object()
+
+
+@dataclass(frozen=True)
+class AuditStats:
+    """
+    Point-in-time audit log counters.
+    """
+    records: int
+    batches: int
+    dropped: int
+    segments: int
+    failed: int
+
+
+class _Segment:
+    """
+    One `<seq>.log` data file of record frames and its `<seq>.idx` hash
+    index (open addressing, linear probing) mapped with mmap.
+    """
+
+    def __init__(self, directory: str, seq: int, index_slots: int, *, writable: bool) -> None:
+        self.seq = seq
+        self.path = os.path.join(directory, f"{seq:012d}.log")
+        self.index_path = os.path.join(directory, f"{seq:012d}.idx")
+        self.slots = index_slots
+        self.records = 0
+
+        index_bytes = index_slots * INDEX_SLOT.size
+        rebuild = writable or not _has_size(self.index_path, index_bytes)
+        if rebuild:
+            with open(self.index_path, "wb") as f:
+                f.truncate(index_bytes)
+        self._index_fd = os.open(self.index_path, os.O_RDWR if rebuild else os.O_RDONLY)
+        self.index = mmap.mmap(
+            self._index_fd, index_bytes, access=mmap.ACCESS_WRITE if rebuild else mmap.ACCESS_READ
+        )
+
+        self.size = self._recover(rebuild) if os.path.exists(self.path) else 0
+        self._file = open(self.path, "ab") if writable else None
+        self._read_fd = os.open(self.path, os.O_RDONLY | os.O_CREAT, 0o644)
+
+    def _recover(self, rebuild: bool) -> int:
+        # Scan the frames, re-index them if needed and cut a torn tail (a
+        # crash in the middle of a group commit) at the last valid record.
+        offset = 0
+        with open(self.path, "rb") as f:
+            data = f.read()
+        while offset + RECORD_HEADER.size <= len(data):
+            length, crc, key = RECORD_HEADER.unpack_from(data, offset)
+            end = offset + RECORD_HEADER.size + length
+            if end > len(data) or zlib.crc32(data[offset + 8 : end]) != crc:
+                break
+            if rebuild:
+                self.insert(key, offset)
+            self.records += 1
+            offset = end
+        if offset < len(data):
+            with open(self.path, "r+b") as f:
+                f.truncate(offset)
+        return offset
+
+    def append(self, frames: list[bytes], *, fsync: bool) -> int:
+        """Write `frames` in one call; returns the offset of the first."""
+        offset = self.size
+        try:
+            if self._file is None:  # an earlier rollback could not reopen the file
+                self._discard_tail()
+            self._file.write(b"".join(frames))
+            self._file.flush()
+            if fsync:
+                os.fsync(self._file.fileno())
+        except OSError:
+            self._discard_tail()
+            raise
+        self.size += sum(map(len, frames))
+        self.records += len(frames)
+        return offset
+
+    def _discard_tail(self) -> None:
+        # A failed write (e.g. ENOSPC) may have left part of the batch on
+        # disk and the rest in the file buffer: drop both, so the next
+        # append lands at self.size again.
+        if self._file is not None:
+            try:
+                self._file.close()
+            except OSError:
+                pass
+            self._file = None
+        os.truncate(self.path, self.size)
+        self._file = open(self.path, "ab")
+
+    def insert(self, key: bytes, offset: int) -> None:
+        # The same context_hash again (a replayed request) points at the
+        # newest record.
+        for base in self._probe(key):
+            slot_key, _ = INDEX_SLOT.unpack_from(self.index, base)
+            if slot_key == key or slot_key == _EMPTY_KEY:
+                INDEX_SLOT.pack_into(self.index, base, key, offset + 1)
+                return
+        raise RuntimeError("audit index full")  # pragma: no cover - rotation keeps load <= 1/2
+
+    def lookup(self, key: bytes) -> int | None:
+        for base in self._probe(key):
+            slot_key, offset = INDEX_SLOT.unpack_from(self.index, base)
+            if offset == 0:
+                return None
+            if slot_key == key:
+                return offset - 1
+        return None  # pragma: no cover - the table always has empty slots
+
+    def _probe(self, key: bytes) -> Iterator[int]:
+        mask = self.slots - 1
+        i = int.from_bytes(key[:8], "big") & mask
+        for _ in range(self.slots):
+            yield i * INDEX_SLOT.size
+            i = (i + 1) & mask
+
+    def read(self, offset: int) -> bytes:
+        length, crc, key = RECORD_HEADER.unpack(os.pread(self._read_fd, RECORD_HEADER.size, offset))
+        body = os.pread(self._read_fd, length, offset + RECORD_HEADER.size)
+        if zlib.crc32(key + body) != crc:
+            raise ValueError(f"corrupt audit record at {self.path}:{offset}")
+        return body
+
+    def seal(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self.index.flush()
+
+    def close(self) -> None:
+        self.seal()
+        self.index.close()
+        os.close(self._index_fd)
+        os.close(self._read_fd)
+
+    def delete(self) -> None:
+        self.close()
+        os.remove(self.path)
+        os.remove(self.index_path)
+
+
+class AuditLog:
+    """
+    Append-only, segmented local audit log of v3 envelopes.
+
+    Each record is the canonical JSON of {"request": ..., "response": ...}:
+    the response envelope (to_hash_material()) and the request material its
+    context_hash covers (the full request on the success path, the request
+    with payload null for fail-closed responses).
+
+    - record() only enqueues; one writer thread encodes and group-commits
+      whatever has queued up as a single write (+ fsync) per batch, so the
+      request path never touches the disk or waits for it. A full queue
+      (the disk is not keeping up) drops the record and counts it in
+      stats().dropped; records the writer fails to write (e.g. disk full)
+      are counted in stats().failed, and the writer carries on.
+    - every segment has an mmap'd hash index, so get(context_hash) is one
+      probe per retained segment (newest first; latest record wins)
+    - a segment is rotated at `segment_bytes` or when its index is half
+      full; only the newest `max_segments` are kept, and segments older
+      than `retain_seconds` (if set) are deleted
+    - frames carry a CRC32; reopening a directory truncates a torn tail
+
+    Thread-safe. Use as a context manager, or call close(), which commits
+    everything recorded before it.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        *,
+        segment_bytes: int = 64 * 1024 * 1024,
+        index_slots: int = 1 << 16,
+        max_segments: int = 16,
+        retain_seconds: float | None = None,
+        batch_size: int = 512,
+        queue_size: int = 65536,
+        fsync: bool = True,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if index_slots <= 0 or index_slots & (index_slots - 1):
+            raise ValueError("index_slots must be a positive power of two")
+        if segment_bytes <= 0 or max_segments <= 0 or batch_size <= 0:
+            raise ValueError("segment_bytes, max_segments and batch_size must be positive")
+
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self._segment_bytes = segment_bytes
+        self._index_slots = index_slots
+        self._max_segments = max_segments
+        self._retain_seconds = retain_seconds
+        self._batch_size = batch_size
+        self._fsync = fsync
+        self._clock = clock
+
+        seqs = sorted(int(name[:-4]) for name in os.listdir(directory) if name.endswith(".log"))
+        self._segments = [_Segment(directory, seq, index_slots, writable=False) for seq in seqs[:-1]]
+        self._segments.append(_Segment(directory, seqs[-1] if seqs else 0, index_slots, writable=True))
+        self._sealed_at = {s.seq: os.stat(s.path).st_mtime for s in self._segments[:-1]}
+
+        self._lock = threading.Lock()  # segment list, index and counters
+        self._committed_cond = threading.Condition(self._lock)
+        self._queue: queue.Queue[Any] = queue.Queue(maxsize=queue_size)
+        self._submitted = 0
+        self._inflight = 0  # record() calls between the closed check and put()
+        self._committed = 0
+        self._failed = 0
+        self._batches = 0
+        self._dropped = 0
+        self._closed = False
+
+        with self._lock:
+            self._enforce_retention()
+        self._writer = threading.Thread(target=self._run, name="shield-audit-writer", daemon=True)
+        self._writer.start()
+
+    def record(
+        self,
+        request: OrchestratorV3Request,
+        response: OrchestratorV3Response,
+        canonical: CanonicalRequest | None = None,
+    ) -> None:
+        """
+        Queue one envelope (never blocks or raises). `canonical` is the request's
+        single encoding on the success path; without it, the request is
+        recorded with payload null, as fail-closed hashing does.
+        """
+        with self._lock:
+            if self._closed:
+                self._dropped += 1
+                return
+            self._submitted += 1
+            self._inflight += 1
+        try:
+            self._queue.put_nowait((request, response, None if canonical is None else canonical.canonical))
+        except queue.Full:
+            with self._lock:
+                self._submitted -= 1
+                self._dropped += 1
+        finally:
+            with self._committed_cond:
+                self._inflight -= 1
+                self._committed_cond.notify_all()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """
+        Wait until everything recorded so far is committed (or has failed;
+        see stats().failed).
+        """
+        with self._committed_cond:
+            target = self._submitted
+            return self._committed_cond.wait_for(lambda: self._committed + self._failed >= target, timeout)
+
+    def close(self) -> None:
+        with self._committed_cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._committed_cond.wait_for(lambda: self._inflight == 0)
+        self._queue.put(_STOP)
+        self._writer.join()
+        with self._lock:
+            for segment in self._segments:
+                segment.close()
+
+    def __enter__(self) -> AuditLog:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def get(self, context_hash: str) -> dict[str, Any] | None:
+        """Newest record whose response has this context_hash."""
+        body = self.read(context_hash)
+        return None if body is None else json.loads(body)
+
+    def read(self, context_hash: str) -> bytes | None:
+        """Canonical JSON of the newest record with this context_hash."""
+        key = _key(context_hash)
+        if key is None:
+            return None
+        with self._lock:
+            for segment in reversed(self._segments):
+                offset = segment.lookup(key)
+                if offset is not None:
+                    return segment.read(offset)
+        return None
+
+    def records(self) -> Iterator[dict[str, Any]]:
+        """All retained committed records, oldest first."""
+        with self._lock:
+            segments = [(s, s.size) for s in self._segments]
+        for segment, size in segments:
+            offset = 0
+            while offset < size:
+                with self._lock:
+                    if segment not in self._segments:
+                        break  # removed by retention meanwhile
+                    body = segment.read(offset)
+                yield json.loads(body)
+                offset += RECORD_HEADER.size + len(body)
+
+    def stats(self) -> AuditStats:
+        with self._lock:
+            return AuditStats(
+                records=self._committed,
+                batches=self._batches,
+                dropped=self._dropped,
+                segments=len(self._segments),
+                failed=self._failed,
+            )
+
+    def _run(self) -> None:
+        stop = False
+        while not stop:
+            batch = [self._queue.get()]
+            while len(batch) < self._batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            if batch[-1] is _STOP:
+                batch.pop()
+                stop = True
+            if batch:
+                self._commit(batch)
+
+    def _commit(self, batch: list[tuple[Any, ...]]) -> None:
+        # A failure (disk full, I/O error, unencodable record) fails the
+        # rest of the batch; the writer thread itself keeps running.
+        written = 0
+        try:
+            frames: list[bytes] = []
+            keys: list[bytes | None] = []
+            pending = 0
+            for item in batch:
+                frame, key = _frame(*item)
+                active = self._segments[-1]
+                if (frames or active.records) and (
+                    active.size + pending + len(frame) > self._segment_bytes
+                    or active.records + len(frames) >= self._index_slots // 2
+                ):
+                    written += self._write(frames, keys)
+                    frames, keys, pending = [], [], 0
+                    self._rotate()
+                frames.append(frame)
+                keys.append(key)
+                pending += len(frame)
+            written += self._write(frames, keys)
+        except Exception:
+            pass
+
+        with self._committed_cond:
+            self._committed += written
+            self._failed += len(batch) - written
+            self._batches += 1
+            self._enforce_retention()
+            self._committed_cond.notify_all()
+
+    def _write(self, frames: list[bytes], keys: list[bytes | None]) -> int:
+        if not frames:
+            return 0
+        active = self._segments[-1]
+        offset = active.append(frames, fsync=self._fsync)
+        # Records become visible to get() only once they are on disk.
+        with self._lock:
+            for frame, key in zip(frames, keys):
+                if key is not None:
+                    active.insert(key, offset)
+                offset += len(frame)
+        return len(frames)
+
+    def _rotate(self) -> None:
+        with self._lock:
+            active = self._segments[-1]
+            # Open the next segment first: if that fails, `active` stays writable.
+            successor = _Segment(self.directory, active.seq + 1, self._index_slots, writable=True)
+            active.seal()
+            self._sealed_at[active.seq] = self._clock()
+            self._segments.append(successor)
+            self._enforce_retention()
+
+    def _enforce_retention(self) -> None:
+        # Caller holds self._lock. The active segment is never removed.
+        expired_before = None if self._retain_seconds is None else self._clock() - self._retain_seconds
+        while len(self._segments) > 1 and (
+            len(self._segments) > self._max_segments
+            or (expired_before is not None and self._sealed_at[self._segments[0].seq] < expired_before)
+        ):
+            oldest = self._segments.pop(0)
+            del self._sealed_at[oldest.seq]
+            oldest.delete()
+
+
+def _frame(
+    request: OrchestratorV3Request, response: OrchestratorV3Response, canonical: bytes | None
+) -> tuple[bytes, bytes | None]:
+    if canonical is None:
+        material = request.to_hash_material()
+        material["payload"] = None
+        try:
+            canonical = to_canonical_bytes(material)
+        except (TypeError, ValueError, RecursionError):
+            canonical = b"null"
+    # Keys sorted: "request" < "response"; equal to canonical JSON of the dict.
+    body = b'{"request":' + canonical + b',"response":' + to_canonical_bytes(response.to_hash_material()) + b"}"
+
+    key = _key(response.context_hash)
+    header = RECORD_HEADER.pack(len(body), zlib.crc32((key or _EMPTY_KEY) + body), key or _EMPTY_KEY)
+    return header + body, key
+
+
+def _key(context_hash: str) -> bytes | None:
+    try:
+        key = bytes.fromhex(context_hash)
+    except (TypeError, ValueError):
+        return None
+    return key if len(key) == 32 and key != _EMPTY_KEY else None
+
+
+def _has_size(path: str, size: int) -> bool:
+    try:
+        return os.path.getsize(path) == size
+    except OSError:
+        return False
@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Sequence
+
+from .canonical_request import CanonicalRequest
+from .contracts.envelope import OrchestratorV3Request, TraceEntry
+from .contracts.reason_ids import ReasonId
+from .deadlines import Clock
+from .instrumentation import StageObserver, notify
+
+
+class CircuitBreaker:
+    """
+    Closed / open / half-open circuit breaker for one component.
+
+    - closed: calls go through; `failure_threshold` consecutive failures
+      open the breaker. A call slower than `latency_threshold_seconds`
+      (when set) counts as a failure even though its result is used.
+    - open: calls are rejected without being made for `reset_seconds`.
+    - half_open: up to `half_open_calls` trial calls go through; one
+      success closes the breaker, one failure re-opens it.
+
+    Thread-safe. State changes are reported to the observer.
+    """
+
+    def __init__(
+        self,
+        component: str,
+        *,
+        failure_threshold: int = 5,
+        latency_threshold_seconds: float | None = None,
+        reset_seconds: float = 30.0,
+        half_open_calls: int = 1,
+        observer: StageObserver | None = None,
+        clock: Clock = time.monotonic,
+    ) -> None:
+        if failure_threshold <= 0 or half_open_calls <= 0:
+            raise ValueError("failure_threshold and half_open_calls must be positive")
+        self.component = component
+        self.failure_threshold = failure_threshold
+        self.latency_threshold_seconds = latency_threshold_seconds
+        self.reset_seconds = reset_seconds
+        self.half_open_calls = half_open_calls
+        self._observer = observer
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._state = "closed"
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trials = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == "open" and self._clock() - self._opened_at >= self.reset_seconds:
+                return "half_open"
+            return self._state
+
+    def allow(self) -> bool:
+        """Reserve a call; False means reject it without calling the component."""
+        with self._lock:
+            if self._state == "open":
+                if self._clock() - self._opened_at < self.reset_seconds:
+                    return False
+                self._transition("half_open")
+            if self._state == "half_open":
+                if self._trials >= self.half_open_calls:
+                    return False
+                self._trials += 1
+            return True
+
+    def record(self, *, ok: bool, latency_seconds: float) -> None:
+        """Record the outcome of a call previously admitted by allow()."""
+        threshold = self.latency_threshold_seconds
+        failed = not ok or (threshold is not None and latency_seconds > threshold)
+        with self._lock:
+            if not failed:
+                self._failures = 0
+                if self._state == "half_open":
+                    self._transition("closed")
+                return
+
+            self._failures += 1
+            if self._state == "half_open" or self._failures >= self.failure_threshold:
+                self._opened_at = self._clock()
+                self._transition("open")
+
+    def _transition(self, state: str) -> None:
+        # Caller holds the lock. Every state starts with fresh counters.
+        self._failures = 0
+        self._trials = 0
+        if state != self._state:
+            self._state = state
+            notify(self._observer, "on_breaker_state", self.component, state)
+
+
+class Bulkhead:
+    """
+    Concurrency limit for one component: at most `max_concurrent` calls in
+    flight. Excess calls are rejected immediately instead of queueing, so a
+    degraded component cannot absorb every worker.
+    """
+
+    def __init__(self, max_concurrent: int) -> None:
+        if max_concurrent <= 0:
+            raise ValueError("max_concurrent must be positive")
+        self.max_concurrent = max_concurrent
+        self._slots = threading.BoundedSemaphore(max_concurrent)
+
+    def try_acquire(self) -> bool:
+        return self._slots.acquire(blocking=False)
+
+    def release(self) -> None:
+        self._slots.release()
+
+
+class GuardedBridge:
+    """
+    Wrap a component bridge with an optional circuit breaker and bulkhead.
+
+    A rejected call never reaches the bridge and yields a deterministic
+    COMPONENT_UNAVAILABLE entry (outcome DENY). Bridge exceptions and ERROR
+    entries count as breaker failures; exceptions propagate unchanged.
+    Lifecycle hooks are forwarded to the wrapped bridge.
+    """
+
+    def __init__(
+        self,
+        bridge: Any,
+        *,
+        breaker: CircuitBreaker | None = None,
+        bulkhead: Bulkhead | None = None,
+        observer: StageObserver | None = None,
+        clock: Clock = time.perf_counter,
+    ) -> None:
+        self.bridge = bridge
+        self.COMPONENT = bridge.COMPONENT
+        self.STAGE = bridge.STAGE
+        self.breaker = breaker
+        self.bulkhead = bulkhead
+        self._observer = observer
+        self._clock = clock
+
+    def warm_up(self) -> None:
+        hook = getattr(self.bridge, "warm_up", None)
+        if callable(hook):
+            hook()
+
+    def close(self) -> None:
+        hook = getattr(self.bridge, "close", None)
+        if callable(hook):
+            hook()
+
+    def evaluate_v3(
+        self,
+        request: OrchestratorV3Request,
+        *,
+        canonical: CanonicalRequest | None = None,
+    ) -> TraceEntry:
+        if self.bulkhead is not None and not self.bulkhead.try_acquire():
+            return self._reject("bulkhead_full")
+        try:
+            if self.breaker is not None and not self.breaker.allow():
+                return self._reject("circuit_open")
+
+            started = self._clock()
+            ok = False
+            try:
+                entry = self.bridge.evaluate_v3(request, canonical=canonical)
+                ok = entry.status != "ERROR"
+                return entry
+            finally:
+                if self.breaker is not None:
+                    self.breaker.record(ok=ok, latency_seconds=self._clock() - started)
+        finally:
+            if self.bulkhead is not None:
+                self.bulkhead.release()
+
+    def _reject(self, notes: str) -> TraceEntry:
+        notify(self._observer, "on_component_rejected", self.COMPONENT, notes)
+        return unavailable_entry(self, notes)
+
+
+def unavailable_entry(bridge: Any, notes: str) -> TraceEntry:
+    """
+    Deterministic trace entry for a component rejected without being called.
+    """
+    return TraceEntry(
+        stage=bridge.STAGE,
+        component=bridge.COMPONENT,
+        status="ERROR",
+        reason_ids=(ReasonId.COMPONENT_UNAVAILABLE.value,),
+        notes=notes,
+    )
+
+
+def guard_bridges(
+    bridges: Sequence[Any],
+    *,
+    failure_threshold: int = 5,
+    latency_threshold_seconds: float | None = None,
+    reset_seconds: float = 30.0,
+    half_open_calls: int = 1,
+    max_concurrent: int | None = None,
+    observer: StageObserver | None = None,
+) -> tuple[GuardedBridge, ...]:
+    """
+    Give every bridge its own breaker (and bulkhead when max_concurrent is
+    set), with the same thresholds. The result keeps the input order and
+    can be passed to Orchestrator(bridges=...).
+    """
+    return tuple(
+        GuardedBridge(
+            bridge,
+            breaker=CircuitBreaker(
+                bridge.COMPONENT,
+                failure_threshold=failure_threshold,
+                latency_threshold_seconds=latency_threshold_seconds,
+                reset_seconds=reset_seconds,
+                half_open_calls=half_open_calls,
+                observer=observer,
+            ),
+            bulkhead=Bulkhead(max_concurrent) if max_concurrent is not None else None,
+            observer=observer,
+        )
+        for bridge in bridges
+    )
@@ -1,7 +1,302 @@
+"""
+Canonical JSON encoding for hashing and audit.
+
+Canonicalization rules (identical output on every backend):
+
+- top level: any value below; output is UTF-8, no whitespace, separators
+  "," and ":"
+- objects: dict; keys MUST be str (TypeError otherwise) and are emitted
+  sorted by code point
+- arrays: list or tuple, in order
+- strings: emitted as UTF-8, not \\u-escaped, except '"', '\\' and control
+  characters below U+0020 (\\n \\r \\t \\b \\f, others as lowercase \\u00xx);
+  lone surrogates cannot be encoded to UTF-8 and are rejected
+- integers: decimal, within [-2**63, 2**64 - 1] (ValueError otherwise);
+  bool is true / false
+- floats: finite only (NaN and +/-Infinity raise ValueError, so they can
+  never collide with null); shortest round-trip form of float.__repr__,
+  e.g. 1.0, 0.1, 1e-05, 1e+16
+- None is null; any other type raises TypeError
+
+The reference encoder is the stdlib C encoder (json.JSONEncoder). When
+orjson is installed it is used for documents it formats identically;
+documents holding exponent-form floats or subclasses of the supported
+types always go through the reference encoder, as do documents orjson
+refuses (it stops at 255 levels of nesting, below the default max_depth).
+
+Untrusted documents are checked against CanonicalLimits (size, depth and
+key count) in the same single pass that enforces the rules above, so an
+oversized or deeply nested payload is rejected before anything is encoded.
+"""
+
 from __future__ import annotations
 
 import json
-from typing import Any
+from dataclasses import dataclass
+from typing import Any, Iterator
+
+try:  # optional C-accelerated backend
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    _orjson = None
+
+BACKEND = "orjson" if _orjson is not None else "json"
+
+# Reference encoder; shared because json.dumps() would build one per call.
+_ENCODER = json.JSONEncoder(
+    sort_keys=True,
+    separators=(",", ":"),
+    ensure_ascii=False,
+    allow_nan=False,
+)
+
+_INT_MIN = -(1 << 63)
+_INT_MAX = (1 << 64) - 1
+_INFINITIES = (float("inf"), float("-inf"))
+
+
+@dataclass(frozen=True)
+class CanonicalLimits:
+    """
+    Bounds on an untrusted document, enforced by check_canonical().
+
+    - max_bytes: size of the canonical encoding, in bytes
+    - max_depth: container nesting; a top-level container is depth 1
+    - max_keys: object keys across the whole document
+
+    The defaults admit every workload in benchmarks/ and reject documents
+    built to make hashing and bridge evaluation disproportionately expensive.
+    """
+    max_bytes: int = 16 * 1024 * 1024
+    max_depth: int = 256
+    max_keys: int = 1_000_000
+
+
+DEFAULT_LIMITS = CanonicalLimits()
+
+
+class LimitExceeded(ValueError):
+    """A document exceeded its CanonicalLimits."""
+
+
+def check_canonical(obj: Any, limits: CanonicalLimits | None = None) -> bool:
+    """
+    Enforce the canonicalization rules on `obj` (TypeError / ValueError on
+    violation; RecursionError on cycles or extreme nesting).
+
+    With `limits`, the same pass also enforces them and stops at the first
+    violation (LimitExceeded); a cycle is then reported as ValueError.
+    The byte budget is checked against a lower bound of the encoded size
+    (exact for ASCII); callers holding the encoding check it exactly with
+    check_encoded_size().
+
+    Returns True if `obj` must be formatted by the reference encoder.
+    """
+    if limits is not None:
+        return _BoundedCheck(limits).check(obj)
+
+    t = type(obj)
+    if t is dict:
+        for key in obj:
+            if type(key) is not str:
+                return _check_non_str_keys(obj)
+        values: Any = obj.values()
+    elif t is list or t is tuple:
+        values = obj
+    else:
+        return _check_scalar(obj)
+
+    # Hot loop: scalars are checked inline, only containers recurse.
+    fallback = False
+    for value in values:
+        tv = type(value)
+        if tv is str or tv is bool or value is None:
+            continue
+        if tv is int:
+            if _INT_MIN <= value <= _INT_MAX:
+                continue
+        elif tv is float:
+            if _check_float(value):
+                fallback = True
+            continue
+        if check_canonical(value):
+            fallback = True
+    return fallback
+
+
+def _check_non_str_keys(obj: dict) -> bool:
+    # A dict with a non-str key: str subclasses are allowed (reference
+    # encoder only), anything else violates the key rule.
+    for key in obj:
+        if not isinstance(key, str):
+            raise TypeError(f"keys must be str, not {type(key).__name__}")
+    check_canonical(list(obj.values()))
+    return True
+
+
+def _check_scalar(obj: Any) -> bool:
+    t = type(obj)
+    if t is str or t is bool or obj is None:
+        return False
+    if t is int:
+        _check_int(obj)
+        return False
+    if t is float:
+        return _check_float(obj)
+
+    # Subclasses are validated like their base type and always use the
+    # reference encoder (bool is handled above).
+    if isinstance(obj, str):
+        return True
+    if isinstance(obj, int):
+        _check_int(int(obj))
+        return True
+    if isinstance(obj, float):
+        _check_float(float(obj))
+        return True
+    if isinstance(obj, (dict, list, tuple)):
+        check_canonical(dict(obj) if isinstance(obj, dict) else list(obj))
+        return True
+    raise TypeError(f"Object of type {t.__name__} is not canonically encodable")
+
+
+def _check_int(value: int) -> None:
+    if not _INT_MIN <= value <= _INT_MAX:
+        raise ValueError("integer out of canonical range")
+
+
+def _check_float(value: float) -> bool:
+    if value != value or value in _INFINITIES:
+        raise ValueError("non-finite float")
+    # float.__repr__ switches to exponent form outside [1e-4, 1e16).
+    return value != 0.0 and not 1e-4 <= abs(value) < 1e16
+
+
+class _BoundedCheck:
+    """
+    check_canonical() with a budget: depth, keys and an encoded-size lower
+    bound are counted during the walk, which is abandoned as soon as any of
+    them is exceeded. Recursion is bounded by max_depth.
+    """
+
+    __slots__ = ("max_depth", "keys_left", "bytes_left", "path")
+
+    def __init__(self, limits: CanonicalLimits) -> None:
+        self.max_depth = limits.max_depth
+        self.keys_left = limits.max_keys
+        self.bytes_left = limits.max_bytes
+        self.path: list[int] = []  # ids of the containers being walked
+
+    def check(self, obj: Any) -> bool:
+        t = type(obj)
+        if t is dict or t is list or t is tuple:
+            return self._container(obj)
+        return self._other(obj)
+
+    def _other(self, obj: Any) -> bool:
+        # Anything the hot loop in _container() does not handle inline.
+        if isinstance(obj, (dict, list, tuple)):
+            self._container(obj)
+            return True
+        if isinstance(obj, str):
+            self._spend(len(obj) + 2)
+            return type(obj) is not str
+        self._spend(1)
+        return _check_scalar(obj)
+
+    def _spend(self, size: int) -> None:
+        self.bytes_left -= size
+        if self.bytes_left < 0:
+            raise LimitExceeded("document exceeds max_bytes")
+
+    def _container(self, obj: Any) -> bool:
+        path = self.path
+        if len(path) >= self.max_depth:
+            if id(obj) in path:
+                raise ValueError("circular reference")
+            raise LimitExceeded("document exceeds max_depth")
+
+        fallback = False
+        size = 1 + (len(obj) or 1)  # brackets and separators
+        if isinstance(obj, dict):
+            self.keys_left -= len(obj)
+            if self.keys_left < 0:
+                raise LimitExceeded("document exceeds max_keys")
+            for key in obj:
+                if type(key) is not str:
+                    if not isinstance(key, str):
+                        raise TypeError(f"keys must be str, not {type(key).__name__}")
+                    fallback = True
+            size += sum(map(len, obj)) + 3 * len(obj)  # quotes and colons
+            values: Any = obj.values()
+        else:
+            values = obj
+        self._spend(size)
+
+        # Hot loop as in check_canonical(), with the byte budget in a local.
+        path.append(id(obj))
+        budget = self.bytes_left
+        for value in values:
+            tv = type(value)
+            if tv is str:
+                budget -= len(value) + 2
+                if budget >= 0:
+                    continue
+                raise LimitExceeded("document exceeds max_bytes")
+            if tv is bool or value is None:
+                budget -= 1
+                continue
+            if tv is int:
+                if _INT_MIN <= value <= _INT_MAX:
+                    budget -= 1
+                    continue
+            elif tv is float:
+                if _check_float(value):
+                    fallback = True
+                budget -= 1
+                continue
+
+            self.bytes_left = budget
+            if tv is dict or tv is list or tv is tuple:
+                if self._container(value):
+                    fallback = True
+            elif self._other(value):
+                fallback = True
+            budget = self.bytes_left
+        path.pop()
+
+        self.bytes_left = budget
+        if budget < 0:
+            raise LimitExceeded("document exceeds max_bytes")
+        return fallback
+
+
+def check_encoded_size(encoded: bytes, limits: CanonicalLimits) -> None:
+    """Exact max_bytes check of an encoding (LimitExceeded if too large)."""
+    if len(encoded) > limits.max_bytes:
+        raise LimitExceeded("document exceeds max_bytes")
+
+
+def to_canonical_bytes(obj: Any, limits: CanonicalLimits | None = None) -> bytes:
+    """
+    Canonical JSON of `obj` as UTF-8 bytes (the form every hash consumes).
+
+    With `limits`, `obj` is checked against them in the rule-checking pass
+    (LimitExceeded, before anything is encoded) and the encoding size is
+    then checked exactly.
+    """
+    if check_canonical(obj, limits) or _orjson is None:
+        encoded = _ENCODER.encode(obj).encode("utf-8")
+    else:
+        try:
+            encoded = _orjson.dumps(obj, option=_orjson.OPT_SORT_KEYS)
+        except _orjson.JSONEncodeError:
+            # Beyond orjson's nesting limit (or a lone surrogate): the
+            # reference encoder either encodes it or raises the rule error.
+            encoded = _ENCODER.encode(obj).encode("utf-8")
+    if limits is not None:
+        check_encoded_size(encoded, limits)
+    return encoded
 
 
 def to_canonical_json(obj: Any) -> str:
@@ -13,10 +308,18 @@ def to_canonical_json(obj: Any) -> str:
     - keys sorted
     - stable separators (no whitespace variance)
     - no reliance on insertion order
+    - see the module docstring for value rules
+    """
+    check_canonical(obj)
+    return _ENCODER.encode(obj)
+
+
+def iter_canonical_json(obj: Any) -> Iterator[str]:
+    """
+    Stream canonical JSON as string chunks.
+
+    "".join(iter_canonical_json(obj)) == to_canonical_json(obj) for every
+    input; the full document is never materialized.
     """
-    return json.dumps(
-        obj,
-        sort_keys=True,
-        separators=(",", ":"),
-        ensure_ascii=False,
-    )
+    check_canonical(obj)
+    return _ENCODER.iterencode(obj)
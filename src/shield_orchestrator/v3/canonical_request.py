@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+import weakref
+from collections import deque
+from dataclasses import dataclass
+
+from .canonical_json import CanonicalLimits, to_canonical_bytes
+from .contracts.envelope import OrchestratorV3Request
+
+
+@dataclass(frozen=True)
+class CanonicalRequest:
+    """
+    Request envelope serialized exactly once per orchestration.
+
+    - `canonical` is the UTF-8 canonical JSON of the full request (payload included)
+    - `digest` is the SHA-256 hex of `canonical`
+
+    Bridges and the final context_hash splice `canonical` into their hash
+    material instead of re-encoding the request, so every hash stays
+    byte-identical to hashing {"request": asdict(request), ...} directly.
+    """
+    request: OrchestratorV3Request
+    canonical: bytes
+    digest: str
+
+    @classmethod
+    def from_request(
+        cls, request: OrchestratorV3Request, limits: CanonicalLimits | None = None
+    ) -> "CanonicalRequest":
+        """
+        Serialize the request once.
+
+        Raises TypeError/ValueError if the payload is not canonically encodable;
+        callers map this to HASHING_FAILED. With `limits`, the request (the
+        envelope object is depth 1, its payload depth 2) is checked against
+        them first and LimitExceeded is raised; callers map it to INVALID_REQUEST.
+        """
+        canonical = to_canonical_bytes(request.to_hash_material(), limits)
+        return cls(
+            request=request,
+            canonical=canonical,
+            digest=hashlib.sha256(canonical).hexdigest(),
+        )
+
+    @classmethod
+    def memoized(
+        cls, request: OrchestratorV3Request, limits: CanonicalLimits | None = None
+    ) -> "CanonicalRequest":
+        """
+        Like from_request(), but the encoding is cached per request object
+        (keyed by identity, dropped when the request is garbage collected),
+        so hashing the same request object again costs no re-encoding.
+
+        Opt-in: the request is frozen but its payload dict is not, so this is
+        only correct when payloads are never mutated after first use. A
+        cached encoding is only reused under the limits it was checked with.
+        """
+        key = id(request)
+        with _MEMO_LOCK:
+            _drain_dead()
+            hit = _MEMO.get(key)
+        if hit is not None and hit[0]() is request and (limits is None or hit[3] == limits):
+            return cls(request=request, canonical=hit[1], digest=hit[2])
+
+        canonical = cls.from_request(request, limits)
+        ref = weakref.ref(request, lambda _, key=key: _DEAD.append(key))
+        with _MEMO_LOCK:
+            _MEMO[key] = (ref, canonical.canonical, canonical.digest, limits)
+        return canonical
+
+
+# id(request) -> (weakref to the request, canonical bytes, digest, limits it
+# was checked with). Only bytes are held, never the request itself, so
+# entries cannot keep it alive.
+# Weakref callbacks may run inside the GC at any point, so they only queue
+# the dead key (deque.append is atomic); the queue is drained under the lock.
+_MEMO: dict[int, tuple[weakref.ref, bytes, str, CanonicalLimits | None]] = {}
+_MEMO_LOCK = threading.Lock()
+_DEAD: deque[int] = deque()
+
+
+def memo_size() -> int:
+    """Number of live memoized request encodings."""
+    with _MEMO_LOCK:
+        _drain_dead()
+        return len(_MEMO)
+
+
+def _drain_dead() -> None:
+    # Caller holds _MEMO_LOCK.
+    while _DEAD:
+        _MEMO.pop(_DEAD.popleft(), None)
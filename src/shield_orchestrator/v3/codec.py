@@ -0,0 +1,378 @@
+"""
+Compact binary encoding of v3 request / response envelopes.
+
+Layout (all integers are unsigned LEB128 varints of at most 10 bytes,
+i.e. 64 bits, unless noted):
+
+    header   b"SQ" | codec version (1 byte) | kind (1 byte: 1 request, 2 response)
+
+    request  contract_version (zigzag) | wallet_id | action | nonce
+             | ttl_seconds (zigzag) | payload length | payload
+    response contract_version (zigzag) | context_hash | outcome
+             | reason_ids | trace entry count | trace entries | merkle_root
+    entry    shape length | shape | component_context_hash
+    shape    stage | component | status | reason_ids | notes
+    reason_ids  count | text...
+
+Every text field starts with a one-byte tag:
+
+    0        None
+    1        literal: byte length, UTF-8 bytes
+    2        64-char lowercase hex digest, as its 32 raw bytes
+    3 + i    STRING_TABLE[i]
+
+STRING_TABLE interns the stage, component, status, outcome, reason id and
+notes strings the orchestrator emits, so a typical trace entry is a few
+tag bytes plus its digest. The table is wire format: its entries are
+literals (never derived from ReasonId or other registries, whose order may
+change), and any change to it, appending included, requires a new
+CODEC_VERSION. Strings missing from it (e.g. a newly registered reason id)
+travel as literals. The payload is its canonical JSON, length-prefixed.
+
+Everything in a trace entry except its digest forms the entry's "shape".
+A process sees few distinct shapes, so both directions memoize them (up to
+MAX_SHAPES): encoding a known shape is one dict lookup, and decoding one
+reuses its decoded strings.
+
+Encoding is deterministic (one byte string per envelope) and lossless:
+decode(encode(x)) == x, so context_hash (and merkle_root) are preserved
+exactly. Decoding reads straight from a memoryview over the input; only
+the decoded strings, the shape keys and the payload are materialized.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+from .canonical_json import to_canonical_bytes
+from .contracts.envelope import OrchestratorV3Request, OrchestratorV3Response, TraceEntry
+
+MAGIC = b"SQ"
+CODEC_VERSION = 1
+KIND_REQUEST = 1
+KIND_RESPONSE = 2
+MAX_SHAPES = 4096
+
+STRING_TABLE: tuple[str, ...] = (
+    # trace stages and components
+    "input_validation",
+    "orchestrator",
+    "sentinel_ai",
+    "dqsn",
+    "adn",
+    "guardian_wallet",
+    "qwg",
+    "final_synthesis",
+    "adaptive_core",
+    "fail_closed",
+    "internal_error",
+    # trace statuses and outcomes
+    "OK",
+    "DENY",
+    "ERROR",
+    "SKIPPED",
+    "ALLOW",
+    "ESCALATE",
+    # reason ids, as registered at CODEC_VERSION 1
+    "INVALID_CONTRACT_VERSION",
+    "INVALID_REQUEST",
+    "NONCE_REPLAY",
+    "HASHING_FAILED",
+    "COMPONENT_ERROR",
+    "COMPONENT_INVALID_RESPONSE",
+    "COMPONENT_MISSING",
+    "COMPONENT_TIMEOUT",
+    "COMPONENT_UNAVAILABLE",
+    "DENY_BY_POLICY",
+    "INTERNAL_ERROR",
+    # notes
+    "phase3_bridge_stub",
+    "phase3_sink_stub",
+    "phase3_sink_failed",
+    "deadline_exceeded",
+    "short_circuit",
+    "tva_error",
+    "bulkhead_full",
+    "circuit_open",
+)
+
+_TAG_NONE = 0
+_TAG_LITERAL = 1
+_TAG_DIGEST = 2
+_TAG_TABLE = 3
+
+_HEADER_REQUEST = MAGIC + bytes((CODEC_VERSION, KIND_REQUEST))
+_HEADER_RESPONSE = MAGIC + bytes((CODEC_VERSION, KIND_RESPONSE))
+_INTERNED = {s: bytes((_TAG_TABLE + i,)) for i, s in enumerate(STRING_TABLE)}
+_DECODE_TABLE = (None, None, None, *STRING_TABLE)
+_HEX_DIGITS = frozenset("0123456789abcdef")
+_NONE = bytes((_TAG_NONE,))
+_DIGEST = bytes((_TAG_DIGEST,))
+
+# Memoized trace entry shapes: fields -> encoded shape, encoded shape -> fields.
+_ENCODED_SHAPES: dict[tuple[Any, ...], bytes] = {}
+_DECODED_SHAPES: dict[bytes, tuple[tuple[Any, ...], TraceEntry]] = {}
+
+assert len(STRING_TABLE) == len(set(STRING_TABLE)) and _TAG_TABLE + len(STRING_TABLE) <= 256
+
+
+class CodecError(ValueError):
+    """The envelope cannot be encoded, or the input is not a valid encoding."""
+
+
+def encode_request(request: OrchestratorV3Request) -> bytes:
+    """
+    Binary encoding of a request. The payload must be canonical-JSON data
+    and the integer fields 64-bit ints (CodecError otherwise; send such requests
+    as JSON so the orchestrator can fail them closed).
+    """
+    try:
+        payload = to_canonical_bytes(request.payload)
+    except (TypeError, ValueError, RecursionError) as e:
+        raise CodecError(f"payload is not canonical JSON data: {e}") from e
+
+    out = bytearray(_HEADER_REQUEST)
+    _put_int(out, request.contract_version)
+    _put_text(out, request.wallet_id)
+    _put_text(out, request.action)
+    _put_text(out, request.nonce)
+    _put_int(out, request.ttl_seconds)
+    _put_varint(out, len(payload))
+    out += payload
+    return bytes(out)
+
+
+def decode_request(data: bytes | bytearray | memoryview) -> OrchestratorV3Request:
+    view = memoryview(data)
+    pos = _check_header(view, KIND_REQUEST)
+    try:
+        contract_version, pos = _get_int(view, pos)
+        wallet_id, pos = _get_text(view, pos)
+        action, pos = _get_text(view, pos)
+        nonce, pos = _get_text(view, pos)
+        ttl_seconds, pos = _get_int(view, pos)
+        size, pos = _get_varint(view, pos)
+        end = pos + size
+        if end != len(view):
+            raise CodecError("payload length does not match the input")
+        payload = json.loads(str(view[pos:end], "utf-8"))
+    except (IndexError, UnicodeDecodeError, RecursionError, json.JSONDecodeError) as e:
+        raise CodecError(f"malformed request encoding: {e}") from e
+
+    return OrchestratorV3Request(
+        contract_version=contract_version,
+        wallet_id=wallet_id,
+        action=action,
+        nonce=nonce,
+        ttl_seconds=ttl_seconds,
+        payload=payload,
+    )
+
+
+def encode_response(response: OrchestratorV3Response) -> bytes:
+    out = bytearray(_HEADER_RESPONSE)
+    _put_int(out, response.contract_version)
+    _put_text(out, response.context_hash)
+    _put_text(out, response.outcome)
+    _put_texts(out, response.reason_ids)
+    _put_varint(out, len(response.trace))
+    for entry in response.trace:
+        out += _encode_shape(entry)
+        _put_text(out, entry.component_context_hash)
+    _put_text(out, response.merkle_root)
+    return bytes(out)
+
+
+def decode_response(data: bytes | bytearray | memoryview) -> OrchestratorV3Response:
+    view = memoryview(data)
+    pos = _check_header(view, KIND_RESPONSE)
+    try:
+        contract_version, pos = _get_int(view, pos)
+        context_hash, pos = _get_text(view, pos)
+        outcome, pos = _get_text(view, pos)
+        reason_ids, pos = _get_texts(view, pos)
+        count, pos = _get_varint(view, pos)
+        trace = []
+        for _ in range(count):
+            size = view[pos]
+            if size < 0x80:
+                pos += 1
+            else:
+                size, pos = _get_varint(view, pos)
+            end = pos + size
+            if end > len(view):
+                raise IndexError("truncated trace entry")
+            fields, without_digest = _decode_shape(view[pos:end].tobytes())
+            tag = view[end]
+            if tag == _TAG_DIGEST and end + 33 <= len(view):
+                pos = end + 33
+                trace.append(TraceEntry(*fields[:4], view[end + 1:pos].hex(), fields[4]))
+            elif tag == _TAG_NONE:
+                pos = end + 1
+                trace.append(without_digest)
+            else:
+                component_context_hash, pos = _get_text(view, end)
+                trace.append(TraceEntry(*fields[:4], component_context_hash, fields[4]))
+        merkle_root, pos = _get_text(view, pos)
+    except (IndexError, UnicodeDecodeError) as e:
+        raise CodecError(f"malformed response encoding: {e}") from e
+    if pos != len(view):
+        raise CodecError("trailing bytes after response")
+
+    return OrchestratorV3Response(
+        contract_version=contract_version,
+        context_hash=context_hash,
+        outcome=outcome,
+        reason_ids=reason_ids,
+        trace=tuple(trace),
+        merkle_root=merkle_root,
+    )
+
+
+def is_binary(data: bytes | bytearray | memoryview) -> bool:
+    """True if `data` starts like a binary envelope (JSON starts with '{')."""
+    return bytes(data[:2]) == MAGIC
+
+
+def _check_header(view: memoryview, kind: int) -> int:
+    if len(view) < 4 or view[:2] != MAGIC:
+        raise CodecError("not a binary envelope")
+    if view[2] != CODEC_VERSION:
+        raise CodecError(f"unsupported codec version {view[2]}")
+    if view[3] != kind:
+        raise CodecError("unexpected envelope kind")
+    return 4
+
+
+def _encode_shape(entry: TraceEntry) -> bytes:
+    key = (entry.stage, entry.component, entry.status, entry.reason_ids, entry.notes)
+    try:
+        shape = _ENCODED_SHAPES.get(key)
+    except TypeError:  # unhashable field; rejected below
+        key, shape = None, None
+    if shape is not None:
+        return shape
+
+    body = bytearray()
+    _put_text(body, entry.stage)
+    _put_text(body, entry.component)
+    _put_text(body, entry.status)
+    _put_texts(body, entry.reason_ids)
+    _put_text(body, entry.notes)
+    out = bytearray()
+    _put_varint(out, len(body))
+    out += body
+    shape = bytes(out)
+    if key is not None and len(_ENCODED_SHAPES) < MAX_SHAPES:
+        _ENCODED_SHAPES[key] = shape
+    return shape
+
+
+def _decode_shape(shape: bytes) -> tuple[tuple[Any, ...], TraceEntry]:
+    """Decoded shape fields, and the (immutable, shared) entry without a digest."""
+    decoded = _DECODED_SHAPES.get(shape)
+    if decoded is not None:
+        return decoded
+
+    view = memoryview(shape)
+    stage, pos = _get_text(view, 0)
+    component, pos = _get_text(view, pos)
+    status, pos = _get_text(view, pos)
+    reason_ids, pos = _get_texts(view, pos)
+    notes, pos = _get_text(view, pos)
+    if pos != len(shape):
+        raise CodecError("malformed trace entry")
+    fields = (stage, component, status, reason_ids, notes)
+    decoded = fields, TraceEntry(stage, component, status, reason_ids, None, notes)
+    if len(_DECODED_SHAPES) < MAX_SHAPES:
+        _DECODED_SHAPES[shape] = decoded
+    return decoded
+
+
+def _put_varint(out: bytearray, n: int) -> None:
+    while n > 0x7F:
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def _put_int(out: bytearray, n: Any) -> None:
+    if type(n) is not int:
+        raise CodecError(f"expected int, got {type(n).__name__}")
+    if not -(1 << 63) <= n < 1 << 63:
+        raise CodecError(f"int out of 64-bit range: {n}")
+    _put_varint(out, n << 1 if n >= 0 else (-n << 1) - 1)  # zigzag
+
+
+def _put_text(out: bytearray, s: str | None) -> None:
+    interned = _INTERNED.get(s) if type(s) is str else None
+    if interned is not None:
+        out += interned
+    elif s is None:
+        out += _NONE
+    elif type(s) is not str:
+        raise CodecError(f"expected str or None, got {type(s).__name__}")
+    elif len(s) == 64 and _HEX_DIGITS.issuperset(s):
+        out += _DIGEST
+        out += bytes.fromhex(s)
+    else:
+        encoded = s.encode("utf-8")
+        out.append(_TAG_LITERAL)
+        _put_varint(out, len(encoded))
+        out += encoded
+
+
+def _put_texts(out: bytearray, items: Any) -> None:
+    _put_varint(out, len(items))
+    for s in items:
+        _put_text(out, s)
+
+
+def _get_varint(view: memoryview, pos: int) -> tuple[int, int]:
+    n = 0
+    for shift in range(0, 64, 7):  # at most 10 bytes
+        b = view[pos]
+        pos += 1
+        n |= (b & 0x7F) << shift
+        if b < 0x80:
+            if n >> 64:
+                raise CodecError("varint exceeds 64 bits")
+            return n, pos
+    raise CodecError("varint longer than 10 bytes")
+
+
+def _get_int(view: memoryview, pos: int) -> tuple[int, int]:
+    n, pos = _get_varint(view, pos)
+    return (n >> 1) ^ -(n & 1), pos
+
+
+def _get_text(view: memoryview, pos: int) -> tuple[str | None, int]:
+    tag = view[pos]
+    pos += 1
+    if tag >= _TAG_TABLE:
+        try:
+            return _DECODE_TABLE[tag], pos
+        except IndexError:
+            raise CodecError(f"unknown string table index {tag - _TAG_TABLE}") from None
+    if tag == _TAG_DIGEST:
+        end = pos + 32
+        if end > len(view):
+            raise IndexError("truncated digest")
+        return view[pos:end].hex(), end
+    if tag == _TAG_NONE:
+        return None, pos
+    size, pos = _get_varint(view, pos)
+    end = pos + size
+    if end > len(view):
+        raise IndexError("truncated string")
+    return str(view[pos:end], "utf-8"), end
+
+
+def _get_texts(view: memoryview, pos: int) -> tuple[tuple[str, ...], int]:
+    count, pos = _get_varint(view, pos)
+    items = []
+    for _ in range(count):
+        s, pos = _get_text(view, pos)
+        items.append(s)
+    return tuple(items), pos
@@ -1,13 +1,12 @@
 from __future__ import annotations
 
 import hashlib
-from typing import Any
+from typing import Any, Mapping
 
-from .canonical_json import to_canonical_json
+from .canonical_json import iter_canonical_json, to_canonical_bytes
 
-
-def _sha256_hex(data: str) -> str:
-    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+# Encoded bytes buffered before each hasher.update() in streaming mode.
+STREAM_CHUNK_SIZE = 64 * 1024
 
 
 def compute_context_hash(material: Any) -> str:
@@ -17,5 +16,63 @@ def compute_context_hash(material: Any) -> str:
     The hash is derived exclusively from canonical JSON of
     contract-defined material (no hidden inputs).
     """
-    canonical = to_canonical_json(material)
-    return _sha256_hex(canonical)
+    return hashlib.sha256(to_canonical_bytes(material)).hexdigest()
+
+
+def update_canonical(hasher: Any, obj: Any, *, chunk_size: int = STREAM_CHUNK_SIZE) -> None:
+    """
+    Feed the canonical JSON of `obj` into a hashlib object incrementally.
+
+    Peak memory is bounded by `chunk_size` instead of two full copies
+    (str + UTF-8 bytes) of the document.
+    """
+    buf: list[str] = []
+    buffered = 0
+    for chunk in iter_canonical_json(obj):
+        buf.append(chunk)
+        buffered += len(chunk)
+        if buffered >= chunk_size:
+            hasher.update("".join(buf).encode("utf-8"))
+            buf.clear()
+            buffered = 0
+    if buf:
+        hasher.update("".join(buf).encode("utf-8"))
+
+
+def compute_context_hash_streaming(material: Any) -> str:
+    """
+    Streaming variant of compute_context_hash() (identical digest).
+
+    Slower per byte than the one-shot C encoder, but never holds the whole
+    canonical document in memory; intended for multi-megabyte material.
+    """
+    h = hashlib.sha256()
+    update_canonical(h, material)
+    return h.hexdigest()
+
+
+def compute_spliced_context_hash(material: Mapping[str, Any], spliced: Mapping[str, bytes]) -> str:
+    """
+    Compute context_hash for a top-level object whose `spliced` values are
+    already canonical JSON (UTF-8 bytes).
+
+    The result is byte-identical to compute_context_hash() over the merged
+    object, but the pre-encoded values are never re-serialized.
+    """
+    overlap = material.keys() & spliced.keys()
+    if overlap:
+        raise ValueError(f"duplicate hash material keys: {sorted(overlap)}")
+
+    h = hashlib.sha256()
+    h.update(b"{")
+    for i, key in enumerate(sorted([*material.keys(), *spliced.keys()])):
+        if i:
+            h.update(b",")
+        h.update(to_canonical_bytes(key))
+        h.update(b":")
+        if key in spliced:
+            h.update(spliced[key])
+        else:
+            h.update(to_canonical_bytes(material[key]))
+    h.update(b"}")
+    return h.hexdigest()
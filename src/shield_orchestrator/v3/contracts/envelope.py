@@ -10,7 +10,7 @@ Outcome = Literal["ALLOW", "ESCALATE", "DENY"]
 TraceStatus = Literal["OK", "DENY", "ERROR", "SKIPPED"]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TraceEntry:
     """
     Deterministic pipeline trace entry.
@@ -22,8 +22,36 @@ class TraceEntry:
     component_context_hash: str | None = None
     notes: str | None = None
 
+    def to_hash_material(self) -> dict[str, Any]:
+        """
+        Hash material equal (under canonical JSON) to dataclasses.asdict(self),
+        built without asdict()'s recursive deep copy.
+        """
+        return {
+            "stage": self.stage,
+            "component": self.component,
+            "status": self.status,
+            "reason_ids": list(self.reason_ids),
+            "component_context_hash": self.component_context_hash,
+            "notes": self.notes,
+        }
 
-@dataclass(frozen=True)
+    @staticmethod
+    def from_hash_material(data: dict[str, Any]) -> "TraceEntry":
+        """
+        Inverse of to_hash_material() (e.g. for an entry decoded from JSON).
+        """
+        return TraceEntry(
+            stage=data["stage"],
+            component=data["component"],
+            status=data["status"],
+            reason_ids=tuple(data["reason_ids"]),
+            component_context_hash=data["component_context_hash"],
+            notes=data["notes"],
+        )
+
+
+@dataclass(frozen=True, slots=True, weakref_slot=True)
 class OrchestratorV3Request:
     """
     Public v3 request envelope.
@@ -37,8 +65,25 @@ class OrchestratorV3Request:
     # Optional opaque payload (treated strictly as data, no semantics here)
     payload: dict[str, Any] = field(default_factory=dict)
 
+    def to_hash_material(self) -> dict[str, Any]:
+        """
+        Hash material equal (under canonical JSON) to dataclasses.asdict(self).
+
+        The payload is referenced, not deep-copied: it must be plain JSON data
+        (dict/list/tuple/str/int/float/bool/None); anything else fails
+        canonicalization and maps to HASHING_FAILED.
+        """
+        return {
+            "contract_version": self.contract_version,
+            "wallet_id": self.wallet_id,
+            "action": self.action,
+            "nonce": self.nonce,
+            "ttl_seconds": self.ttl_seconds,
+            "payload": self.payload,
+        }
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OrchestratorV3Response:
     """
     Public v3 response envelope.
@@ -49,6 +94,38 @@ class OrchestratorV3Response:
     reason_ids: tuple[str, ...]
     trace: tuple[TraceEntry, ...]
 
+    # Optional Merkle root over the envelope (see v3/merkle.py); never part
+    # of context_hash.
+    merkle_root: str | None = None
+
+    def to_hash_material(self) -> dict[str, Any]:
+        """
+        Full envelope as plain JSON data (equal to dataclasses.asdict(self)
+        under canonical JSON), for audit and transport.
+        """
+        return {
+            "contract_version": self.contract_version,
+            "context_hash": self.context_hash,
+            "outcome": self.outcome,
+            "reason_ids": list(self.reason_ids),
+            "trace": [t.to_hash_material() for t in self.trace],
+            "merkle_root": self.merkle_root,
+        }
+
+    @staticmethod
+    def from_hash_material(data: dict[str, Any]) -> "OrchestratorV3Response":
+        """
+        Inverse of to_hash_material() (e.g. for an envelope decoded from JSON).
+        """
+        return OrchestratorV3Response(
+            contract_version=data["contract_version"],
+            context_hash=data["context_hash"],
+            outcome=data["outcome"],
+            reason_ids=tuple(data["reason_ids"]),
+            trace=tuple(TraceEntry.from_hash_material(t) for t in data["trace"]),
+            merkle_root=data.get("merkle_root"),
+        )
+
     @staticmethod
     def deny(
         *,
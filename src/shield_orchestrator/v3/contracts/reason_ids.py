@@ -13,11 +13,14 @@ class ReasonId(str, Enum):
 
     INVALID_CONTRACT_VERSION = "INVALID_CONTRACT_VERSION"
     INVALID_REQUEST = "INVALID_REQUEST"
+    NONCE_REPLAY = "NONCE_REPLAY"
     HASHING_FAILED = "HASHING_FAILED"
 
     COMPONENT_ERROR = "COMPONENT_ERROR"
     COMPONENT_INVALID_RESPONSE = "COMPONENT_INVALID_RESPONSE"
     COMPONENT_MISSING = "COMPONENT_MISSING"
+    COMPONENT_TIMEOUT = "COMPONENT_TIMEOUT"
+    COMPONENT_UNAVAILABLE = "COMPONENT_UNAVAILABLE"
 
     DENY_BY_POLICY = "DENY_BY_POLICY"
     INTERNAL_ERROR = "INTERNAL_ERROR"
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import time
+from typing import Any, Callable
+
+from .contracts.envelope import TraceEntry
+from .contracts.reason_ids import ReasonId
+
+Clock = Callable[[], float]
+
+
+class DeadlineScheduler:
+    """
+    Per-request deadline derived from OrchestratorV3Request.ttl_seconds.
+
+    The request TTL is the total time budget for component evaluation:
+    - sequential callers ask for next_budget() before each component and get
+      a fair share of what is left (time a fast component does not use is
+      passed on to the components after it)
+    - concurrent callers wait at most remaining() in total, and apply the
+      same fair shares to the measured run times with a BudgetLedger
+
+    A component whose budget is already exhausted must not be started; the
+    orchestrator records a deterministic COMPONENT_TIMEOUT entry instead.
+    """
+
+    def __init__(self, ttl_seconds: float, components: int, *, clock: Clock = time.monotonic) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.components = components
+        self._clock = clock
+        self._deadline = clock() + ttl_seconds
+        self._components_left = components
+
+    def remaining(self) -> float:
+        """Seconds left until the request deadline (<= 0 once it has passed)."""
+        return self._deadline - self._clock()
+
+    def next_budget(self) -> float:
+        """Budget for the next sequential component (<= 0 means do not start it)."""
+        share = self.remaining() / max(1, self._components_left)
+        self._components_left = max(0, self._components_left - 1)
+        return share
+
+    def now(self) -> float:
+        return self._clock()
+
+
+class BudgetLedger:
+    """
+    The sequential fair-share policy, replayed over components that ran
+    concurrently.
+
+    Components are charged in canonical order with their own run time, as
+    if they had run one after another: each gets next_budget() on a clock
+    that advances only by the time charged. A component over its budget, or
+    one whose budget was already gone (it would not have been started), is
+    a COMPONENT_TIMEOUT exactly as in sequential evaluation, so the same run
+    times give the same trace on every backend.
+    """
+
+    def __init__(self, deadline: DeadlineScheduler) -> None:
+        self._elapsed = 0.0
+        self._scheduler = DeadlineScheduler(deadline.ttl_seconds, deadline.components, clock=self._now)
+
+    def next_budget(self) -> float:
+        return self._scheduler.next_budget()
+
+    def charge(self, run_seconds: float) -> None:
+        self._elapsed += run_seconds
+
+    def _now(self) -> float:
+        return self._elapsed
+
+
+def timeout_entry(bridge: Any) -> TraceEntry:
+    """
+    Deterministic trace entry for a component abandoned at its deadline.
+    """
+    return TraceEntry(
+        stage=bridge.STAGE,
+        component=bridge.COMPONENT,
+        status="ERROR",
+        reason_ids=(ReasonId.COMPONENT_TIMEOUT.value,),
+        notes="deadline_exceeded",
+    )
@@ -0,0 +1,304 @@
+from __future__ import annotations
+
+import inspect
+import json
+import math
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from typing import Any, Protocol, Sequence
+
+from .canonical_request import CanonicalRequest
+from .contracts.envelope import OrchestratorV3Request, TraceEntry
+from .deadlines import BudgetLedger, Clock, DeadlineScheduler, timeout_entry
+from .instrumentation import StageObserver, notify_start, notify_stop, observe_stage
+
+
+class BridgeExecutor(Protocol):
+    """
+    Execution backend for the component bridges of one request.
+
+    evaluate() returns one TraceEntry per bridge, in the given (canonical)
+    order. Components that miss the request deadline are returned as
+    COMPONENT_TIMEOUT entries. If any component raises, the exception of the
+    first failing component in canonical order is re-raised unchanged, so
+    the orchestrator maps failures identically on every backend.
+
+    With short_circuit=True, the first component (in canonical order) whose
+    entry is not OK decides the outcome: every later component gets a
+    SKIPPED entry and its result or failure is ignored. When an observer is
+    given, each bridge is reported as its own stage.
+
+    An executor that cannot run every bridge may define the optional hook
+    check_bridges(bridges); Orchestrator calls it once at construction and
+    it raises ValueError for bridges the executor cannot run.
+    """
+
+    def evaluate(
+        self,
+        canonical: CanonicalRequest,
+        bridges: Sequence[Any],
+        deadline: DeadlineScheduler,
+        observer: StageObserver | None = None,
+        short_circuit: bool = False,
+    ) -> list[TraceEntry]: ...
+
+    def close(self) -> None: ...
+
+
+class _ExecutorBase:
+    def close(self) -> None:
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+class InlineExecutor(_ExecutorBase):
+    """
+    Sequential, in-thread evaluation (default backend).
+
+    Each bridge gets a fair share of the remaining TTL. Inline bridges cannot
+    be preempted: an overrun result is abandoned once it returns, and bridges
+    whose budget is already exhausted are not started. Short-circuited
+    bridges are never called.
+    """
+
+    def evaluate(
+        self,
+        canonical: CanonicalRequest,
+        bridges: Sequence[Any],
+        deadline: DeadlineScheduler,
+        observer: StageObserver | None = None,
+        short_circuit: bool = False,
+    ) -> list[TraceEntry]:
+        request = canonical.request
+        entries: list[TraceEntry] = []
+        decided = False
+
+        for bridge in bridges:
+            if decided:
+                entries.append(skipped_entry(bridge))
+                continue
+
+            budget = deadline.next_budget()
+            if budget <= 0:
+                entry = timeout_entry(bridge)
+            else:
+                started = deadline.now()
+                with observe_stage(observer, bridge.STAGE):
+                    entry = bridge.evaluate_v3(request, canonical=canonical)
+                if deadline.now() - started > budget:
+                    entry = timeout_entry(bridge)
+
+            entries.append(entry)
+            decided = short_circuit and entry.status != "OK"
+
+        return entries
+
+
+class _PoolExecutor(_ExecutorBase):
+    """
+    Shared fan-out logic: submit every bridge at once, then collect in
+    canonical order, waiting at most until the request deadline. Bridges
+    still running at the deadline are abandoned; once short-circuited, the
+    remaining futures are cancelled (or abandoned if already running).
+
+    Timeouts follow InlineExecutor's fair-share policy (see BudgetLedger):
+    each bridge's measured run time is charged against its share in
+    canonical order, so a bridge times out on every backend or on none.
+    """
+
+    _pool: ThreadPoolExecutor | ProcessPoolExecutor
+
+    def _submit(
+        self, bridge: Any, canonical: CanonicalRequest, deadline: DeadlineScheduler, observer: StageObserver | None
+    ) -> Future:
+        raise NotImplementedError
+
+    def _entry(self, bridge: Any, future: Future, observer: StageObserver | None) -> tuple[TraceEntry, float]:
+        """The bridge's entry and its run time in seconds."""
+        return future.result()
+
+    def _no_entry(self, bridge: Any, observer: StageObserver | None, wall_seconds: float) -> None:
+        """
+        A bridge that produced no entry: cancelled, abandoned or raised.
+        Backends that report stage starts outside the worker report the
+        stop (ok=False) here; thread workers report their own.
+        """
+
+    def evaluate(
+        self,
+        canonical: CanonicalRequest,
+        bridges: Sequence[Any],
+        deadline: DeadlineScheduler,
+        observer: StageObserver | None = None,
+        short_circuit: bool = False,
+    ) -> list[TraceEntry]:
+        submitted = time.perf_counter()
+        futures = [self._submit(bridge, canonical, deadline, observer) for bridge in bridges]
+        ledger = BudgetLedger(deadline)
+
+        entries: list[TraceEntry] = []
+        first_error: BaseException | None = None
+        decided = False
+        for bridge, future in zip(bridges, futures):
+            if decided:
+                future.cancel()
+                self._no_entry(bridge, observer, time.perf_counter() - submitted)
+                entries.append(skipped_entry(bridge))
+                continue
+
+            budget = ledger.next_budget()
+            if budget <= 0:
+                # Inline evaluation would not have started this bridge.
+                future.cancel()
+                self._no_entry(bridge, observer, time.perf_counter() - submitted)
+                entries.append(timeout_entry(bridge))
+                decided = short_circuit
+                continue
+
+            done, _ = wait([future], timeout=max(0.0, deadline.remaining()))
+            if not done:
+                future.cancel()  # abandoned: a running worker cannot be interrupted
+                self._no_entry(bridge, observer, time.perf_counter() - submitted)
+                ledger.charge(math.inf)  # it ran past the request deadline
+                entries.append(timeout_entry(bridge))
+                decided = short_circuit
+                continue
+
+            error = future.exception()
+            if error is not None:
+                self._no_entry(bridge, observer, time.perf_counter() - submitted)
+                first_error = first_error or error
+                decided = short_circuit
+                continue
+
+            entry, run_seconds = self._entry(bridge, future, observer)
+            ledger.charge(run_seconds)
+            if run_seconds > budget:
+                entry = timeout_entry(bridge)
+            entries.append(entry)
+            decided = short_circuit and entry.status != "OK"
+
+        if first_error is not None:
+            raise first_error
+        return entries
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+class ThreadExecutor(_PoolExecutor):
+    """
+    Concurrent evaluation on a thread pool.
+
+    Suited to bridges that block on I/O or release the GIL (hashlib, most
+    native PQC libraries). Overrunning bridges are abandoned at the deadline.
+    """
+
+    def __init__(self, max_workers: int | None = None) -> None:
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="shield-bridge")
+
+    def _submit(
+        self, bridge: Any, canonical: CanonicalRequest, deadline: DeadlineScheduler, observer: StageObserver | None
+    ) -> Future:
+        return self._pool.submit(_observed_evaluate, bridge, canonical, deadline.now, observer)
+
+
+class ProcessExecutor(_PoolExecutor):
+    """
+    Concurrent evaluation on a process pool, for GIL-bound CPU-heavy bridges.
+
+    Workers receive the bridge class and the pre-serialized canonical request
+    bytes (never a pickled request dataclass), rebuild the request from those
+    bytes and evaluate with a worker-local bridge instance. Bridge classes
+    must therefore be importable and constructible without arguments
+    (check_bridges() enforces this when an Orchestrator is built); the
+    registry's instances, and their warm_up() state, stay in the parent.
+    """
+
+    def __init__(self, max_workers: int | None = None) -> None:
+        self._pool = ProcessPoolExecutor(max_workers=max_workers)
+
+    def check_bridges(self, bridges: Sequence[Any]) -> None:
+        """ValueError unless every bridge class is constructible without arguments."""
+        for bridge in bridges:
+            bridge_type = type(bridge)
+            try:
+                inspect.signature(bridge_type).bind()
+            except TypeError:
+                raise ValueError(
+                    f"ProcessExecutor rebuilds bridges in its workers, but {bridge_type.__name__}"
+                    f" ({bridge.COMPONENT!r}) cannot be constructed without arguments"
+                ) from None
+
+    def _submit(
+        self, bridge: Any, canonical: CanonicalRequest, deadline: DeadlineScheduler, observer: StageObserver | None
+    ) -> Future:
+        notify_start(observer, bridge.STAGE)
+        return self._pool.submit(_evaluate_in_worker, type(bridge), canonical.canonical, canonical.digest)
+
+    def _entry(self, bridge: Any, future: Future, observer: StageObserver | None) -> tuple[TraceEntry, float]:
+        entry, wall_seconds, cpu_seconds = future.result()
+        notify_stop(observer, bridge.STAGE, wall_seconds=wall_seconds, cpu_seconds=cpu_seconds, ok=True)
+        return entry, wall_seconds
+
+    def _no_entry(self, bridge: Any, observer: StageObserver | None, wall_seconds: float) -> None:
+        # The stage was started in this process at submission; close it here.
+        notify_stop(observer, bridge.STAGE, wall_seconds=wall_seconds, cpu_seconds=0.0, ok=False)
+
+
+def _observed_evaluate(
+    bridge: Any, canonical: CanonicalRequest, clock: Clock, observer: StageObserver | None
+) -> tuple[TraceEntry, float]:
+    # Runs on the pool thread, so CPU time is that thread's own. The run
+    # time is measured on the request's clock, as InlineExecutor does.
+    started = clock()
+    with observe_stage(observer, bridge.STAGE):
+        entry = bridge.evaluate_v3(canonical.request, canonical=canonical)
+    return entry, clock() - started
+
+
+def skipped_entry(bridge: Any) -> TraceEntry:
+    """
+    Deterministic trace entry for a component not evaluated because an
+    earlier component already decided the outcome (short-circuit mode).
+    """
+    return TraceEntry(
+        stage=bridge.STAGE,
+        component=bridge.COMPONENT,
+        status="SKIPPED",
+        reason_ids=(),
+        notes="short_circuit",
+    )
+
+
+# Worker-local bridge instances, built once per worker process.
+_WORKER_BRIDGES: dict[type, Any] = {}
+
+
+def _evaluate_in_worker(bridge_type: type, canonical: bytes, digest: str) -> tuple[TraceEntry, float, float]:
+    """
+    Returns (entry, wall_seconds, cpu_seconds) measured inside the worker.
+    """
+    wall = time.perf_counter()
+    cpu = time.thread_time()
+
+    bridge = _WORKER_BRIDGES.get(bridge_type)
+    if bridge is None:
+        try:
+            bridge = bridge_type()
+        except Exception as e:
+            # Not a hashing failure (TypeError): report it as a component error.
+            raise RuntimeError(f"cannot construct {bridge_type.__name__} in the worker: {e!r}") from None
+        _WORKER_BRIDGES[bridge_type] = bridge
+
+    request = OrchestratorV3Request(**json.loads(canonical))
+    entry = bridge.evaluate_v3(
+        request,
+        canonical=CanonicalRequest(request=request, canonical=canonical, digest=digest),
+    )
+    return entry, time.perf_counter() - wall, time.thread_time() - cpu
@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import threading
+import time
+from typing import Iterable
+
+
+class StageObserver:
+    """
+    Opt-in instrumentation hooks for orchestration stages.
+
+    Stages: input_validation, canonicalize, one per component bridge
+    (sentinel_ai, dqsn, adn, guardian_wallet, qwg), final_synthesis,
+    adaptive_core and context_hash.
+
+    Component guards (see breaker.py) additionally report circuit breaker
+    state changes and fail-fast rejections.
+
+    Observers sit entirely outside the hashed trace: they never see or
+    influence outcomes, and any exception they raise is swallowed.
+    Subclass and override only the hooks you need.
+    """
+
+    def on_stage_start(self, stage: str) -> None:
+        pass
+
+    def on_stage_stop(self, stage: str, *, wall_seconds: float, cpu_seconds: float, ok: bool) -> None:
+        pass
+
+    def on_breaker_state(self, component: str, state: str) -> None:
+        pass
+
+    def on_component_rejected(self, component: str, reason: str) -> None:
+        pass
+
+
+class _NullStage:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc: object) -> None:
+        return None
+
+
+_NULL_STAGE = _NullStage()
+
+
+class _TimedStage:
+    __slots__ = ("_observer", "_stage", "_wall", "_cpu")
+
+    def __init__(self, observer: StageObserver, stage: str) -> None:
+        self._observer = observer
+        self._stage = stage
+
+    def __enter__(self) -> None:
+        notify_start(self._observer, self._stage)
+        self._wall = time.perf_counter()
+        self._cpu = time.thread_time()
+
+    def __exit__(self, exc_type: object, *exc: object) -> None:
+        notify_stop(
+            self._observer,
+            self._stage,
+            wall_seconds=time.perf_counter() - self._wall,
+            cpu_seconds=time.thread_time() - self._cpu,
+            ok=exc_type is None,
+        )
+
+
+def observe_stage(observer: StageObserver | None, stage: str) -> _TimedStage | _NullStage:
+    """
+    Context manager timing one stage (wall + CPU time of the calling thread).
+
+    With no observer this returns a shared no-op, so disabled
+    instrumentation costs one function call per stage.
+    """
+    if observer is None:
+        return _NULL_STAGE
+    return _TimedStage(observer, stage)
+
+
+def notify_start(observer: StageObserver | None, stage: str) -> None:
+    if observer is None:
+        return
+    try:
+        observer.on_stage_start(stage)
+    except Exception:
+        pass
+
+
+def notify_stop(
+    observer: StageObserver | None,
+    stage: str,
+    *,
+    wall_seconds: float,
+    cpu_seconds: float,
+    ok: bool,
+) -> None:
+    if observer is None:
+        return
+    try:
+        observer.on_stage_stop(stage, wall_seconds=wall_seconds, cpu_seconds=cpu_seconds, ok=ok)
+    except Exception:
+        pass
+
+
+def notify(observer: StageObserver | None, hook: str, *args: object) -> None:
+    """Call an observer hook by name, swallowing observer failures."""
+    if observer is None:
+        return
+    try:
+        getattr(observer, hook)(*args)
+    except Exception:
+        pass
+
+
+BREAKER_STATES = ("closed", "open", "half_open")
+
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005,
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+
+class _Histogram:
+    __slots__ = ("counts", "total", "count")
+
+    def __init__(self, size: int) -> None:
+        self.counts = [0] * size
+        self.total = 0.0
+        self.count = 0
+
+
+class StageHistograms(StageObserver):
+    """
+    Built-in observer aggregating per-stage wall/CPU latency histograms,
+    plus the current circuit breaker state and rejection counts per component.
+
+    Thread-safe. Dump with to_prometheus() or write_prometheus(path)
+    (Prometheus text exposition format, e.g. for a node_exporter textfile
+    collector).
+    """
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS, *, namespace: str = "shield_orchestrator") -> None:
+        self._buckets = tuple(sorted(buckets))
+        self._namespace = namespace
+        self._lock = threading.Lock()
+        self._wall: dict[str, _Histogram] = {}
+        self._cpu: dict[str, _Histogram] = {}
+        self._errors: dict[str, int] = {}
+        self._breakers: dict[str, str] = {}
+        self._rejections: dict[tuple[str, str], int] = {}
+
+    def on_breaker_state(self, component: str, state: str) -> None:
+        with self._lock:
+            self._breakers[component] = state
+
+    def on_component_rejected(self, component: str, reason: str) -> None:
+        with self._lock:
+            key = (component, reason)
+            self._rejections[key] = self._rejections.get(key, 0) + 1
+
+    def breaker_state(self, component: str) -> str | None:
+        with self._lock:
+            return self._breakers.get(component)
+
+    def on_stage_stop(self, stage: str, *, wall_seconds: float, cpu_seconds: float, ok: bool) -> None:
+        with self._lock:
+            self._observe(self._wall, stage, wall_seconds)
+            self._observe(self._cpu, stage, cpu_seconds)
+            if not ok:
+                self._errors[stage] = self._errors.get(stage, 0) + 1
+
+    def count(self, stage: str) -> int:
+        with self._lock:
+            h = self._wall.get(stage)
+            return h.count if h is not None else 0
+
+    def to_prometheus(self) -> str:
+        lines: list[str] = []
+        with self._lock:
+            for kind, histograms in (("wall", self._wall), ("cpu", self._cpu)):
+                name = f"{self._namespace}_stage_{kind}_seconds"
+                lines.append(f"# HELP {name} Orchestrator stage {kind} time in seconds.")
+                lines.append(f"# TYPE {name} histogram")
+                for stage in sorted(histograms):
+                    h = histograms[stage]
+                    cumulative = 0
+                    for le, n in zip(self._buckets, h.counts):
+                        cumulative += n
+                        lines.append(f'{name}_bucket{{stage="{stage}",le="{le:g}"}} {cumulative}')
+                    lines.append(f'{name}_bucket{{stage="{stage}",le="+Inf"}} {h.count}')
+                    lines.append(f'{name}_sum{{stage="{stage}"}} {h.total!r}')
+                    lines.append(f'{name}_count{{stage="{stage}"}} {h.count}')
+
+            name = f"{self._namespace}_stage_errors_total"
+            lines.append(f"# HELP {name} Orchestrator stages that raised.")
+            lines.append(f"# TYPE {name} counter")
+            for stage in sorted(self._errors):
+                lines.append(f'{name}{{stage="{stage}"}} {self._errors[stage]}')
+
+            if self._breakers:
+                name = f"{self._namespace}_breaker_state"
+                lines.append(f"# HELP {name} Component circuit breaker state (1 for the current state).")
+                lines.append(f"# TYPE {name} gauge")
+                for component in sorted(self._breakers):
+                    current = self._breakers[component]
+                    for state in BREAKER_STATES:
+                        value = 1 if state == current else 0
+                        lines.append(f'{name}{{component="{component}",state="{state}"}} {value}')
+
+            if self._rejections:
+                name = f"{self._namespace}_component_rejections_total"
+                lines.append(f"# HELP {name} Component calls rejected without being made.")
+                lines.append(f"# TYPE {name} counter")
+                for component, reason in sorted(self._rejections):
+                    count = self._rejections[(component, reason)]
+                    lines.append(f'{name}{{component="{component}",reason="{reason}"}} {count}')
+
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str) -> None:
+        """
+        Atomically replace `path` with the current metrics.
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix=".shield-metrics-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(self.to_prometheus())
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def _observe(self, histograms: dict[str, _Histogram], stage: str, value: float) -> None:
+        h = histograms.get(stage)
+        if h is None:
+            h = histograms[stage] = _Histogram(len(self._buckets))
+        for i, le in enumerate(self._buckets):
+            if value <= le:
+                h.counts[i] += 1
+                break
+        h.total += value
+        h.count += 1
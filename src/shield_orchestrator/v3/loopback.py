@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import json
+import socketserver
+import threading
+from typing import Callable
+
+from shield_orchestrator.bridges.adn_bridge import ADNBridge
+from shield_orchestrator.bridges.dqsn_bridge import DQSNBridge
+from shield_orchestrator.bridges.guardian_wallet_bridge import GuardianWalletBridge
+from shield_orchestrator.bridges.qwg_bridge import QWGBridge
+from shield_orchestrator.bridges.sentinel_bridge import SentinelBridge
+
+from .canonical_json import to_canonical_bytes
+from .canonical_request import CanonicalRequest
+from .contracts.envelope import OrchestratorV3Request
+from .registry import CANONICAL_COMPONENTS
+from .transport import Address, encode_frame, read_frame
+
+# (component, request body) -> reply body
+Responder = Callable[[str, bytes], bytes]
+
+_STUB_BRIDGES = {
+    b.COMPONENT: b
+    for b in (SentinelBridge(), DQSNBridge(), ADNBridge(), GuardianWalletBridge(), QWGBridge())
+}
+
+
+def stub_responder(component: str, body: bytes) -> bytes:
+    """
+    Answer like the in-process Phase 3 stub bridge for `component`, so
+    envelopes produced over the loopback transport are byte-identical to
+    orchestrate() with the default bridges.
+    """
+    data = json.loads(body)
+    request = OrchestratorV3Request(**data["request"])
+    entry = _STUB_BRIDGES[component].evaluate_v3(request, canonical=CanonicalRequest.from_request(request))
+    return to_canonical_bytes(entry.to_hash_material())
+
+
+class _ComponentHandler(socketserver.StreamRequestHandler):
+    server: _ThreadingServer
+
+    def handle(self) -> None:
+        # Requests are answered strictly in order, which keeps pipelining FIFO.
+        while True:
+            try:
+                body = read_frame(self.rfile)
+            except ConnectionError:
+                return
+            if body is None:
+                return
+
+            component = json.loads(body)["component"]
+            self.wfile.write(encode_frame(self.server.responder(component, body)))
+
+
+class _ThreadingServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+    responder: Responder
+
+
+class LoopbackComponentServer:
+    """
+    Local stand-in for the remote v3 component services, for offline tests
+    and load testing of the pooled transport (see transport.py).
+
+    One listener serves every component; requests carry the component name.
+    Pass a custom `responder` to inject slow or malformed replies.
+    """
+
+    def __init__(self, responder: Responder = stub_responder, *, host: str = "127.0.0.1", port: int = 0) -> None:
+        self._server = _ThreadingServer((host, port), _ComponentHandler)
+        self._server.responder = responder
+        self._thread: threading.Thread | None = None
+
+    @property
+    def address(self) -> Address:
+        host, port = self._server.server_address[:2]
+        return host, port
+
+    def endpoints(self) -> dict[str, Address]:
+        """Transport endpoints routing every canonical component here."""
+        return {component: self.address for component in CANONICAL_COMPONENTS}
+
+    def start(self) -> LoopbackComponentServer:
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._server.serve_forever, name="shield-loopback", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def close(self) -> None:
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self) -> LoopbackComponentServer:
+        return self.start()
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
@@ -0,0 +1,167 @@
+"""
+Merkle context hash (optional, alongside the flat context_hash).
+
+The envelope is committed to as a Merkle tree over these leaves, in order:
+
+    0  verdict: canonical JSON of {"outcome": ..., "reason_ids": [...]}
+    1  request: the 32-byte SHA-256 digest of the canonical request
+       (CanonicalRequest.digest; payload null on fail-closed paths, as in
+       the flat hash)
+    2+ one leaf per trace entry: canonical JSON of its hash material
+
+Hashing follows RFC 6962 / 9162: leaf = SHA-256(0x00 || data), node =
+SHA-256(0x01 || left || right), the tree splitting at the largest power of
+two below the leaf count. An inclusion proof is the audit path of one
+leaf, so a single trace entry (or the request) is verified against the
+root with O(log n) hashes and without re-serializing the payload or the
+other entries.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass
+from typing import Any, Sequence
+
+from .canonical_json import to_canonical_bytes
+from .contracts.envelope import OrchestratorV3Response, TraceEntry
+
+VERDICT_LEAF = 0
+REQUEST_LEAF = 1
+TRACE_LEAF_OFFSET = 2
+
+
+@dataclass(frozen=True)
+class InclusionProof:
+    """
+    Audit path of leaf `index` in a tree of `size` leaves (hex node hashes,
+    bottom-up).
+    """
+    index: int
+    size: int
+    path: tuple[str, ...]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"index": self.index, "size": self.size, "path": list(self.path)}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "InclusionProof":
+        return cls(index=int(data["index"]), size=int(data["size"]), path=tuple(data["path"]))
+
+
+def leaf_hash(data: bytes) -> bytes:
+    return hashlib.sha256(b"\x00" + data).digest()
+
+
+def node_hash(left: bytes, right: bytes) -> bytes:
+    return hashlib.sha256(b"\x01" + left + right).digest()
+
+
+def merkle_root(leaf_hashes: Sequence[bytes]) -> bytes:
+    """Root over already-hashed leaves (RFC 6962 MTH)."""
+    n = len(leaf_hashes)
+    if n == 0:
+        return hashlib.sha256(b"").digest()
+    if n == 1:
+        return leaf_hashes[0]
+    k = _split(n)
+    return node_hash(merkle_root(leaf_hashes[:k]), merkle_root(leaf_hashes[k:]))
+
+
+def audit_path(leaf_hashes: Sequence[bytes], index: int) -> list[bytes]:
+    """Sibling hashes from leaf `index` up to the root (RFC 6962 PATH)."""
+    n = len(leaf_hashes)
+    if not 0 <= index < n:
+        raise IndexError("leaf index out of range")
+    if n == 1:
+        return []
+    k = _split(n)
+    if index < k:
+        return audit_path(leaf_hashes[:k], index) + [merkle_root(leaf_hashes[k:])]
+    return audit_path(leaf_hashes[k:], index - k) + [merkle_root(leaf_hashes[:k])]
+
+
+def verify_inclusion(leaf: bytes, proof: InclusionProof, root: str) -> bool:
+    """
+    Check that leaf data `leaf` sits at proof.index under `root` (hex),
+    following the RFC 9162 inclusion verification algorithm.
+    """
+    if not 0 <= proof.index < proof.size:
+        return False
+    try:
+        path = [bytes.fromhex(p) for p in proof.path]
+    except ValueError:
+        return False
+
+    fn, sn = proof.index, proof.size - 1
+    r = leaf_hash(leaf)
+    for p in path:
+        if sn == 0:
+            return False
+        if fn & 1 or fn == sn:
+            r = node_hash(p, r)
+            while not fn & 1 and fn != 0:
+                fn >>= 1
+                sn >>= 1
+        else:
+            r = node_hash(r, p)
+        fn >>= 1
+        sn >>= 1
+    return sn == 0 and r.hex() == root
+
+
+def envelope_leaves(request_digest: str, response: OrchestratorV3Response) -> list[bytes]:
+    """Leaf data of an envelope, in leaf order (see the module docstring)."""
+    return [
+        verdict_leaf(response.outcome, response.reason_ids),
+        bytes.fromhex(request_digest),
+        *(trace_leaf(entry) for entry in response.trace),
+    ]
+
+
+def verdict_leaf(outcome: str, reason_ids: Sequence[str]) -> bytes:
+    return to_canonical_bytes({"outcome": outcome, "reason_ids": list(reason_ids)})
+
+
+def trace_leaf(entry: TraceEntry | dict[str, Any]) -> bytes:
+    return to_canonical_bytes(entry.to_hash_material() if isinstance(entry, TraceEntry) else entry)
+
+
+def compute_merkle_root(request_digest: str, response: OrchestratorV3Response) -> str:
+    """Hex Merkle root of an envelope."""
+    return merkle_root([leaf_hash(leaf) for leaf in envelope_leaves(request_digest, response)]).hex()
+
+
+def prove(request_digest: str, response: OrchestratorV3Response, index: int) -> InclusionProof:
+    """
+    Inclusion proof for leaf `index` of the envelope; use REQUEST_LEAF,
+    VERDICT_LEAF or TRACE_LEAF_OFFSET + i for trace entry i.
+    """
+    hashes = [leaf_hash(leaf) for leaf in envelope_leaves(request_digest, response)]
+    return InclusionProof(index=index, size=len(hashes), path=tuple(p.hex() for p in audit_path(hashes, index)))
+
+
+def verify_trace_entry(
+    entry: TraceEntry | dict[str, Any], position: int, proof: InclusionProof, root: str
+) -> bool:
+    """Check that `entry` is trace entry number `position` under `root`."""
+    return proof.index == TRACE_LEAF_OFFSET + position and verify_inclusion(trace_leaf(entry), proof, root)
+
+
+def verify_verdict(outcome: str, reason_ids: Sequence[str], proof: InclusionProof, root: str) -> bool:
+    """Check the envelope's outcome and reason ids against `root`."""
+    return proof.index == VERDICT_LEAF and verify_inclusion(verdict_leaf(outcome, reason_ids), proof, root)
+
+
+def verify_request(request_digest: str, proof: InclusionProof, root: str) -> bool:
+    """Check that the canonical request with this digest is committed under `root`."""
+    try:
+        leaf = bytes.fromhex(request_digest)
+    except ValueError:
+        return False
+    return proof.index == REQUEST_LEAF and verify_inclusion(leaf, proof, root)
+
+
+def _split(n: int) -> int:
+    # Largest power of two strictly below n (n >= 2).
+    return 1 << ((n - 1).bit_length() - 1)
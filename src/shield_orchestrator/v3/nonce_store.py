@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import hashlib
+import heapq
+import math
+import threading
+import time
+from typing import Protocol
+
+from .deadlines import Clock
+
+
+class NonceStore(Protocol):
+    """
+    Replay index for (wallet_id, nonce) pairs.
+
+    check_and_record() atomically returns True and remembers the pair for
+    `ttl_seconds` if it is fresh, or returns False if the pair was already
+    seen and has not expired. Implementations must be thread-safe.
+    """
+
+    def check_and_record(self, wallet_id: str, nonce: str, ttl_seconds: int) -> bool: ...
+
+
+def nonce_key(wallet_id: str, nonce: str) -> bytes:
+    """
+    Fixed-size (16 byte) key for a (wallet_id, nonce) pair.
+
+    Length-prefixing wallet_id keeps ("ab", "c") and ("a", "bc") distinct.
+    """
+    material = f"{len(wallet_id)}:{wallet_id}{nonce}".encode("utf-8", "surrogatepass")
+    return hashlib.blake2b(material, digest_size=16).digest()
+
+
+class InMemoryNonceStore:
+    """
+    Time-bucketed in-memory NonceStore.
+
+    Each pair is stored once, as a 16-byte key mapped to the expiry bucket
+    it belongs to (expiry rounded up to `bucket_seconds`, so a pair is never
+    forgotten before its TTL). Buckets are swept as a whole once they
+    expire, so memory is bounded by the number of distinct pairs seen
+    within the TTL window and expiry costs amortized O(1) per pair.
+    """
+
+    def __init__(self, bucket_seconds: float = 1.0, *, clock: Clock = time.monotonic) -> None:
+        if bucket_seconds <= 0:
+            raise ValueError("bucket_seconds must be positive")
+        self._bucket_seconds = bucket_seconds
+        self._clock = clock
+        self._expiry: dict[bytes, int] = {}
+        self._buckets: dict[int, list[bytes]] = {}
+        self._bucket_heap: list[int] = []
+        self._lock = threading.Lock()
+
+    def check_and_record(self, wallet_id: str, nonce: str, ttl_seconds: int) -> bool:
+        key = nonce_key(wallet_id, nonce)
+        now = self._clock()
+        now_bucket = math.floor(now / self._bucket_seconds)
+
+        with self._lock:
+            self._sweep(now_bucket)
+
+            bucket = self._expiry.get(key)
+            if bucket is not None and bucket > now_bucket:
+                return False
+
+            bucket = math.ceil((now + ttl_seconds) / self._bucket_seconds)
+            self._expiry[key] = bucket
+            keys = self._buckets.get(bucket)
+            if keys is None:
+                keys = self._buckets[bucket] = []
+                heapq.heappush(self._bucket_heap, bucket)
+            keys.append(key)
+            return True
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._expiry)
+
+    def _sweep(self, now_bucket: int) -> None:
+        while self._bucket_heap and self._bucket_heap[0] <= now_bucket:
+            bucket = heapq.heappop(self._bucket_heap)
+            for key in self._buckets.pop(bucket):
+                # A key re-recorded later points at a newer bucket; keep it.
+                if self._expiry.get(key) == bucket:
+                    del self._expiry[key]
@@ -1,6 +1,12 @@
 from __future__ import annotations
 
-from dataclasses import asdict
+import asyncio
+import dataclasses
+import hashlib
+import math
+import threading
+import time
+from typing import Any, Iterable, Sequence
 
 from shield_orchestrator.bridges.adaptive_core_bridge import AdaptiveCoreBridge
 from shield_orchestrator.bridges.adn_bridge import ADNBridge
@@ -10,160 +16,890 @@ from shield_orchestrator.bridges.qwg_bridge import QWGBridge
 from shield_orchestrator.bridges.sentinel_bridge import SentinelBridge
 from shield_orchestrator.errors import TVAError
 
-from .context_hash import compute_context_hash
+from .async_bridges import AsyncComponentBridge
+from .audit_log import AuditLog
+from .canonical_json import DEFAULT_LIMITS, CanonicalLimits, LimitExceeded, to_canonical_bytes
+from .canonical_request import CanonicalRequest
+from .context_hash import compute_context_hash, compute_spliced_context_hash
 from .contracts.envelope import OrchestratorV3Request, OrchestratorV3Response, TraceEntry
 from .contracts.reason_ids import ReasonId
 from .contracts.version import CONTRACT_VERSION
+from .deadlines import BudgetLedger, Clock, DeadlineScheduler, timeout_entry
+from .executors import BridgeExecutor, InlineExecutor, skipped_entry
+from .instrumentation import StageObserver, notify_start, notify_stop, observe_stage
+from .merkle import compute_merkle_root
+from .nonce_store import NonceStore
+from .registry import BridgeRegistry
+from .response_cache import ResponseCache
+from .single_flight import SingleFlight
 
 
-def orchestrate(request: OrchestratorV3Request) -> OrchestratorV3Response:
+# Bridge evaluation order is contract-fixed.
+ComponentBridges = tuple[SentinelBridge, DQSNBridge, ADNBridge, GuardianWalletBridge, QWGBridge]
+
+# Request-independent trace entries, shared by every response, with their
+# hash material precomputed once at import time.
+_INPUT_VALIDATION_OK = TraceEntry(stage="input_validation", component="orchestrator", status="OK")
+
+# Phase 3 synthesis: deny-by-default (contract reason id: DENY_BY_POLICY)
+_DENY_BY_POLICY = (ReasonId.DENY_BY_POLICY.value,)
+_FINAL_SYNTHESIS_DENY = TraceEntry(
+    stage="final_synthesis",
+    component="orchestrator",
+    status="DENY",
+    reason_ids=_DENY_BY_POLICY,
+)
+
+_INLINE_EXECUTOR = InlineExecutor()
+
+_CONSTANT_TRACE_MATERIAL = {
+    id(_INPUT_VALIDATION_OK): _INPUT_VALIDATION_OK.to_hash_material(),
+    id(_FINAL_SYNTHESIS_DENY): _FINAL_SYNTHESIS_DENY.to_hash_material(),
+}
+
+
+class Orchestrator:
+    """
+    Orchestrator v3 over a registry of long-lived bridge instances.
+
+    Bridges and the Adaptive Core sink are built (or injected) once and
+    reused by every request; their order is validated at construction (see
+    registry.py), as is the executor's ability to run them (ValueError). The remaining options have the same meaning as the
+    keyword arguments of orchestrate() and apply to every request.
+
+    `memoize_requests` (opt-in) caches each request object's canonical
+    encoding (see CanonicalRequest.memoized), so orchestrating the same
+    request object again (retries, fan-out to several orchestrators) skips
+    re-encoding it. Payloads must not be mutated after first use.
+
+    `limits` bounds every request, `audit` records every envelope and
+    `merkle` adds Merkle roots, as for orchestrate().
+
+    Use as a context manager, or call warm_up() / close() explicitly; the
+    executor, cache and nonce store stay owned by the caller.
+    """
+
+    def __init__(
+        self,
+        bridges: Sequence[Any] | None = None,
+        sink: Any | None = None,
+        *,
+        executor: BridgeExecutor | None = None,
+        cache: ResponseCache | None = None,
+        nonces: NonceStore | None = None,
+        single_flight: SingleFlight | None = None,
+        observer: StageObserver | None = None,
+        short_circuit: bool = False,
+        memoize_requests: bool = False,
+        limits: CanonicalLimits = DEFAULT_LIMITS,
+        audit: AuditLog | None = None,
+        merkle: bool = False,
+    ) -> None:
+        self.registry = BridgeRegistry(
+            _default_bridges() if bridges is None else bridges,
+            AdaptiveCoreBridge() if sink is None else sink,
+        )
+        self.executor = executor or _INLINE_EXECUTOR
+        check_bridges = getattr(self.executor, "check_bridges", None)
+        if callable(check_bridges):
+            check_bridges(self.registry.bridges)
+        self.cache = cache
+        self.nonces = nonces
+        self.single_flight = single_flight
+        self.observer = observer
+        self.short_circuit = short_circuit
+        self.memoize_requests = memoize_requests
+        self.limits = limits
+        self.audit = audit
+        self.merkle = merkle
+
+    def warm_up(self) -> None:
+        self.registry.warm_up()
+
+    def close(self) -> None:
+        self.registry.close()
+
+    def __enter__(self) -> Orchestrator:
+        self.warm_up()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def orchestrate(self, request: OrchestratorV3Request) -> OrchestratorV3Response:
+        """Single request; see orchestrate()."""
+        return _orchestrate(
+            request,
+            bridges=self.registry.bridges,
+            sink=self.registry.sink,
+            executor=self.executor,
+            cache=self.cache,
+            nonces=self.nonces,
+            single_flight=self.single_flight,
+            observer=self.observer,
+            short_circuit=self.short_circuit,
+            memoize_requests=self.memoize_requests,
+            limits=self.limits,
+            audit=self.audit,
+            merkle=self.merkle,
+        )
+
+    def orchestrate_many(self, requests: Iterable[OrchestratorV3Request]) -> list[OrchestratorV3Response]:
+        """Batch of requests; see orchestrate_many()."""
+        evaluated: dict[str, OrchestratorV3Response] = {}
+        return [
+            _orchestrate(
+                request,
+                bridges=self.registry.bridges,
+                sink=self.registry.sink,
+                executor=self.executor,
+                cache=self.cache,
+                nonces=self.nonces,
+                single_flight=self.single_flight,
+                observer=self.observer,
+                short_circuit=self.short_circuit,
+                memoize_requests=self.memoize_requests,
+                limits=self.limits,
+                audit=self.audit,
+                merkle=self.merkle,
+                evaluated=evaluated,
+            )
+            for request in requests
+        ]
+
+    async def orchestrate_async(self, request: OrchestratorV3Request) -> OrchestratorV3Response:
+        """Concurrent component fan-out; see orchestrate_async()."""
+        return await orchestrate_async(
+            request,
+            bridges=self.registry.async_bridges,
+            sink=self.registry.sink,
+            cache=self.cache,
+            nonces=self.nonces,
+            single_flight=self.single_flight,
+            observer=self.observer,
+            short_circuit=self.short_circuit,
+            memoize_requests=self.memoize_requests,
+            limits=self.limits,
+            audit=self.audit,
+            merkle=self.merkle,
+        )
+
+
+_DEFAULT_ORCHESTRATOR: Orchestrator | None = None
+_DEFAULT_ORCHESTRATOR_LOCK = threading.Lock()
+
+
+def default_orchestrator() -> Orchestrator:
+    """
+    Process-wide Orchestrator over the default bridges, built and warmed up
+    on first use. It backs the module-level entrypoints and is never closed.
+    """
+    global _DEFAULT_ORCHESTRATOR
+    orchestrator = _DEFAULT_ORCHESTRATOR
+    if orchestrator is None:
+        with _DEFAULT_ORCHESTRATOR_LOCK:
+            orchestrator = _DEFAULT_ORCHESTRATOR
+            if orchestrator is None:
+                orchestrator = Orchestrator()
+                orchestrator.warm_up()
+                _DEFAULT_ORCHESTRATOR = orchestrator
+    return orchestrator
+
+
+def orchestrate(
+    request: OrchestratorV3Request,
+    *,
+    executor: BridgeExecutor | None = None,
+    cache: ResponseCache | None = None,
+    nonces: NonceStore | None = None,
+    single_flight: SingleFlight | None = None,
+    observer: StageObserver | None = None,
+    short_circuit: bool = False,
+    limits: CanonicalLimits = DEFAULT_LIMITS,
+    audit: AuditLog | None = None,
+    merkle: bool = False,
+) -> OrchestratorV3Response:
     """
     Orchestrator v3 public entrypoint.
 
     Phase 3 behavior:
     - strict request validation + contract_version gate
+    - the request is canonically serialized exactly once and reused by every hash
     - deterministic bridge calls in fixed order:
         Sentinel -> DQSN -> ADN -> Guardian Wallet -> QWG
+    - each bridge gets a share of the request ttl_seconds; overruns are
+      abandoned and recorded as COMPONENT_TIMEOUT (outcome DENY)
     - deny-by-default synthesis (DENY_BY_POLICY) until real allow/escalate logic is integrated
     - Adaptive Core is a read-only sink and must not affect outcome
+    - requests over `limits` (canonical size, nesting depth, key count) are
+      rejected with INVALID_REQUEST before anything is encoded or evaluated
     - hashing/serialization failures map to HASHING_FAILED (fail-closed)
+
+    `executor` selects how bridges run (see executors.py): inline by default,
+    or a ThreadExecutor / ProcessExecutor owned by the caller. Responses are
+    identical across backends.
+
+    `cache` (opt-in) replays envelopes for duplicate requests within their
+    ttl_seconds, keyed by the canonical request digest (see response_cache.py).
+
+    `nonces` (opt-in) rejects a (wallet_id, nonce) pair seen within its
+    ttl_seconds with NONCE_REPLAY before any bridge runs. The check comes
+    before the cache lookup, so a cache never answers a replayed nonce.
+
+    `single_flight` (opt-in) coalesces concurrent identical requests: while
+    one evaluation of a canonical request is in flight, callers with the
+    same digest wait for it and receive the identical envelope instead of
+    running the bridges again (see single_flight.py). The replay check
+    still runs for every caller, and each caller keeps its own fail-closed
+    boundary. Share one SingleFlight only between callers using the same
+    bridges.
+
+    `observer` (opt-in) receives per-stage wall/CPU timings (see
+    instrumentation.py); it sits outside the hashed trace.
+
+    `short_circuit` (opt-in) stops at the first component entry that is not
+    OK: the remaining components are not evaluated and are recorded as
+    deterministic SKIPPED entries. The outcome is unchanged (DENY), but the
+    trace and therefore context_hash differ from the default full-trace mode.
+
+    `audit` (opt-in) appends every envelope, with the request material its
+    context_hash covers, to an AuditLog (see audit_log.py); the write
+    happens on the log's writer thread.
+
+    `merkle` (opt-in) sets response.merkle_root, a Merkle root over the
+    verdict, the request digest and each trace entry (see merkle.py), so
+    single entries can be verified with an inclusion proof. context_hash
+    is unchanged.
+
+    Bridge instances come from default_orchestrator() and are reused across
+    calls; build an Orchestrator to inject other bridges.
     """
+    registry = default_orchestrator().registry
+    return _orchestrate(
+        request,
+        bridges=registry.bridges,
+        sink=registry.sink,
+        executor=executor or _INLINE_EXECUTOR,
+        cache=cache,
+        nonces=nonces,
+        single_flight=single_flight,
+        observer=observer,
+        short_circuit=short_circuit,
+        limits=limits,
+        audit=audit,
+        merkle=merkle,
+    )
+
+
+def orchestrate_many(
+    requests: Iterable[OrchestratorV3Request],
+    *,
+    executor: BridgeExecutor | None = None,
+    cache: ResponseCache | None = None,
+    nonces: NonceStore | None = None,
+    single_flight: SingleFlight | None = None,
+    observer: StageObserver | None = None,
+    short_circuit: bool = False,
+    limits: CanonicalLimits = DEFAULT_LIMITS,
+    audit: AuditLog | None = None,
+    merkle: bool = False,
+) -> list[OrchestratorV3Response]:
+    """
+    Batch entrypoint: responses in input order, each identical to orchestrate(request).
+
+    Amortized across the batch:
+    - bridge and sink instances are shared (see default_orchestrator())
+    - constant trace entries and their hash material are shared
+    - byte-identical requests (same canonical digest) are evaluated once
+
+    Each request keeps its own fail-closed boundary: an invalid or
+    unhashable request yields its own DENY without affecting the others.
+    `executor`, `cache`, `nonces`, `single_flight`, `observer`,
+    `short_circuit`, `limits`, `audit` and `merkle` apply to the whole batch.
+    """
+    registry = default_orchestrator().registry
+    evaluated: dict[str, OrchestratorV3Response] = {}
+
+    return [
+        _orchestrate(
+            request,
+            bridges=registry.bridges,
+            sink=registry.sink,
+            executor=executor or _INLINE_EXECUTOR,
+            cache=cache,
+            nonces=nonces,
+            single_flight=single_flight,
+            observer=observer,
+            short_circuit=short_circuit,
+            limits=limits,
+            audit=audit,
+            merkle=merkle,
+            evaluated=evaluated,
+        )
+        for request in requests
+    ]
+
+
+async def orchestrate_async(
+    request: OrchestratorV3Request,
+    *,
+    bridges: Sequence[AsyncComponentBridge] | None = None,
+    sink: AdaptiveCoreBridge | None = None,
+    cache: ResponseCache | None = None,
+    nonces: NonceStore | None = None,
+    single_flight: SingleFlight | None = None,
+    observer: StageObserver | None = None,
+    short_circuit: bool = False,
+    memoize_requests: bool = False,
+    limits: CanonicalLimits = DEFAULT_LIMITS,
+    audit: AuditLog | None = None,
+    merkle: bool = False,
+) -> OrchestratorV3Response:
+    """
+    Async entrypoint with concurrent component fan-out.
+
+    All component bridges are awaited concurrently; their entries are then
+    placed in the contract-fixed Sentinel -> DQSN -> ADN -> Guardian Wallet -> QWG
+    order, so the response (and context_hash) is identical to orchestrate().
+
+    `bridges` must be given in that canonical order. When several bridges
+    fail, the first failure in canonical order decides the reason id, exactly
+    as in the sequential path. Each bridge's run time is charged against its
+    fair share of ttl_seconds as in orchestrate() (see BudgetLedger): a
+    bridge over its share, or still running when the deadline passes (it is
+    then cancelled), is recorded as COMPONENT_TIMEOUT.
+
+    With `short_circuit`, results are collected in canonical order and the
+    bridges after the first non-OK entry are cancelled and recorded as
+    SKIPPED, matching the sync short-circuit trace. `memoize_requests` is
+    as for Orchestrator; `cache`, `nonces`, `single_flight`, `observer`,
+    `limits`, `audit` and `merkle` as for orchestrate(). As there, the replay
+    check and then the cache lookup run for every caller before it can join
+    a flight. Coalesced callers share one fan-out within the event loop;
+    cancelling one of them does not cancel it for the others.
+
+    Component stages report wall time only (cpu_seconds is 0.0): concurrent
+    coroutines share one thread, so its CPU time cannot be attributed.
+    """
+    if bridges is None:
+        bridges = default_orchestrator().registry.async_bridges
+    if sink is None:
+        sink = default_orchestrator().registry.sink
+
+    canonical: CanonicalRequest | None = None
     try:
-        _validate_request(request)
+        with observe_stage(observer, "input_validation"):
+            _validate_request(request)
+        with observe_stage(observer, "canonicalize"):
+            canonical = _canonicalize(request, limits, memoize=memoize_requests)
 
-        trace: list[TraceEntry] = [
-            TraceEntry(stage="input_validation", component="orchestrator", status="OK")
-        ]
+        response = await _serve_async(
+            canonical,
+            bridges=bridges,
+            sink=sink,
+            cache=cache,
+            nonces=nonces,
+            single_flight=single_flight,
+            observer=observer,
+            short_circuit=short_circuit,
+        )
+
+    except TVAError as e:
+        canonical = None
+        response = _fail_closed(request, e.reason_id)
+
+    except Exception:
+        canonical = None
+        response = _internal_error(request)
+
+    if merkle:
+        response = _with_merkle_root(request, response, canonical)
+    if audit is not None:
+        audit.record(request, response, canonical)
+    return response
+
+
+async def _serve_async(
+    canonical: CanonicalRequest,
+    *,
+    bridges: Sequence[AsyncComponentBridge],
+    sink: AdaptiveCoreBridge,
+    cache: ResponseCache | None,
+    nonces: NonceStore | None,
+    single_flight: SingleFlight | None,
+    observer: StageObserver | None,
+    short_circuit: bool,
+) -> OrchestratorV3Response:
+    """
+    Async counterpart of _serve(): the per-caller replay check and cache
+    lookup, then one (possibly coalesced) fan-out.
+    """
+    _check_replay(canonical.request, nonces)
+
+    cache_key = _cache_key(canonical, short_circuit=short_circuit)
+    cached = cache.get(cache_key) if cache is not None else None
+    if cached is not None:
+        return cached
+
+    async def evaluate() -> OrchestratorV3Response:
+        response = await _evaluate_async(
+            canonical, bridges=bridges, sink=sink, observer=observer, short_circuit=short_circuit
+        )
+        if cache is not None:
+            cache.put(cache_key, response, ttl_seconds=canonical.request.ttl_seconds)
+        return response
+
+    if single_flight is None:
+        return await evaluate()
+    return await single_flight.do_async(cache_key, evaluate)
+
+
+async def _evaluate_async(
+    canonical: CanonicalRequest,
+    *,
+    bridges: Sequence[AsyncComponentBridge],
+    sink: AdaptiveCoreBridge,
+    observer: StageObserver | None,
+    short_circuit: bool,
+) -> OrchestratorV3Response:
+    request = canonical.request
+    deadline = DeadlineScheduler(request.ttl_seconds, len(bridges))
+    timeout = deadline.remaining()
+
+    tasks = [
+        asyncio.ensure_future(
+            asyncio.wait_for(_observed_async(b, canonical, observer), timeout)
+        )
+        for b in bridges
+    ]
+    try:
+        entries = await _collect_async(bridges, tasks, deadline=deadline, short_circuit=short_circuit)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    return _complete(canonical, entries, sink=sink, observer=observer)
+
+
+async def _observed_async(
+    bridge: AsyncComponentBridge, canonical: CanonicalRequest, observer: StageObserver | None
+) -> tuple[TraceEntry, float]:
+    """The bridge's entry and its run time (wall seconds)."""
+    if observer is not None:
+        notify_start(observer, bridge.STAGE)
+    started = time.perf_counter()
+    ok = False
+    try:
+        entry = await bridge.evaluate_v3_async(canonical.request, canonical=canonical)
+        ok = True
+    finally:
+        run_seconds = time.perf_counter() - started
+        if observer is not None:
+            notify_stop(observer, bridge.STAGE, wall_seconds=run_seconds, cpu_seconds=0.0, ok=ok)
+    return entry, run_seconds
+
+
+async def _collect_async(
+    bridges: Sequence[AsyncComponentBridge],
+    tasks: Sequence[asyncio.Future],
+    *,
+    deadline: DeadlineScheduler,
+    short_circuit: bool,
+) -> list[TraceEntry]:
+    """
+    Await component tasks in canonical order. The first failure in that
+    order is raised; with short_circuit, later components are SKIPPED.
+
+    Run times are charged against each component's fair share exactly as
+    the pool executors do (see BudgetLedger), so a component over its share
+    is a COMPONENT_TIMEOUT here as in orchestrate().
+    """
+    ledger = BudgetLedger(deadline)
+    entries: list[TraceEntry] = []
+    decided = False
+    for bridge, task in zip(bridges, tasks):
+        if decided:
+            entries.append(skipped_entry(bridge))
+            continue
+
+        budget = ledger.next_budget()
+        if budget <= 0:
+            # Sequential evaluation would not have started this bridge.
+            task.cancel()
+            entries.append(timeout_entry(bridge))
+            decided = short_circuit
+            continue
 
-        # Fixed, deterministic bridge order (no order dependence)
         try:
-            trace.append(SentinelBridge().evaluate_v3(request))
-            trace.append(DQSNBridge().evaluate_v3(request))
-            trace.append(ADNBridge().evaluate_v3(request))
-            trace.append(GuardianWalletBridge().evaluate_v3(request))
-            trace.append(QWGBridge().evaluate_v3(request))
-        except TypeError as e:
-            # Most common: non-JSON-serializable payload encountered during hashing in a bridge stub.
-            raise TVAError(ReasonId.HASHING_FAILED.value, "hashing failed") from e
+            entry, run_seconds = await task
+        except asyncio.TimeoutError:
+            ledger.charge(math.inf)  # it ran past the request deadline
+            entry = timeout_entry(bridge)
         except Exception as e:
-            raise TVAError(ReasonId.COMPONENT_ERROR.value, "component error") from e
-
-        # Phase 3 synthesis: deny-by-default (contract reason id: DENY_BY_POLICY)
-        outcome = "DENY"
-        reason_ids = (ReasonId.DENY_BY_POLICY.value,)
-
-        trace.append(
-            TraceEntry(
-                stage="final_synthesis",
-                component="orchestrator",
-                status="DENY",
-                reason_ids=reason_ids,
-            )
+            raise _component_failure(e) from e
+        else:
+            ledger.charge(run_seconds)
+            if run_seconds > budget:
+                entry = timeout_entry(bridge)
+
+        entries.append(entry)
+        decided = short_circuit and entry.status != "OK"
+
+    return entries
+
+
+def _default_bridges() -> ComponentBridges:
+    return (SentinelBridge(), DQSNBridge(), ADNBridge(), GuardianWalletBridge(), QWGBridge())
+
+
+def _orchestrate(
+    request: OrchestratorV3Request,
+    *,
+    bridges: ComponentBridges,
+    sink: AdaptiveCoreBridge,
+    executor: BridgeExecutor = _INLINE_EXECUTOR,
+    cache: ResponseCache | None = None,
+    nonces: NonceStore | None = None,
+    single_flight: SingleFlight | None = None,
+    observer: StageObserver | None = None,
+    short_circuit: bool = False,
+    memoize_requests: bool = False,
+    limits: CanonicalLimits = DEFAULT_LIMITS,
+    audit: AuditLog | None = None,
+    merkle: bool = False,
+    evaluated: dict[str, OrchestratorV3Response] | None = None,
+    clock: Clock = time.monotonic,
+) -> OrchestratorV3Response:
+    """
+    Single fail-closed orchestration over the given bridge instances.
+
+    `evaluated` (batch only) maps canonical request digests to responses
+    already produced in the same batch. Short-circuit envelopes are cached
+    under their own key, so the two modes never answer for each other.
+    """
+    canonical: CanonicalRequest | None = None
+    try:
+        with observe_stage(observer, "input_validation"):
+            _validate_request(request)
+        with observe_stage(observer, "canonicalize"):
+            canonical = _canonicalize(request, limits, memoize=memoize_requests)
+
+        response = _serve(
+            canonical,
+            bridges=bridges,
+            sink=sink,
+            executor=executor,
+            cache=cache,
+            nonces=nonces,
+            single_flight=single_flight,
+            observer=observer,
+            short_circuit=short_circuit,
+            evaluated=evaluated,
+            clock=clock,
         )
 
-        # Adaptive Core sink (must not influence outcome)
-        try:
-            sink_entry = AdaptiveCoreBridge().report_v3(
-                request, outcome=outcome, reason_ids=reason_ids
-            )
-        except Exception:
-            sink_entry = TraceEntry(
-                stage="adaptive_core",
-                component="adaptive_core",
-                status="ERROR",
-                reason_ids=(ReasonId.COMPONENT_ERROR.value,),
-                notes="phase3_sink_failed",
+    except TVAError as e:
+        canonical = None
+        response = _fail_closed(request, e.reason_id)
+
+    except Exception:
+        canonical = None
+        response = _internal_error(request)
+
+    if merkle:
+        response = _with_merkle_root(request, response, canonical)
+    if audit is not None:
+        audit.record(request, response, canonical)
+    return response
+
+
+def _serve(
+    canonical: CanonicalRequest,
+    *,
+    bridges: ComponentBridges,
+    sink: AdaptiveCoreBridge,
+    executor: BridgeExecutor,
+    cache: ResponseCache | None,
+    nonces: NonceStore | None,
+    single_flight: SingleFlight | None,
+    observer: StageObserver | None,
+    short_circuit: bool,
+    evaluated: dict[str, OrchestratorV3Response] | None,
+    clock: Clock,
+) -> OrchestratorV3Response:
+    """
+    Replay check, cache and evaluation of a canonicalized request.
+
+    The replay check runs per caller, before the cache lookup and before
+    joining a single flight, so a duplicate nonce fails closed even when
+    its twin's envelope is cached or still in flight.
+    """
+    request = canonical.request
+    _check_replay(request, nonces)
+
+    cache_key = _cache_key(canonical, short_circuit=short_circuit)
+    cached = cache.get(cache_key) if cache is not None else None
+    if cached is not None:
+        return cached
+
+    if evaluated is not None and canonical.digest in evaluated:
+        return evaluated[canonical.digest]
+
+    def evaluate() -> OrchestratorV3Response:
+        response = _evaluate(
+            canonical,
+            bridges=bridges,
+            sink=sink,
+            executor=executor,
+            observer=observer,
+            short_circuit=short_circuit,
+            clock=clock,
+        )
+        if cache is not None:
+            cache.put(cache_key, response, ttl_seconds=request.ttl_seconds)
+        return response
+
+    response = evaluate() if single_flight is None else single_flight.do(cache_key, evaluate)
+    if evaluated is not None:
+        evaluated[canonical.digest] = response
+    return response
+
+
+def _check_replay(request: OrchestratorV3Request, nonces: NonceStore | None) -> None:
+    if nonces is not None and not nonces.check_and_record(
+        request.wallet_id, request.nonce, request.ttl_seconds
+    ):
+        raise TVAError(ReasonId.NONCE_REPLAY.value, "nonce already used")
+
+
+def _evaluate(
+    canonical: CanonicalRequest,
+    *,
+    bridges: ComponentBridges,
+    sink: AdaptiveCoreBridge,
+    executor: BridgeExecutor,
+    observer: StageObserver | None = None,
+    short_circuit: bool = False,
+    clock: Clock = time.monotonic,
+) -> OrchestratorV3Response:
+    deadline = DeadlineScheduler(canonical.request.ttl_seconds, len(bridges), clock=clock)
+
+    # Fixed, deterministic bridge order (no order dependence)
+    try:
+        entries = executor.evaluate(canonical, bridges, deadline, observer, short_circuit)
+    except Exception as e:
+        raise _component_failure(e) from e
+
+    return _complete(canonical, entries, sink=sink, observer=observer)
+
+
+def _cache_key(canonical: CanonicalRequest, *, short_circuit: bool) -> str:
+    return f"{canonical.digest}:short_circuit" if short_circuit else canonical.digest
+
+
+def _component_failure(exc: BaseException) -> TVAError:
+    if isinstance(exc, TVAError):
+        # Bridges may already classify their failure (e.g. COMPONENT_INVALID_RESPONSE).
+        return exc
+    if isinstance(exc, TypeError):
+        # Non-JSON-serializable material encountered during hashing in a bridge.
+        return TVAError(ReasonId.HASHING_FAILED.value, "hashing failed")
+    return TVAError(ReasonId.COMPONENT_ERROR.value, "component error")
+
+
+def _complete(
+    canonical: CanonicalRequest,
+    component_entries: Sequence[TraceEntry],
+    *,
+    sink: AdaptiveCoreBridge,
+    observer: StageObserver | None = None,
+) -> OrchestratorV3Response:
+    """
+    Synthesis, Adaptive Core sink and final hashing over component entries
+    already in canonical order.
+    """
+    request = canonical.request
+    trace: list[TraceEntry] = [_INPUT_VALIDATION_OK, *component_entries]
+
+    with observe_stage(observer, "final_synthesis"):
+        outcome, reason_ids, synthesis_entry = _synthesize(component_entries)
+    trace.append(synthesis_entry)
+
+    # Adaptive Core sink (must not influence outcome)
+    try:
+        with observe_stage(observer, "adaptive_core"):
+            sink_entry = sink.report_v3(
+                request, outcome=outcome, reason_ids=reason_ids, canonical=canonical
             )
+    except Exception:
+        sink_entry = TraceEntry(
+            stage="adaptive_core",
+            component="adaptive_core",
+            status="ERROR",
+            reason_ids=(ReasonId.COMPONENT_ERROR.value,),
+            notes="phase3_sink_failed",
+        )
 
-        full_trace = tuple(trace + [sink_entry])
+    full_trace = tuple(trace + [sink_entry])
 
-        # Hash the full request material (including payload). If it fails -> HASHING_FAILED.
-        try:
+    # Hash the full request material (including payload, spliced from the
+    # single canonical encoding). If it fails -> HASHING_FAILED.
+    try:
+        with observe_stage(observer, "context_hash"):
             hash_material = {
-                "request": _request_for_hash(request, include_payload=True),
                 "outcome": outcome,
                 "reason_ids": list(reason_ids),
-                "trace": [asdict(t) for t in full_trace],
+                "trace": [_trace_material(t) for t in full_trace],
             }
-            context_hash = compute_context_hash(hash_material)
-        except TypeError as e:
-            raise TVAError(ReasonId.HASHING_FAILED.value, "hashing failed") from e
-
-        return OrchestratorV3Response(
-            contract_version=CONTRACT_VERSION,
-            outcome=outcome,
-            context_hash=context_hash,
-            reason_ids=reason_ids,
-            trace=full_trace,
-        )
+            context_hash = compute_spliced_context_hash(
+                hash_material, {"request": canonical.canonical}
+            )
+    except TypeError as e:
+        raise TVAError(ReasonId.HASHING_FAILED.value, "hashing failed") from e
 
-    except TVAError as e:
-        # Build a deterministic DENY response without ever re-hashing the payload.
-        trace = (
-            TraceEntry(
-                stage="fail_closed",
-                component="orchestrator",
-                status="DENY",
-                reason_ids=(e.reason_id,),
-                notes="tva_error",
-            ),
-        )
+    return OrchestratorV3Response(
+        contract_version=CONTRACT_VERSION,
+        outcome=outcome,
+        context_hash=context_hash,
+        reason_ids=reason_ids,
+        trace=full_trace,
+    )
 
-        # Always omit payload in failure hashing to avoid recursive serialization errors.
-        hash_material = {
-            "request": _request_for_hash(request, include_payload=False),
-            "outcome": "DENY",
-            "reason_ids": [e.reason_id],
-            "trace": [asdict(t) for t in trace],
-        }
-        context_hash = compute_context_hash(hash_material)
-
-        return OrchestratorV3Response(
-            contract_version=CONTRACT_VERSION,
-            outcome="DENY",
-            context_hash=context_hash,
-            reason_ids=(e.reason_id,),
-            trace=trace,
-        )
 
-    except Exception:
-        trace = (
-            TraceEntry(
-                stage="internal_error",
-                component="orchestrator",
-                status="DENY",
-                reason_ids=(ReasonId.INTERNAL_ERROR.value,),
-            ),
-        )
+def _synthesize(component_entries: Sequence[TraceEntry]) -> tuple[str, tuple[str, ...], TraceEntry]:
+    """
+    Phase 3 synthesis: always DENY.
+
+    Component reason ids (e.g. COMPONENT_TIMEOUT) are surfaced in pipeline
+    order; with none, the contract reason id is DENY_BY_POLICY.
+    """
+    component_reasons: list[str] = []
+    for entry in component_entries:
+        for reason_id in entry.reason_ids:
+            if reason_id not in component_reasons:
+                component_reasons.append(reason_id)
+
+    if not component_reasons:
+        return "DENY", _DENY_BY_POLICY, _FINAL_SYNTHESIS_DENY
+
+    reason_ids = tuple(component_reasons)
+    return "DENY", reason_ids, TraceEntry(
+        stage="final_synthesis",
+        component="orchestrator",
+        status="DENY",
+        reason_ids=reason_ids,
+    )
+
+
+def _trace_material(entry: TraceEntry) -> dict:
+    # Shared constant entries reuse their import-time material (ids are stable
+    # because the constants live for the whole process).
+    material = _CONSTANT_TRACE_MATERIAL.get(id(entry))
+    return material if material is not None else entry.to_hash_material()
 
-        hash_material = {
-            "request": _request_for_hash(request, include_payload=False),
-            "outcome": "DENY",
-            "reason_ids": [ReasonId.INTERNAL_ERROR.value],
-            "trace": [asdict(t) for t in trace],
-        }
-        context_hash = compute_context_hash(hash_material)
-
-        return OrchestratorV3Response(
-            contract_version=CONTRACT_VERSION,
-            outcome="DENY",
-            context_hash=context_hash,
+
+def _fail_closed(request: OrchestratorV3Request, reason_id: str) -> OrchestratorV3Response:
+    # Build a deterministic DENY response without ever re-hashing the payload.
+    return _deny(
+        request,
+        TraceEntry(
+            stage="fail_closed",
+            component="orchestrator",
+            status="DENY",
+            reason_ids=(reason_id,),
+            notes="tva_error",
+        ),
+    )
+
+
+def _internal_error(request: OrchestratorV3Request) -> OrchestratorV3Response:
+    return _deny(
+        request,
+        TraceEntry(
+            stage="internal_error",
+            component="orchestrator",
+            status="DENY",
             reason_ids=(ReasonId.INTERNAL_ERROR.value,),
-            trace=trace,
-        )
+        ),
+    )
+
+
+def _deny(request: OrchestratorV3Request, entry: TraceEntry) -> OrchestratorV3Response:
+    """
+    Deterministic single-entry DENY response for fail-closed paths.
+    """
+    trace = (entry,)
+
+    # Always omit payload in failure hashing to avoid recursive serialization errors.
+    hash_material = {
+        "request": _request_for_hash(request, include_payload=False),
+        "outcome": "DENY",
+        "reason_ids": list(entry.reason_ids),
+        "trace": [t.to_hash_material() for t in trace],
+    }
+
+    return OrchestratorV3Response.deny(
+        context_hash=compute_context_hash(hash_material),
+        reason_ids=entry.reason_ids,
+        trace=trace,
+    )
+
+
+def _canonicalize(
+    request: OrchestratorV3Request, limits: CanonicalLimits, *, memoize: bool = False
+) -> CanonicalRequest:
+    """
+    Serialize the validated request once for every downstream hash (or
+    reuse the memoized encoding of this request object).
+
+    A request over `limits` maps to INVALID_REQUEST; the limits are checked
+    in the same pass as the canonicalization rules, before encoding. Any
+    other canonicalization failure (non-serializable value, circular
+    reference, unencodable string) maps to HASHING_FAILED.
+    """
+    try:
+        if memoize:
+            return CanonicalRequest.memoized(request, limits)
+        return CanonicalRequest.from_request(request, limits)
+    except LimitExceeded as e:
+        raise TVAError(ReasonId.INVALID_REQUEST.value, str(e)) from e
+    except (TypeError, ValueError, RecursionError) as e:
+        raise TVAError(ReasonId.HASHING_FAILED.value, "hashing failed") from e
+
+
+def _with_merkle_root(
+    request: OrchestratorV3Request,
+    response: OrchestratorV3Response,
+    canonical: CanonicalRequest | None,
+) -> OrchestratorV3Response:
+    """
+    Attach the Merkle root. The request leaf is the digest the flat hash
+    covered: the full request when `canonical` is given, the request without
+    payload on fail-closed paths (left without a root if even that fails).
+    """
+    try:
+        if canonical is not None:
+            digest = canonical.digest
+        else:
+            material = _request_for_hash(request, include_payload=False)
+            digest = hashlib.sha256(to_canonical_bytes(material)).hexdigest()
+        return dataclasses.replace(response, merkle_root=compute_merkle_root(digest, response))
+    except (TypeError, ValueError, RecursionError):
+        return response
 
 
 def _request_for_hash(request: OrchestratorV3Request, *, include_payload: bool) -> dict:
     """
     Deterministic request material for hashing.
 
-    include_payload=True is the normal path.
+    include_payload=True hashes the full request (the success path splices
+    CanonicalRequest.canonical instead of re-encoding it).
     include_payload=False is used for fail-closed responses to avoid
     non-serializable payload causing recursive hashing failures.
     """
-    d = asdict(request)
+    d = request.to_hash_material()
     if not include_payload:
-        d = dict(d)
         d["payload"] = None
     return d
 
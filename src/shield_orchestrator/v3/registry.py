@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import threading
+from typing import Any, Sequence
+
+from .async_bridges import SyncBridgeAdapter
+
+
+# Contract-fixed component order (Sentinel -> DQSN -> ADN -> Guardian Wallet -> QWG).
+CANONICAL_COMPONENTS = ("sentinel_ai", "dqsn", "adn", "guardian_wallet", "qwg")
+
+
+class BridgeRegistry:
+    """
+    Long-lived component bridge instances plus the Adaptive Core sink.
+
+    The component order is validated once at construction against
+    CANONICAL_COMPONENTS; a registry in any other order cannot be built.
+
+    Lifecycle hooks are optional on each bridge:
+    - warm_up(): open connections, load models (called once, in order)
+    - close(): release resources (called once, in reverse order)
+
+    Bridges are shared by every request evaluated through the registry, so
+    they must be safe to call concurrently when used with a ThreadExecutor
+    or from several threads.
+    """
+
+    def __init__(self, bridges: Sequence[Any], sink: Any) -> None:
+        bridges = tuple(bridges)
+        components = tuple(getattr(b, "COMPONENT", None) for b in bridges)
+        if components != CANONICAL_COMPONENTS:
+            raise ValueError(
+                f"bridges must be in canonical order {list(CANONICAL_COMPONENTS)}, got {list(components)}"
+            )
+        for bridge in bridges:
+            if not callable(getattr(bridge, "evaluate_v3", None)):
+                raise ValueError(f"bridge {bridge.COMPONENT!r} has no evaluate_v3()")
+        if not callable(getattr(sink, "report_v3", None)):
+            raise ValueError("sink has no report_v3()")
+
+        self.bridges = bridges
+        self.sink = sink
+        # Native async bridges are used as-is; sync ones run inline on the loop.
+        self.async_bridges = tuple(
+            b if callable(getattr(b, "evaluate_v3_async", None)) else SyncBridgeAdapter(b)
+            for b in bridges
+        )
+
+        self._lock = threading.Lock()
+        self._warm = False
+        self._closed = False
+
+    def warm_up(self) -> None:
+        """
+        Call every warm_up() hook once. If one fails, the bridges already
+        warmed are closed again and the error is re-raised.
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("bridge registry is closed")
+            if self._warm:
+                return
+
+            warmed: list[Any] = []
+            try:
+                for instance in (*self.bridges, self.sink):
+                    _call_hook(instance, "warm_up")
+                    warmed.append(instance)
+            except BaseException:
+                _close_all(warmed)
+                raise
+            self._warm = True
+
+    def close(self) -> None:
+        """
+        Call every close() hook once, in reverse order. All hooks run even
+        if one fails; the first error is then re-raised.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            _close_all((*self.bridges, self.sink))
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+
+def _call_hook(instance: Any, name: str) -> None:
+    hook = getattr(instance, name, None)
+    if callable(hook):
+        hook()
+
+
+def _close_all(instances: Sequence[Any]) -> None:
+    first_error: BaseException | None = None
+    for instance in reversed(instances):
+        try:
+            _call_hook(instance, "close")
+        except Exception as e:
+            first_error = first_error or e
+    if first_error is not None:
+        raise first_error
@@ -0,0 +1,354 @@
+"""
+Offline replay of recorded v3 traffic.
+
+Streams a JSONL file through orchestrate() and checks that every envelope
+(and so every context_hash) is reproduced exactly:
+
+    shield-replay traffic.jsonl [--workers 8] [--record baseline.jsonl]
+    python -m shield_orchestrator.v3.replay traffic.jsonl
+
+Each line is either a recorded envelope {"request": {...}, "response": {...}}
+(the AuditLog record format, or the output of --record), which is replayed
+and compared, or a bare request object, which is only replayed. Use
+--record with a known-good release to produce a baseline from bare
+requests, then replay the baseline with the new release.
+
+Lines are read lazily and handed to worker processes in chunks through a
+bounded window, so memory stays constant however large the file is; results
+come back in input order. Exit status is 1 if any envelope differs or any
+line is invalid.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import IO, Any, Iterable, Iterator, Sequence
+
+from .canonical_json import to_canonical_bytes
+from .contracts.envelope import OrchestratorV3Request
+from .orchestrate import default_orchestrator, orchestrate
+
+# Latency histogram resolution: buckets grow by 1%, so percentiles are
+# reported within 1% of the true value in constant memory.
+_BUCKET_GROWTH = 1.01
+_LOG_GROWTH = math.log(_BUCKET_GROWTH)
+
+_FAIL_CLOSED_STAGES = ("fail_closed", "internal_error")
+
+
+@dataclass(frozen=True)
+class Mismatch:
+    """
+    One line whose replay did not reproduce its recorded envelope.
+
+    kind: "context_hash" (hash differs), "envelope" (same hash, other
+    fields differ) or "invalid" (the line is not a request or record).
+    """
+    line: int
+    kind: str
+    expected: str | None = None
+    actual: str | None = None
+
+
+class LatencyHistogram:
+    """
+    Log-bucketed latency histogram: constant memory, mergeable across
+    processes, percentiles accurate to 1%.
+    """
+
+    __slots__ = ("buckets", "count")
+
+    def __init__(self) -> None:
+        self.buckets: dict[int, int] = {}
+        self.count = 0
+
+    def record(self, seconds: float) -> None:
+        bucket = math.ceil(math.log(max(seconds, 1e-9) * 1e9) / _LOG_GROWTH)
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+        self.count += 1
+
+    def merge(self, other: LatencyHistogram) -> None:
+        for bucket, n in other.buckets.items():
+            self.buckets[bucket] = self.buckets.get(bucket, 0) + n
+        self.count += other.count
+
+    def percentile(self, q: float) -> float:
+        """Upper bound (seconds) of the bucket holding the q-quantile."""
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(q * self.count))
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                return _BUCKET_GROWTH**bucket / 1e9
+        raise AssertionError("unreachable")  # pragma: no cover
+
+
+@dataclass
+class ReplayReport:
+    """
+    Aggregated replay results.
+
+    `unreplayable` counts fail-closed records whose payload was not
+    recorded (the AuditLog stores payload null for them) and whose replay
+    therefore cannot reproduce the original failure; they are not
+    mismatches. `samples` keeps the first mismatches for the report.
+    """
+    requests: int = 0
+    compared: int = 0
+    matched: int = 0
+    mismatched: int = 0
+    invalid: int = 0
+    unreplayable: int = 0
+    elapsed_seconds: float = 0.0
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    samples: list[Mismatch] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.mismatched and not self.invalid
+
+    @property
+    def requests_per_second(self) -> float:
+        return self.requests / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "compared": self.compared,
+            "matched": self.matched,
+            "mismatched": self.mismatched,
+            "invalid": self.invalid,
+            "unreplayable": self.unreplayable,
+            "elapsed_seconds": self.elapsed_seconds,
+            "requests_per_second": self.requests_per_second,
+            "latency_us": {
+                f"p{q * 100:g}": self.latency.percentile(q) * 1e6 for q in (0.5, 0.9, 0.99, 0.999)
+            },
+            "samples": [vars(m) for m in self.samples],
+        }
+
+
+@dataclass
+class _ChunkResult:
+    requests: int = 0
+    compared: int = 0
+    matched: int = 0
+    invalid: int = 0
+    unreplayable: int = 0
+    mismatches: list[Mismatch] = field(default_factory=list)
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    records: list[bytes] | None = None
+
+
+def iter_lines(stream: IO[bytes]) -> Iterator[tuple[int, bytes]]:
+    """(1-based line number, line) for every non-blank line, read lazily."""
+    for number, line in enumerate(stream, 1):
+        if line.strip():
+            yield number, line
+
+
+def replay_chunk(chunk: Sequence[tuple[int, bytes]], record: bool = False) -> _ChunkResult:
+    """
+    Replay one chunk of lines through orchestrate() (runs in the workers).
+    With `record`, also return one {"request", "response"} line per request.
+    """
+    result = _ChunkResult(records=[] if record else None)
+    for number, line in chunk:
+        try:
+            doc = json.loads(line)
+            recorded = "request" in doc and "response" in doc
+            request_doc = doc["request"] if recorded else doc
+            request = OrchestratorV3Request(**request_doc)
+        except (ValueError, TypeError, KeyError):
+            result.invalid += 1
+            result.mismatches.append(Mismatch(number, "invalid"))
+            continue
+
+        # Envelopes recorded with a Merkle root are replayed in Merkle mode.
+        expected = doc["response"] if recorded else None
+        merkle = isinstance(expected, dict) and expected.get("merkle_root") is not None
+        t0 = time.perf_counter()
+        response = orchestrate(request, merkle=merkle)
+        result.latency.record(time.perf_counter() - t0)
+        result.requests += 1
+
+        actual = to_canonical_bytes(response.to_hash_material())
+        if result.records is not None:
+            result.records.append(
+                b'{"request":' + _request_bytes(request) + b',"response":' + actual + b"}\n"
+            )
+        if not recorded:
+            continue
+
+        result.compared += 1
+        try:
+            expected_bytes = to_canonical_bytes(expected)
+        except (TypeError, ValueError):
+            expected_bytes = b""
+        if expected_bytes == actual:
+            result.matched += 1
+        elif request.payload is None and _is_fail_closed(expected):
+            result.unreplayable += 1
+        else:
+            expected_hash = expected.get("context_hash") if isinstance(expected, dict) else None
+            kind = "envelope" if expected_hash == response.context_hash else "context_hash"
+            result.mismatches.append(Mismatch(number, kind, expected_hash, response.context_hash))
+    return result
+
+
+def replay(
+    lines: Iterable[tuple[int, bytes]],
+    *,
+    workers: int = 1,
+    chunk_size: int = 256,
+    max_inflight: int | None = None,
+    record_to: IO[bytes] | None = None,
+    max_samples: int = 20,
+) -> ReplayReport:
+    """
+    Replay `lines` (see iter_lines) and aggregate a report.
+
+    With workers > 1, chunks run in a process pool; at most `max_inflight`
+    chunks (default 2 per worker) are read ahead, which bounds memory.
+    `record_to` receives the produced envelopes in input order.
+    """
+    report = ReplayReport()
+    record = record_to is not None
+    t0 = time.perf_counter()
+
+    for result in _run_chunks(_chunks(lines, chunk_size), workers, max_inflight or 2 * workers, record):
+        report.requests += result.requests
+        report.compared += result.compared
+        report.matched += result.matched
+        report.invalid += result.invalid
+        report.unreplayable += result.unreplayable
+        report.mismatched += len(result.mismatches) - result.invalid
+        report.latency.merge(result.latency)
+        report.samples.extend(result.mismatches[: max(0, max_samples - len(report.samples))])
+        if record_to is not None and result.records:
+            record_to.writelines(result.records)
+
+    report.elapsed_seconds = time.perf_counter() - t0
+    return report
+
+
+def _chunks(lines: Iterable[tuple[int, bytes]], size: int) -> Iterator[list[tuple[int, bytes]]]:
+    chunk: list[tuple[int, bytes]] = []
+    for item in lines:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _run_chunks(
+    chunks: Iterator[list[tuple[int, bytes]]], workers: int, max_inflight: int, record: bool
+) -> Iterator[_ChunkResult]:
+    if workers <= 1:
+        for chunk in chunks:
+            yield replay_chunk(chunk, record)
+        return
+
+    # Not Pool.imap(): its feeder thread drains the whole input eagerly.
+    window: deque[Future[_ChunkResult]] = deque()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_warm_up) as pool:
+        for chunk in chunks:
+            window.append(pool.submit(replay_chunk, chunk, record))
+            if len(window) >= max_inflight:
+                yield window.popleft().result()
+        while window:
+            yield window.popleft().result()
+
+
+def _warm_up() -> None:
+    default_orchestrator()
+
+
+def _request_bytes(request: OrchestratorV3Request) -> bytes:
+    # As recorded by AuditLog: payload null when it cannot be encoded.
+    material = request.to_hash_material()
+    try:
+        return to_canonical_bytes(material)
+    except (TypeError, ValueError, RecursionError):
+        material["payload"] = None
+        try:
+            return to_canonical_bytes(material)
+        except (TypeError, ValueError, RecursionError):
+            return b"null"
+
+
+def _is_fail_closed(response: Any) -> bool:
+    try:
+        trace = response["trace"]
+        return len(trace) == 1 and trace[0]["stage"] in _FAIL_CLOSED_STAGES
+    except (TypeError, KeyError, IndexError):
+        return False
+
+
+def _print_report(report: ReplayReport, out: IO[str]) -> None:
+    print(
+        f"requests={report.requests} compared={report.compared} matched={report.matched} "
+        f"mismatched={report.mismatched} invalid={report.invalid} unreplayable={report.unreplayable}",
+        file=out,
+    )
+    print(f"elapsed={report.elapsed_seconds:.3f}s throughput={report.requests_per_second:.1f} req/s", file=out)
+    print(
+        "latency_us "
+        + " ".join(f"{k}={v:.1f}" for k, v in report.to_dict()["latency_us"].items()),
+        file=out,
+    )
+    for m in report.samples:
+        print(f"line {m.line}: {m.kind} expected={m.expected} actual={m.actual}", file=out)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="shield-replay", description="Replay recorded v3 traffic and verify envelopes."
+    )
+    parser.add_argument("input", help="JSONL file of requests or recorded envelopes ('-' for stdin)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=256)
+    parser.add_argument("--max-inflight", type=int, default=None, help="chunks read ahead (default 2 per worker)")
+    parser.add_argument("--record", metavar="PATH", help="write produced envelopes as JSONL")
+    parser.add_argument("--max-samples", type=int, default=20, help="mismatches listed in the report")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    stream = sys.stdin.buffer if args.input == "-" else open(args.input, "rb")
+    record_to = open(args.record, "wb") if args.record else None
+    try:
+        report = replay(
+            iter_lines(stream),
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+            max_inflight=args.max_inflight,
+            record_to=record_to,
+            max_samples=args.max_samples,
+        )
+    finally:
+        if stream is not sys.stdin.buffer:
+            stream.close()
+        if record_to is not None:
+            record_to.close()
+
+    if args.json:
+        print(json.dumps(report.to_dict(), indent=2, sort_keys=True))
+    else:
+        _print_report(report, sys.stdout)
+    return 0 if report.ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from .contracts.envelope import OrchestratorV3Response
+from .deadlines import Clock
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """
+    Point-in-time cache counters.
+    """
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    size: int
+
+
+class ResponseCache:
+    """
+    Opt-in bounded LRU + TTL cache of v3 responses.
+
+    - keyed by the canonical request digest (CanonicalRequest.digest)
+    - an entry expires `ttl_seconds` (of the request that produced it) after
+      it was stored
+    - only completed envelopes without ERROR trace entries are stored;
+      fail-closed responses, timeouts and component errors are never cached
+
+    Orchestration is deterministic, so a hit returns exactly the envelope a
+    fresh evaluation would produce. Thread-safe.
+    """
+
+    def __init__(self, max_entries: int = 4096, *, clock: Clock = time.monotonic) -> None:
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self._max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, OrchestratorV3Response]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def get(self, digest: str) -> OrchestratorV3Response | None:
+        with self._lock:
+            item = self._entries.get(digest)
+            if item is None:
+                self._misses += 1
+                return None
+
+            expires_at, response = item
+            if self._clock() >= expires_at:
+                del self._entries[digest]
+                self._expirations += 1
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(digest)
+            self._hits += 1
+            return response
+
+    def put(self, digest: str, response: OrchestratorV3Response, *, ttl_seconds: int) -> bool:
+        """
+        Store a response; returns False if it is not cacheable.
+        """
+        if not is_cacheable(response):
+            return False
+
+        with self._lock:
+            self._entries[digest] = (self._clock() + ttl_seconds, response)
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+        return True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                size=len(self._entries),
+            )
+
+
+def is_cacheable(response: OrchestratorV3Response) -> bool:
+    """
+    Only fully evaluated envelopes with no ERROR entries may be replayed.
+    """
+    return len(response.trace) > 1 and all(t.status != "ERROR" for t in response.trace)
@@ -0,0 +1,617 @@
+"""
+Local orchestrator service: pre-forked workers behind a Unix domain socket.
+
+Wire format (one frame per message, both directions, as in transport.py):
+
+    4-byte big-endian length | UTF-8 canonical JSON body
+
+Request body:  an OrchestratorV3Request (its to_hash_material())
+Response body: the envelope (OrchestratorV3Response.to_hash_material()),
+               or {"error": <str>} for a frame that is not a request
+
+A request body in the binary envelope encoding (codec.py) is answered in
+that encoding instead.
+
+A connection carries any number of requests, answered in order.
+
+The service process binds the socket, then forks `workers` processes that
+each build an Orchestrator, warm its bridges and accept connections from
+the shared socket, so the kernel hands each new connection to an idle
+worker. Every worker evaluates in its own process (and GIL); in-memory
+caches and nonce stores are per worker.
+
+    shield-serve --socket /run/shield.sock [--workers 4]
+
+SIGTERM / SIGINT drain and stop the service; SIGHUP reloads it: new
+workers are started and warmed before the old ones drain.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import os
+import selectors
+import signal
+import socket
+import stat
+import sys
+import threading
+import time
+from typing import Callable, Sequence
+
+from .canonical_json import DEFAULT_LIMITS, CanonicalLimits, to_canonical_bytes
+from .codec import CodecError, decode_request, decode_response, encode_request, encode_response, is_binary
+from .contracts.envelope import OrchestratorV3Request, OrchestratorV3Response
+from .orchestrate import Orchestrator, orchestrate
+from .transport import FRAME_HEADER, TransportError
+
+OrchestratorFactory = Callable[[], Orchestrator]
+
+_INVALID_FRAME = b'{"error":"invalid request"}'
+_FRAME_TOO_LARGE = b'{"error":"frame too large"}'
+_RECV_BYTES = 1 << 16
+_ATTEMPTS = 3
+# Unread replies a connection may queue before the worker stops reading it.
+_HIGH_WATER = 1 << 20
+_SEND_TIMEOUT = 30.0
+
+
+class ServiceError(TransportError):
+    """The service could not be reached, or rejected the frame."""
+
+
+class _Connection:
+    __slots__ = ("sock", "inbuf", "outbuf", "closing", "last_progress")
+
+    def __init__(self, sock: socket.socket) -> None:
+        self.sock = sock
+        self.inbuf = bytearray()
+        self.outbuf = bytearray()
+        self.closing = False  # answer what is queued, then close
+        self.last_progress = time.monotonic()
+
+
+class _Worker:
+    """
+    One worker's serving loop. Connections are non-blocking and multiplexed
+    with a selector; requests are evaluated one at a time, in arrival order
+    per connection.
+
+    Replies are queued per connection and written as the peer reads them.
+    A connection with more than _HIGH_WATER bytes of unread replies is not
+    read from (or answered) until it catches up, and one whose replies make
+    no progress for `send_timeout` seconds is dropped, so a client that
+    never reads cannot stall the worker for the others.
+
+    drain() (SIGTERM in a forked worker) stops accepting; the loop returns
+    once every connection is idle, after answering every complete request
+    it has received.
+    """
+
+    def __init__(
+        self,
+        listener: socket.socket,
+        orchestrator: Orchestrator,
+        *,
+        parent_pid: int | None = None,
+        send_timeout: float = _SEND_TIMEOUT,
+    ) -> None:
+        self._listener = listener
+        self._orchestrator = orchestrator
+        self._max_frame_bytes = orchestrator.limits.max_bytes
+        self._parent_pid = parent_pid
+        self._send_timeout = send_timeout
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+        os.set_blocking(self._wake_w, False)
+        self._draining = False
+
+    @property
+    def wake_fd(self) -> int:
+        return self._wake_w
+
+    def drain(self) -> None:
+        try:
+            os.write(self._wake_w, b"\0")
+        except BlockingIOError:
+            pass  # a wake-up is already pending
+
+    def run(self) -> None:
+        sel = selectors.DefaultSelector()
+        sel.register(self._wake_r, selectors.EVENT_READ)
+        sel.register(self._listener, selectors.EVENT_READ)
+        conns: dict[socket.socket, _Connection] = {}
+        try:
+            while not self._draining or conns:
+                for key, events in sel.select(timeout=min(1.0, self._send_timeout)):
+                    if key.fileobj == self._wake_r:
+                        self._start_drain(sel)
+                    elif key.fileobj is self._listener:
+                        self._accept(sel, conns)
+                    elif events & selectors.EVENT_READ:
+                        self._read(key.data, sel, conns)
+                    else:
+                        self._serve(key.data, sel, conns)
+
+                if self._parent_pid is not None and os.getppid() != self._parent_pid:
+                    self._start_drain(sel)  # the service process is gone
+                now = time.monotonic()
+                for conn in list(conns.values()):
+                    stalled = conn.outbuf and now - conn.last_progress > self._send_timeout
+                    if stalled or (self._draining and not conn.inbuf and not conn.outbuf):
+                        self._drop(conn, sel, conns)
+        finally:
+            for conn in list(conns.values()):
+                self._drop(conn, sel, conns)
+            sel.close()
+            os.close(self._wake_r)
+            os.close(self._wake_w)
+
+    def _start_drain(self, sel: selectors.BaseSelector) -> None:
+        try:
+            while os.read(self._wake_r, 64):
+                pass
+        except BlockingIOError:
+            pass
+        if not self._draining:
+            self._draining = True
+            sel.unregister(self._listener)
+
+    def _accept(self, sel: selectors.BaseSelector, conns: dict[socket.socket, _Connection]) -> None:
+        try:
+            sock, _ = self._listener.accept()
+        except (BlockingIOError, InterruptedError):
+            return  # another worker took it
+        sock.setblocking(False)
+        conn = conns[sock] = _Connection(sock)
+        sel.register(sock, selectors.EVENT_READ, conn)
+
+    def _read(self, conn: _Connection, sel: selectors.BaseSelector, conns: dict[socket.socket, _Connection]) -> None:
+        try:
+            data = conn.sock.recv(_RECV_BYTES)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            data = b""
+        if not data:
+            self._drop(conn, sel, conns)
+            return
+        conn.inbuf += data
+        self._serve(conn, sel, conns)
+
+    def _serve(self, conn: _Connection, sel: selectors.BaseSelector, conns: dict[socket.socket, _Connection]) -> None:
+        """Answer complete frames while the peer keeps up, write, and re-arm."""
+        buf = conn.inbuf
+        while not conn.closing and len(conn.outbuf) < _HIGH_WATER and len(buf) >= FRAME_HEADER.size:
+            (size,) = FRAME_HEADER.unpack_from(buf)
+            if size > self._max_frame_bytes:
+                self._queue(conn, _FRAME_TOO_LARGE)
+                conn.closing = True
+                buf.clear()
+                break
+            end = FRAME_HEADER.size + size
+            if len(buf) < end:
+                break
+            body = bytes(buf[FRAME_HEADER.size:end])
+            del buf[:end]
+            self._queue(conn, self._handle(body))
+            if not self._write(conn):
+                self._drop(conn, sel, conns)
+                return
+
+        if not self._write(conn):
+            self._drop(conn, sel, conns)
+        elif conn.closing and not conn.outbuf:
+            self._drop(conn, sel, conns)
+        else:
+            events = selectors.EVENT_WRITE if conn.outbuf else 0
+            if not conn.closing and len(conn.outbuf) < _HIGH_WATER:
+                events |= selectors.EVENT_READ
+            sel.modify(conn.sock, events, conn)
+
+    def _handle(self, body: bytes) -> bytes:
+        binary = is_binary(body)
+        try:
+            request = decode_request(body) if binary else OrchestratorV3Request(**json.loads(body))
+        except (ValueError, TypeError, RecursionError):
+            return _INVALID_FRAME
+        response = self._orchestrator.orchestrate(request)
+        return encode_response(response) if binary else to_canonical_bytes(response.to_hash_material())
+
+    @staticmethod
+    def _queue(conn: _Connection, body: bytes) -> None:
+        if not conn.outbuf:
+            conn.last_progress = time.monotonic()
+        conn.outbuf += FRAME_HEADER.pack(len(body))
+        conn.outbuf += body
+
+    @staticmethod
+    def _write(conn: _Connection) -> bool:
+        """Write what the socket takes without blocking; False if it failed."""
+        while conn.outbuf:
+            try:
+                sent = conn.sock.send(conn.outbuf)
+            except (BlockingIOError, InterruptedError):
+                return True
+            except OSError:
+                return False
+            del conn.outbuf[:sent]
+            conn.last_progress = time.monotonic()
+        return True
+
+    @staticmethod
+    def _drop(conn: _Connection, sel: selectors.BaseSelector, conns: dict[socket.socket, _Connection]) -> None:
+        sel.unregister(conn.sock)
+        del conns[conn.sock]
+        conn.sock.close()
+
+
+class OrchestratorService:
+    """
+    Pre-forked orchestrator workers serving a Unix domain socket.
+
+    `factory` builds each worker's Orchestrator (default: Orchestrator())
+    in the worker process; its bridges are warmed before the worker takes
+    connections. A worker that dies is replaced. reload() starts and warms
+    a new set of workers, then drains the old set; close() drains every
+    worker (each gets `drain_seconds` before it is killed) and removes the
+    socket.
+
+    Workers are forked from the calling process: create and start the
+    service before starting other threads where possible.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        workers: int | None = None,
+        factory: OrchestratorFactory = Orchestrator,
+        drain_seconds: float = 10.0,
+        start_timeout: float = 30.0,
+        backlog: int = 128,
+    ) -> None:
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers <= 0:
+            raise ValueError("workers must be positive")
+        self.path = path
+        self.workers = workers
+        self._factory = factory
+        self._drain_seconds = drain_seconds
+        self._start_timeout = start_timeout
+        self._backlog = backlog
+
+        self._listener: socket.socket | None = None
+        self._lock = threading.RLock()
+        self._current: set[int] = set()
+        self._retiring: dict[int, float] = {}
+        self._closed = threading.Event()
+        self._supervisor: threading.Thread | None = None
+
+    @property
+    def worker_pids(self) -> tuple[int, ...]:
+        with self._lock:
+            return tuple(sorted(self._current))
+
+    def start(self) -> OrchestratorService:
+        with self._lock:
+            if self._listener is not None:
+                return self
+            self._listener = _bind(self.path, self._backlog)
+            try:
+                for _ in range(self.workers):
+                    self._current.add(self._spawn())
+            except BaseException:
+                self.close()
+                raise
+        self._supervisor = threading.Thread(target=self._supervise, name="shield-service", daemon=True)
+        self._supervisor.start()
+        return self
+
+    def reload(self) -> None:
+        """Start and warm a new set of workers, then drain the current ones."""
+        with self._lock:
+            fresh = {self._spawn() for _ in range(self.workers)}
+            old, self._current = self._current, fresh
+            for pid in old:
+                self._retire(pid)
+
+    def close(self) -> None:
+        self._closed.set()
+        if self._supervisor is not None:
+            self._supervisor.join()
+            self._supervisor = None
+        with self._lock:
+            for pid in self._current:
+                self._retire(pid)
+            self._current = set()
+            while self._retiring:
+                self._reap()
+                if self._retiring:
+                    time.sleep(0.01)
+            if self._listener is not None:
+                self._listener.close()
+                self._listener = None
+                _unlink_socket(self.path)
+
+    def serve_forever(self) -> None:
+        """
+        Run until SIGTERM / SIGINT (then drain and close); SIGHUP reloads.
+        Must be called from the main thread.
+        """
+        stop = threading.Event()
+        reload = threading.Event()
+        handlers = {
+            signal.SIGTERM: signal.signal(signal.SIGTERM, lambda *_: stop.set()),
+            signal.SIGINT: signal.signal(signal.SIGINT, lambda *_: stop.set()),
+            signal.SIGHUP: signal.signal(signal.SIGHUP, lambda *_: reload.set()),
+        }
+        try:
+            self.start()
+            while not stop.wait(0.1):
+                if reload.is_set():
+                    reload.clear()
+                    self.reload()
+        finally:
+            self.close()
+            for signum, handler in handlers.items():
+                signal.signal(signum, handler)
+
+    def __enter__(self) -> OrchestratorService:
+        return self.start()
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def _spawn(self) -> int:
+        """Fork one worker and wait until its bridges are warm."""
+        assert self._listener is not None
+        ready_r, ready_w = os.pipe()
+        parent_pid = os.getpid()
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover - runs in the forked worker
+            os.close(ready_r)
+            code = 1
+            try:
+                signal.signal(signal.SIGINT, signal.SIG_IGN)
+                signal.signal(signal.SIGHUP, signal.SIG_IGN)
+                orchestrator = self._factory()
+                orchestrator.warm_up()
+                worker = _Worker(self._listener, orchestrator, parent_pid=parent_pid)
+                # SIGTERM only wakes the loop (through the wake-up fd) to drain.
+                signal.signal(signal.SIGTERM, lambda *_: None)
+                signal.set_wakeup_fd(worker.wake_fd)
+                os.write(ready_w, b"1")
+                os.close(ready_w)
+                worker.run()
+                orchestrator.close()
+                code = 0
+            finally:
+                os._exit(code)
+
+        os.close(ready_w)
+        try:
+            with selectors.DefaultSelector() as sel:
+                sel.register(ready_r, selectors.EVENT_READ)
+                ok = bool(sel.select(self._start_timeout)) and os.read(ready_r, 1) == b"1"
+        finally:
+            os.close(ready_r)
+        if not ok:
+            _kill(pid, signal.SIGKILL)
+            os.waitpid(pid, 0)
+            raise RuntimeError("orchestrator worker failed to start")
+        return pid
+
+    def _retire(self, pid: int) -> None:
+        _kill(pid, signal.SIGTERM)
+        self._retiring[pid] = time.monotonic() + self._drain_seconds
+
+    def _reap(self) -> None:
+        """Collect exited workers; replace crashed ones, kill overdue drains."""
+        now = time.monotonic()
+        for pid in list(self._retiring):
+            if _exited(pid):
+                del self._retiring[pid]
+            elif now >= self._retiring[pid]:
+                _kill(pid, signal.SIGKILL)
+        for pid in list(self._current):
+            if _exited(pid):
+                self._current.discard(pid)
+                if not self._closed.is_set():
+                    try:
+                        self._current.add(self._spawn())
+                    except RuntimeError:
+                        pass  # retried on the next pass
+
+    def _supervise(self) -> None:
+        while not self._closed.wait(0.05):
+            with self._lock:
+                self._reap()
+
+
+class ServiceClient:
+    """
+    Blocking client for OrchestratorService. Thread-safe: each concurrent
+    call uses its own pooled connection, so concurrent callers are spread
+    over the workers.
+
+    With `binary`, requests and envelopes travel in the binary encoding
+    (see codec.py); a request the codec cannot represent is sent as JSON.
+
+    A request that cannot be encoded within `limits` (which should match
+    the service's) fails closed before any bridge would run; it is answered
+    locally by orchestrate(), with the same envelope the service would
+    return. A request whose connection the service closed before answering
+    (drain, reload, worker restart) is retried on a new connection, up to
+    three attempts: a draining worker only closes connections on which it
+    holds no unanswered request bytes.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        timeout: float = 30.0,
+        limits: CanonicalLimits = DEFAULT_LIMITS,
+        binary: bool = False,
+    ) -> None:
+        self.path = path
+        self.timeout = timeout
+        self.limits = limits
+        self.binary = binary
+        self._idle: list[socket.socket] = []
+        self._lock = threading.Lock()
+
+    def orchestrate(self, request: OrchestratorV3Request) -> OrchestratorV3Response:
+        body = self._encode_binary(request) if self.binary else None
+        if body is None:
+            try:
+                body = to_canonical_bytes(request.to_hash_material(), self.limits)
+            except (TypeError, ValueError, RecursionError):
+                return orchestrate(request, limits=self.limits)
+
+        frame = FRAME_HEADER.pack(len(body)) + body
+        for attempt in range(_ATTEMPTS):
+            conn = self._checkout() if attempt == 0 else self._connect()
+            try:
+                reply = self._call(conn, frame)
+                break
+            except TimeoutError as e:
+                conn.close()
+                raise ServiceError("service timed out") from e
+            except OSError as e:
+                conn.close()
+                error = e
+        else:
+            raise ServiceError(f"service unavailable: {error}") from error
+
+        with self._lock:
+            self._idle.append(conn)
+        if is_binary(reply):
+            return decode_response(reply)
+        data = json.loads(reply)
+        if "error" in data:
+            raise ServiceError(data["error"])
+        return OrchestratorV3Response.from_hash_material(data)
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+    def __enter__(self) -> ServiceClient:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def _encode_binary(self, request: OrchestratorV3Request) -> bytes | None:
+        try:
+            body = encode_request(request)
+        except CodecError:
+            return None
+        # The binary form is smaller than the canonical JSON, so anything
+        # over the limit here fails the JSON path's limit check as well.
+        return body if len(body) <= self.limits.max_bytes else None
+
+    def _checkout(self) -> socket.socket:
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        return self._connect()
+
+    def _connect(self) -> socket.socket:
+        conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        conn.settimeout(self.timeout)
+        try:
+            conn.connect(self.path)
+        except OSError as e:
+            conn.close()
+            raise ServiceError(f"service unavailable: {e}") from e
+        return conn
+
+    @staticmethod
+    def _call(conn: socket.socket, frame: bytes) -> bytes:
+        conn.sendall(frame)
+        (size,) = FRAME_HEADER.unpack(_recv_exactly(conn, FRAME_HEADER.size))
+        return _recv_exactly(conn, size)
+
+
+def _recv_exactly(conn: socket.socket, size: int) -> bytes:
+    buf = bytearray()
+    while len(buf) < size:
+        chunk = conn.recv(size - len(buf))
+        if not chunk:
+            raise TransportError("connection closed by the service")
+        buf += chunk
+    return bytes(buf)
+
+
+def _bind(path: str, backlog: int) -> socket.socket:
+    _unlink_socket(path)
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        listener.bind(path)
+        listener.listen(backlog)
+    except OSError:
+        listener.close()
+        raise
+    listener.setblocking(False)
+    return listener
+
+
+def _unlink_socket(path: str) -> None:
+    # Only a stale socket is removed, never a regular file.
+    try:
+        if stat.S_ISSOCK(os.stat(path).st_mode):
+            os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+def _kill(pid: int, signum: int) -> None:
+    try:
+        os.kill(pid, signum)
+    except ProcessLookupError:
+        pass
+
+
+def _exited(pid: int) -> bool:
+    try:
+        done, _ = os.waitpid(pid, os.WNOHANG)
+    except ChildProcessError:
+        return True
+    return done == pid
+
+
+def _load_factory(spec: str) -> OrchestratorFactory:
+    module_name, _, attr = spec.partition(":")
+    if not attr:
+        raise ValueError("factory must be given as MODULE:CALLABLE")
+    return getattr(importlib.import_module(module_name), attr)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="shield-serve", description="Serve the v3 orchestrator over a Unix domain socket."
+    )
+    parser.add_argument("--socket", required=True, help="Unix socket path")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--factory", help="MODULE:CALLABLE returning the Orchestrator (default: Orchestrator())")
+    parser.add_argument("--drain-seconds", type=float, default=10.0)
+    args = parser.parse_args(argv)
+
+    factory = _load_factory(args.factory) if args.factory else Orchestrator
+    service = OrchestratorService(
+        args.socket, workers=args.workers, factory=factory, drain_seconds=args.drain_seconds
+    )
+    service.serve_forever()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
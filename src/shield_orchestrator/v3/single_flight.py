@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class SingleFlightStats:
+    """
+    Point-in-time coalescing counters.
+
+    `leaders` evaluations were run; `coalesced` callers shared one of them
+    instead of running their own; `failures` evaluations raised (their
+    error was re-raised to every caller sharing them).
+    """
+    leaders: int
+    coalesced: int
+    failures: int
+    in_flight: int
+
+
+class _Call:
+    __slots__ = ("done", "result", "error", "abandoned")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Exception | None = None
+        self.abandoned = False
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent evaluations of the same canonical request.
+
+    The first caller for a key (the leader) runs the evaluation; callers
+    arriving with the same key while it is in flight wait for it and
+    receive the identical result. Orchestration is deterministic, so this
+    is the envelope each of them would have computed. Nothing is retained
+    once the flight lands: a later caller starts a new one (use
+    ResponseCache to reuse completed envelopes).
+
+    An Exception raised by the evaluation is re-raised to every caller of
+    that flight, so each still fails closed on its own request. A leader
+    interrupted by anything else (KeyboardInterrupt, SystemExit) abandons
+    the flight and its waiters retry on their own.
+
+    do() serves threads, do_async() coroutines; an async flight is only
+    shared within its event loop, and runs to completion even when every
+    caller awaiting it is cancelled. Thread-safe.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[str, _Call] = {}
+        self._tasks: dict[str, tuple[asyncio.AbstractEventLoop, asyncio.Future]] = {}
+        self._leaders = 0
+        self._coalesced = 0
+        self._failures = 0
+
+    def do(self, key: str, fn: Callable[[], T]) -> T:
+        while True:
+            with self._lock:
+                call = self._calls.get(key)
+                leader = call is None
+                if leader:
+                    call = self._calls[key] = _Call()
+                    self._leaders += 1
+                else:
+                    self._coalesced += 1
+
+            if leader:
+                return self._lead(key, call, fn)
+
+            call.done.wait()
+            if call.abandoned:
+                with self._lock:
+                    self._coalesced -= 1
+                continue
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+    async def do_async(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            flight = self._tasks.get(key)
+            if flight is not None and flight[0] is loop:
+                task = flight[1]
+                self._coalesced += 1
+            else:
+                task = asyncio.ensure_future(fn())
+                self._leaders += 1
+                if flight is None:
+                    self._tasks[key] = (loop, task)
+                    task.add_done_callback(lambda t: self._land(key, t))
+                else:
+                    task.add_done_callback(self._count_failure)
+        # shield(): a cancelled caller must not cancel the flight for the others.
+        return await asyncio.shield(task)
+
+    def stats(self) -> SingleFlightStats:
+        with self._lock:
+            return SingleFlightStats(
+                leaders=self._leaders,
+                coalesced=self._coalesced,
+                failures=self._failures,
+                in_flight=len(self._calls) + len(self._tasks),
+            )
+
+    def _lead(self, key: str, call: _Call, fn: Callable[[], T]) -> T:
+        try:
+            call.result = fn()
+            return call.result
+        except Exception as e:
+            call.error = e
+            with self._lock:
+                self._failures += 1
+            raise
+        except BaseException:
+            call.abandoned = True
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def _land(self, key: str, task: asyncio.Future) -> None:
+        with self._lock:
+            del self._tasks[key]
+        self._count_failure(task)
+
+    def _count_failure(self, task: asyncio.Future) -> None:
+        # Also marks the exception as retrieved when every caller was cancelled.
+        if not task.cancelled() and task.exception() is not None:
+            with self._lock:
+                self._failures += 1
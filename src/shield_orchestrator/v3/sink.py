@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Sequence
+
+from shield_orchestrator.bridges.adaptive_core_bridge import AdaptiveCoreBridge
+
+from .canonical_request import CanonicalRequest
+from .contracts.envelope import OrchestratorV3Request, TraceEntry
+
+SINK_POLICIES = ("block", "drop_oldest")
+
+
+@dataclass(frozen=True, slots=True)
+class SinkReport:
+    """
+    One Adaptive Core report queued for delivery.
+
+    `request` is the canonical JSON of the request (immutable bytes, so a
+    payload mutated after orchestrate() returns cannot change the report).
+    """
+    request: bytes
+    outcome: str
+    reason_ids: tuple[str, ...]
+    component_context_hash: str | None
+
+
+@dataclass(frozen=True)
+class SinkStats:
+    """
+    Point-in-time delivery counters.
+    """
+    enqueued: int
+    delivered: int
+    dropped: int
+    failed: int
+    batches: int
+    pending: int
+
+
+Deliver = Callable[[Sequence[SinkReport]], None]
+
+
+class BatchingSink:
+    """
+    Adaptive Core sink with delivery off the latency path.
+
+    report_v3() returns the wrapped sink's trace entry, computed as before,
+    so envelopes and their hashes are unchanged; the report itself is only
+    queued. A worker thread hands queued reports to `deliver` in
+    micro-batches of up to `batch_size`, waiting at most `linger_seconds`
+    for a batch to fill.
+
+    The queue holds `max_queue` reports. When it is full, `policy` decides:
+    - "block": report_v3() waits for space (no report is lost)
+    - "drop_oldest": the oldest queued report is discarded (and counted)
+
+    A failing `deliver` never affects responses; its batch is counted as
+    failed. close() (called by Orchestrator.close()) delivers everything
+    still queued, then stops the worker; later reports are dropped.
+    """
+
+    def __init__(
+        self,
+        deliver: Deliver,
+        sink: Any | None = None,
+        *,
+        max_queue: int = 10_000,
+        policy: str = "block",
+        batch_size: int = 64,
+        linger_seconds: float = 0.005,
+    ) -> None:
+        if policy not in SINK_POLICIES:
+            raise ValueError(f"policy must be one of {SINK_POLICIES}")
+        if max_queue <= 0 or batch_size <= 0:
+            raise ValueError("max_queue and batch_size must be positive")
+        if sink is None:
+            sink = AdaptiveCoreBridge()
+
+        self.sink = sink
+        self.COMPONENT = sink.COMPONENT
+        self.STAGE = sink.STAGE
+        self._deliver = deliver
+        self._max_queue = max_queue
+        self._policy = policy
+        self._batch_size = batch_size
+        self._linger_seconds = linger_seconds
+
+        self._queue: deque[SinkReport] = deque()
+        self._cond = threading.Condition()
+        self._closed = False
+        self._in_delivery = 0
+        self._enqueued = 0
+        self._delivered = 0
+        self._dropped = 0
+        self._failed = 0
+        self._batches = 0
+
+        self._worker = threading.Thread(target=self._run, name="shield-sink-delivery", daemon=True)
+        self._worker.start()
+
+    def report_v3(
+        self,
+        request: OrchestratorV3Request,
+        *,
+        outcome: str,
+        reason_ids: tuple[str, ...],
+        canonical: CanonicalRequest | None = None,
+    ) -> TraceEntry:
+        if canonical is None:
+            canonical = CanonicalRequest.from_request(request)
+        entry = self.sink.report_v3(request, outcome=outcome, reason_ids=reason_ids, canonical=canonical)
+        self._enqueue(SinkReport(canonical.canonical, outcome, tuple(reason_ids), entry.component_context_hash))
+        return entry
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until every queued report has been delivered (or failed)."""
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._queue and not self._in_delivery, timeout)
+
+    def stats(self) -> SinkStats:
+        with self._cond:
+            return SinkStats(
+                enqueued=self._enqueued,
+                delivered=self._delivered,
+                dropped=self._dropped,
+                failed=self._failed,
+                batches=self._batches,
+                pending=len(self._queue) + self._in_delivery,
+            )
+
+    def warm_up(self) -> None:
+        hook = getattr(self.sink, "warm_up", None)
+        if callable(hook):
+            hook()
+
+    def close(self) -> None:
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        self._worker.join()
+        hook = getattr(self.sink, "close", None)
+        if callable(hook):
+            hook()
+
+    def _enqueue(self, report: SinkReport) -> None:
+        with self._cond:
+            if self._policy == "block":
+                self._cond.wait_for(lambda: self._closed or len(self._queue) < self._max_queue)
+            if self._closed:
+                self._dropped += 1
+                return
+            if len(self._queue) >= self._max_queue:
+                self._queue.popleft()
+                self._dropped += 1
+            self._queue.append(report)
+            self._enqueued += 1
+            self._cond.notify_all()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._queue or self._closed)
+                if not self._queue:
+                    return  # closed and drained
+                if len(self._queue) < self._batch_size and not self._closed:
+                    # Linger briefly so a burst leaves as one batch.
+                    deadline = time.monotonic() + self._linger_seconds
+                    while len(self._queue) < self._batch_size and not self._closed:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        self._cond.wait(remaining)
+                n = min(self._batch_size, len(self._queue))
+                batch = [self._queue.popleft() for _ in range(n)]
+                self._in_delivery = n
+                self._cond.notify_all()  # wakes producers blocked on a full queue
+
+            try:
+                self._deliver(batch)
+                ok = True
+            except Exception:
+                ok = False
+
+            with self._cond:
+                self._in_delivery = 0
+                self._batches += 1
+                if ok:
+                    self._delivered += n
+                else:
+                    self._failed += n
+                self._cond.notify_all()
@@ -0,0 +1,402 @@
+"""
+Pooled transport for remote component bridges.
+
+Wire format (one frame per message, both directions):
+
+    4-byte big-endian length | UTF-8 canonical JSON body
+
+Request body:  {"component": <str>, "request": <canonical request JSON>}
+Response body: the component's TraceEntry hash material
+               (stage, component, status, reason_ids,
+                component_context_hash, notes)
+
+Responses on a connection arrive in request order, which is what makes
+pipelining possible: several requests may be written before the first
+response is read, and replies are matched to requests first-in first-out.
+"""
+
+from __future__ import annotations
+
+import json
+import socket
+import struct
+import threading
+from collections import deque
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Any, Mapping
+
+from shield_orchestrator.errors import TVAError
+
+from .canonical_json import DEFAULT_LIMITS
+from .canonical_request import CanonicalRequest
+from .contracts.envelope import OrchestratorV3Request, TraceEntry
+from .contracts.reason_ids import ReasonId
+from .deadlines import timeout_entry
+
+
+Address = tuple[str, int]
+
+FRAME_HEADER = struct.Struct(">I")
+# A request frame wraps one canonical request, so the default cap admits any
+# request within DEFAULT_LIMITS plus room for the {"component": ...} wrapper.
+MAX_FRAME_BYTES = DEFAULT_LIMITS.max_bytes + 4096
+
+_TRACE_KEYS = frozenset(("stage", "component", "status", "reason_ids", "component_context_hash", "notes"))
+_COMPONENT_STATUSES = frozenset(("OK", "DENY", "ERROR"))
+_REASON_IDS = frozenset(r.value for r in ReasonId)
+_HEX_DIGITS = frozenset("0123456789abcdef")
+
+
+class TransportError(ConnectionError):
+    """The connection to a component failed (maps to COMPONENT_ERROR)."""
+
+
+def encode_frame(body: bytes, max_bytes: int = MAX_FRAME_BYTES) -> bytes:
+    if len(body) > max_bytes:
+        raise ValueError(f"frame exceeds {max_bytes} bytes")
+    return FRAME_HEADER.pack(len(body)) + body
+
+
+def read_frame(stream: Any, max_bytes: int = MAX_FRAME_BYTES) -> bytes | None:
+    """
+    Read one frame from a buffered binary stream. Returns None on a clean
+    end of stream; raises TransportError on a truncated or oversized frame.
+    """
+    header = stream.read(FRAME_HEADER.size)
+    if not header:
+        return None
+    if len(header) != FRAME_HEADER.size:
+        raise TransportError("truncated frame header")
+
+    (size,) = FRAME_HEADER.unpack(header)
+    if size > max_bytes:
+        raise TransportError(f"frame of {size} bytes exceeds limit")
+
+    body = stream.read(size)
+    if len(body) != size:
+        raise TransportError("truncated frame body")
+    return body
+
+
+def encode_request(component: str, canonical: CanonicalRequest) -> bytes:
+    """
+    Canonical request body, built by splicing the already-canonical request
+    bytes (keys "component" < "request" are already in sorted order).
+    """
+    name = json.dumps(component, ensure_ascii=False).encode("utf-8")
+    return b'{"component":' + name + b',"request":' + canonical.canonical + b"}"
+
+
+def parse_trace_entry(body: bytes, *, component: str, stage: str) -> TraceEntry:
+    """
+    Strictly validate a component reply. Anything other than a well-formed
+    TraceEntry for the expected component raises TVAError with
+    COMPONENT_INVALID_RESPONSE.
+    """
+    try:
+        data = json.loads(body)
+    except (UnicodeDecodeError, ValueError):
+        raise _invalid_response("reply is not JSON") from None
+
+    if not isinstance(data, dict) or data.keys() != _TRACE_KEYS:
+        raise _invalid_response("reply is not a trace entry")
+    if data["component"] != component or data["stage"] != stage:
+        raise _invalid_response("reply is for another component")
+    if data["status"] not in _COMPONENT_STATUSES:
+        raise _invalid_response("unknown status")
+
+    reason_ids = data["reason_ids"]
+    if not isinstance(reason_ids, list) or not all(
+        isinstance(r, str) and r in _REASON_IDS for r in reason_ids
+    ):
+        raise _invalid_response("unknown reason ids")
+
+    context_hash = data["component_context_hash"]
+    if context_hash is not None and not (
+        isinstance(context_hash, str) and len(context_hash) == 64 and set(context_hash) <= _HEX_DIGITS
+    ):
+        raise _invalid_response("malformed component_context_hash")
+
+    notes = data["notes"]
+    if notes is not None and not isinstance(notes, str):
+        raise _invalid_response("malformed notes")
+
+    return TraceEntry(
+        stage=stage,
+        component=component,
+        status=data["status"],
+        reason_ids=tuple(reason_ids),
+        component_context_hash=context_hash,
+        notes=notes,
+    )
+
+
+def _invalid_response(message: str) -> TVAError:
+    return TVAError(ReasonId.COMPONENT_INVALID_RESPONSE.value, message)
+
+
+class PipelinedConnection:
+    """
+    One keep-alive TCP connection with pipelined requests.
+
+    submit() writes a frame and returns a Future; a reader thread resolves
+    futures in submission order. Any I/O failure marks the connection
+    broken and fails every outstanding future with TransportError.
+    """
+
+    def __init__(
+        self, address: Address, *, connect_timeout: float = 5.0, max_frame_bytes: int = MAX_FRAME_BYTES
+    ) -> None:
+        self.max_frame_bytes = max_frame_bytes
+        self._sock = socket.create_connection(address, timeout=connect_timeout)
+        self._sock.settimeout(None)
+        self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        self._stream = self._sock.makefile("rb")
+
+        # Re-entrant: a failed write fails the connection while holding it.
+        self._write_lock = threading.RLock()
+        self._pending: deque[Future] = deque()
+        self.broken = False
+
+        self._reader = threading.Thread(target=self._read_loop, name="shield-transport", daemon=True)
+        self._reader.start()
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._pending)
+
+    def submit(self, body: bytes) -> Future:
+        frame = encode_frame(body, self.max_frame_bytes)
+        future: Future = Future()
+        with self._write_lock:
+            if self.broken:
+                raise TransportError("connection is closed")
+            # Enqueue before writing so the reader can never see a reply first.
+            self._pending.append(future)
+            try:
+                self._sock.sendall(frame)
+            except OSError as e:
+                self._fail(TransportError(str(e)))
+                raise TransportError(str(e)) from e
+        return future
+
+    def close(self) -> None:
+        self._fail(TransportError("connection is closed"))
+
+    def _read_loop(self) -> None:
+        try:
+            while True:
+                body = read_frame(self._stream, self.max_frame_bytes)
+                if body is None:
+                    raise TransportError("connection closed by peer")
+                if not self._pending:
+                    raise TransportError("unsolicited reply")
+                self._pending.popleft().set_result(body)
+        except (OSError, ValueError) as e:
+            self._fail(e if isinstance(e, TransportError) else TransportError(str(e)))
+        finally:
+            self._stream.close()
+
+    def _fail(self, error: TransportError) -> None:
+        with self._write_lock:
+            if not self.broken:
+                self.broken = True
+                try:
+                    self._sock.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+                self._sock.close()
+        while self._pending:
+            future = self._pending.popleft()
+            if not future.done():
+                future.set_exception(error)
+
+
+class ConnectionPool:
+    """
+    Bounded pool of pipelined connections to one component endpoint.
+
+    At most max_connections connections are opened (lazily), each carrying
+    at most max_pipeline outstanding requests; callers beyond that bound
+    wait for a slot. Broken connections, including any whose reply timed
+    out, are dropped and replaced on demand.
+    Frames in either direction are capped at max_frame_bytes.
+    """
+
+    def __init__(
+        self,
+        address: Address,
+        *,
+        max_connections: int = 4,
+        max_pipeline: int = 8,
+        connect_timeout: float = 5.0,
+        max_frame_bytes: int = MAX_FRAME_BYTES,
+    ) -> None:
+        if max_connections <= 0 or max_pipeline <= 0:
+            raise ValueError("max_connections and max_pipeline must be positive")
+        self.address = address
+        self.max_connections = max_connections
+        self.max_pipeline = max_pipeline
+        self.connect_timeout = connect_timeout
+        self.max_frame_bytes = max_frame_bytes
+
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_connections * max_pipeline)
+        self._connections: list[PipelinedConnection] = []
+        self._closed = False
+
+    def warm_up(self) -> None:
+        """Open the first connection ahead of traffic."""
+        self._connection()
+
+    def call(self, body: bytes, *, timeout: float) -> bytes:
+        """
+        Send one request body and wait for its reply. Raises TimeoutError
+        when no slot or reply is available within timeout, TransportError
+        on connection failure. A reply timeout closes its connection, failing
+        the requests pipelined behind it with TransportError.
+        """
+        if not self._slots.acquire(timeout=timeout):
+            raise TimeoutError("no free connection slot")
+        try:
+            connection = self._connection()
+            future = connection.submit(body)
+            try:
+                return future.result(timeout=timeout)
+            except FutureTimeoutError:
+                # Replies carry no correlation id: rather than trust FIFO
+                # order past an orphaned request, drop the connection.
+                connection._fail(TransportError("component reply timed out"))
+                raise TimeoutError("component reply timed out") from None
+        finally:
+            self._slots.release()
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            connection.close()
+
+    def __len__(self) -> int:
+        """Open connections."""
+        return sum(not c.broken for c in self._connections)
+
+    def _connection(self) -> PipelinedConnection:
+        with self._lock:
+            if self._closed:
+                raise TransportError("pool is closed")
+            self._connections = [c for c in self._connections if not c.broken]
+
+            idle = min(self._connections, key=lambda c: c.in_flight, default=None)
+            if idle is not None and (idle.in_flight == 0 or len(self._connections) >= self.max_connections):
+                return idle
+
+            try:
+                connection = PipelinedConnection(
+                    self.address, connect_timeout=self.connect_timeout, max_frame_bytes=self.max_frame_bytes
+                )
+            except OSError as e:
+                raise TransportError(str(e)) from e
+            self._connections.append(connection)
+            return connection
+
+
+class Transport:
+    """
+    Shared registry of per-component connection pools.
+
+    `endpoints` maps component names to (host, port). Pools are created
+    with the same bounds and reused by every bridge of that component.
+    Raise `max_frame_bytes` for orchestrators with limits above
+    DEFAULT_LIMITS.
+    """
+
+    def __init__(
+        self,
+        endpoints: Mapping[str, Address],
+        *,
+        max_connections: int = 4,
+        max_pipeline: int = 8,
+        connect_timeout: float = 5.0,
+        max_frame_bytes: int = MAX_FRAME_BYTES,
+    ) -> None:
+        self._pools = {
+            component: ConnectionPool(
+                tuple(address),
+                max_connections=max_connections,
+                max_pipeline=max_pipeline,
+                connect_timeout=connect_timeout,
+                max_frame_bytes=max_frame_bytes,
+            )
+            for component, address in endpoints.items()
+        }
+
+    def pool(self, component: str) -> ConnectionPool:
+        try:
+            return self._pools[component]
+        except KeyError:
+            raise TVAError(ReasonId.COMPONENT_MISSING.value, f"no endpoint for {component}") from None
+
+    def close(self) -> None:
+        for pool in self._pools.values():
+            pool.close()
+
+    def __enter__(self) -> Transport:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+class RemoteBridge:
+    """
+    Component bridge backed by a remote v3 component service.
+
+    Drop-in for the stub bridges in an Orchestrator registry (same
+    COMPONENT / STAGE, evaluate_v3() and warm_up() hooks). The transport
+    is shared and owned by the caller. Failures map fail-closed:
+    - no reply within timeout_seconds -> a COMPONENT_TIMEOUT trace entry,
+      as for a component abandoned at the request deadline
+    - request too large for the transport frame cap -> INVALID_REQUEST
+    - malformed reply -> COMPONENT_INVALID_RESPONSE
+    - connection failure -> COMPONENT_ERROR
+
+    Not usable with ProcessExecutor, which rebuilds bridges by type.
+    """
+
+    def __init__(
+        self,
+        component: str,
+        transport: Transport,
+        *,
+        stage: str | None = None,
+        timeout_seconds: float = 5.0,
+    ) -> None:
+        self.COMPONENT = component
+        self.STAGE = stage or component
+        self.transport = transport
+        self.timeout_seconds = timeout_seconds
+
+    def warm_up(self) -> None:
+        self.transport.pool(self.COMPONENT).warm_up()
+
+    def evaluate_v3(
+        self,
+        request: OrchestratorV3Request,
+        *,
+        canonical: CanonicalRequest | None = None,
+    ) -> TraceEntry:
+        if canonical is None:
+            canonical = CanonicalRequest.from_request(request)
+
+        pool = self.transport.pool(self.COMPONENT)
+        body = encode_request(self.COMPONENT, canonical)
+        if len(body) > pool.max_frame_bytes:
+            raise TVAError(ReasonId.INVALID_REQUEST.value, "request exceeds the transport frame limit")
+        try:
+            reply = pool.call(body, timeout=self.timeout_seconds)
+        except TimeoutError:
+            return timeout_entry(self)
+        return parse_trace_entry(reply, component=self.COMPONENT, stage=self.STAGE)
@@ -0,0 +1,35 @@
+"""
+Shared test helpers.
+
+Test modules import these directly (`from conftest import FakeClock,
+make_request`); pytest puts this directory on sys.path for them.
+"""
+from __future__ import annotations
+
+from typing import Any
+
+from shield_orchestrator.v3.contracts.envelope import OrchestratorV3Request
+
+
+def make_request(nonce: str = "n1", payload: Any = None, **fields: Any) -> OrchestratorV3Request:
+    """A valid v3 request; any envelope field can be overridden by keyword."""
+    request = dict(
+        contract_version=3,
+        wallet_id="w1",
+        action="SEND",
+        nonce=nonce,
+        ttl_seconds=60,
+        payload={"x": 1, "y": ["a", "é"]} if payload is None else payload,
+    )
+    request.update(fields)
+    return OrchestratorV3Request(**request)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock: set `now` to move time."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
@@ -0,0 +1,191 @@
+import asyncio
+import errno
+import json
+import os
+import threading
+from dataclasses import asdict
+
+import pytest
+
+from shield_orchestrator.v3 import orchestrate_async
+from shield_orchestrator.v3 import audit_log
+from shield_orchestrator.v3.audit_log import AuditLog
+from shield_orchestrator.v3.canonical_json import to_canonical_json
+from shield_orchestrator.v3.contracts.envelope import OrchestratorV3Request
+from shield_orchestrator.v3.orchestrate import Orchestrator, orchestrate
+
+from conftest import make_request
+
+
+def _plain(obj):
+    return json.loads(to_canonical_json(obj))
+
+
+def _logs(directory) -> list[str]:
+    return sorted(name for name in os.listdir(directory) if name.endswith(".log"))
+
+
+def test_records_are_indexed_by_context_hash_and_replay(tmp_path) -> None:
+    with AuditLog(str(tmp_path)) as log:
+        orchestrator = Orchestrator(audit=log)
+        responses = [orchestrator.orchestrate(make_request(f"n{i}")) for i in range(20)]
+        assert log.flush(timeout=5)
+
+        for i, resp in enumerate(responses):
+            record = log.get(resp.context_hash)
+            assert record == {
+                "request": _plain(asdict(make_request(f"n{i}"))),
+                "response": _plain(resp.to_hash_material()),
+            }
+            assert orchestrate(OrchestratorV3Request(**record["request"])) == resp
+
+        assert log.get("00" * 32) is None
+        assert log.get("not-a-hash") is None
+        assert [r["response"]["context_hash"] for r in log.records()] == [r.context_hash for r in responses]
+
+
+def test_fail_closed_records_hold_the_hashed_request_material(tmp_path) -> None:
+    with AuditLog(str(tmp_path)) as log:
+        resp = orchestrate(make_request(wallet_id="", payload={"bad": object()}), audit=log)
+        log.flush()
+
+        record = log.get(resp.context_hash)
+        assert record["request"]["payload"] is None
+        assert record["response"]["reason_ids"] == ["INVALID_REQUEST"]
+        assert orchestrate(OrchestratorV3Request(**record["request"])).context_hash == resp.context_hash
+
+
+def test_writes_are_group_committed(tmp_path) -> None:
+    resp = orchestrate(make_request())
+    with AuditLog(str(tmp_path), fsync=True) as log:
+        for _ in range(2000):
+            log.record(make_request(), resp)
+        log.flush()
+        stats = log.stats()
+
+    assert stats.records == 2000
+    assert stats.batches < stats.records
+
+
+def test_segments_rotate_and_old_ones_are_retired(tmp_path) -> None:
+    with AuditLog(str(tmp_path), segment_bytes=4096, max_segments=3) as log:
+        responses = [orchestrate(make_request(f"n{i}"), audit=log) for i in range(60)]
+        log.flush()
+
+        assert log.stats().segments == 3
+        assert len(_logs(tmp_path)) == 3
+        assert log.get(responses[0].context_hash) is None
+        assert log.get(responses[-1].context_hash)["request"]["nonce"] == "n59"
+        assert len(list(log.records())) < 60
+
+
+def test_index_capacity_rotates_segments(tmp_path) -> None:
+    with AuditLog(str(tmp_path), index_slots=4) as log:
+        for i in range(5):
+            orchestrate(make_request(f"n{i}"), audit=log)
+        log.flush()
+        assert log.stats().segments == 3  # two records per 4-slot index
+
+
+def test_retain_seconds_drops_expired_segments(tmp_path) -> None:
+    now = [1_000_000.0]
+    with AuditLog(str(tmp_path), index_slots=2, retain_seconds=60, clock=lambda: now[0]) as log:
+        first = orchestrate(make_request("n0"), audit=log)
+        second = orchestrate(make_request("n1"), audit=log)
+        log.flush()
+        assert log.get(first.context_hash) is not None
+
+        # One record per segment: n0's segment was sealed two minutes ago,
+        # n1's is sealed now by the rotation for n2.
+        now[0] += 120
+        last = orchestrate(make_request("n2"), audit=log)
+        log.flush()
+        assert log.get(first.context_hash) is None
+        assert log.get(second.context_hash) is not None
+        assert log.get(last.context_hash) is not None
+        assert log.stats().segments == 2
+
+
+def test_reopen_recovers_index_and_truncates_a_torn_tail(tmp_path) -> None:
+    with AuditLog(str(tmp_path), index_slots=8) as log:
+        responses = [orchestrate(make_request(f"n{i}"), audit=log) for i in range(10)]
+
+    active = os.path.join(tmp_path, _logs(tmp_path)[-1])
+    size = os.path.getsize(active)
+    with open(active, "ab") as f:
+        f.write(b"\x00\x00\x01\x00torn")
+
+    with AuditLog(str(tmp_path), index_slots=8) as log:
+        assert os.path.getsize(active) == size
+        assert all(log.get(r.context_hash) is not None for r in responses)
+        extra = orchestrate(make_request("n10"), audit=log)
+        log.flush()
+        assert log.get(extra.context_hash)["request"]["nonce"] == "n10"
+
+
+def test_latest_record_wins_for_a_repeated_context_hash(tmp_path) -> None:
+    with AuditLog(str(tmp_path)) as log:
+        resp = orchestrate(make_request())
+        log.record(make_request(), resp)
+        log.record(make_request(nonce="other"), resp)
+        log.flush()
+        assert log.get(resp.context_hash)["request"]["nonce"] == "other"
+
+
+def test_async_path_records_and_closed_log_drops(tmp_path) -> None:
+    log = AuditLog(str(tmp_path))
+    resp = asyncio.run(orchestrate_async(make_request(), audit=log))
+    log.close()
+    log.close()
+
+    assert orchestrate(make_request(), audit=log) == resp  # never raises
+    assert log.stats().dropped == 1
+    assert log.stats().records == 1
+
+
+def test_write_failures_are_counted_and_never_block_requests(tmp_path, monkeypatch) -> None:
+    def disk_full(fd):
+        raise OSError(errno.ENOSPC, "No space left on device")
+
+    log = AuditLog(str(tmp_path), queue_size=4, batch_size=2)
+    monkeypatch.setattr(audit_log.os, "fsync", disk_full)
+    responses = [orchestrate(make_request(f"n{i}"), audit=log) for i in range(20)]
+    assert log.flush(timeout=5)
+    stats = log.stats()
+    assert stats.records == 0
+    assert stats.failed > 0
+    assert stats.failed + stats.dropped == 20
+
+    # The writer survived and the torn batches were rolled back.
+    monkeypatch.undo()
+    resp = orchestrate(make_request("after"), audit=log)
+    assert log.flush(timeout=5)
+    assert log.get(resp.context_hash)["response"]["context_hash"] == resp.context_hash
+    assert log.get(responses[0].context_hash) is None
+    log.close()
+
+    with AuditLog(str(tmp_path)) as reopened:
+        assert [r["response"]["context_hash"] for r in reopened.records()] == [resp.context_hash]
+
+
+def test_full_queue_drops_instead_of_blocking(tmp_path, monkeypatch) -> None:
+    release = threading.Event()
+    fsync = os.fsync
+    monkeypatch.setattr(audit_log.os, "fsync", lambda fd: release.wait(5) and fsync(fd))
+
+    with AuditLog(str(tmp_path), queue_size=2, batch_size=1) as log:
+        for i in range(10):
+            orchestrate(make_request(f"n{i}"), audit=log)
+        assert log.stats().dropped >= 7  # one batch in the writer, two queued
+        release.set()
+        assert log.flush(timeout=5)
+        stats = log.stats()
+    assert stats.records + stats.dropped == 10
+    assert stats.failed == 0
+
+
+def test_invalid_configuration_is_rejected(tmp_path) -> None:
+    with pytest.raises(ValueError):
+        AuditLog(str(tmp_path), index_slots=3)
+    with pytest.raises(ValueError):
+        AuditLog(str(tmp_path), max_segments=0)
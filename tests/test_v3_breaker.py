@@ -0,0 +1,128 @@
+import threading
+
+import pytest
+
+from shield_orchestrator.bridges.qwg_bridge import QWGBridge
+from shield_orchestrator.v3.breaker import Bulkhead, CircuitBreaker, GuardedBridge, guard_bridges
+from shield_orchestrator.v3.instrumentation import StageHistograms
+from shield_orchestrator.v3.orchestrate import Orchestrator, _default_bridges, orchestrate
+
+from conftest import FakeClock, make_request
+
+
+class FlakyQWGBridge(QWGBridge):
+    def __init__(self) -> None:
+        self.calls = 0
+        self.failing = True
+
+    def evaluate_v3(self, request, *, canonical=None):
+        self.calls += 1
+        if self.failing:
+            raise ConnectionError("component down")
+        return super().evaluate_v3(request, canonical=canonical)
+
+
+class GatedQWGBridge(QWGBridge):
+    def __init__(self) -> None:
+        self.entered = threading.Event()
+        self.release = threading.Event()
+
+    def evaluate_v3(self, request, *, canonical=None):
+        self.entered.set()
+        self.release.wait(5)
+        return super().evaluate_v3(request, canonical=canonical)
+
+
+def _guarded(qwg, clock, metrics) -> tuple[Orchestrator, GuardedBridge]:
+    breaker = CircuitBreaker("qwg", failure_threshold=2, reset_seconds=10, observer=metrics, clock=clock)
+    guarded = GuardedBridge(qwg, breaker=breaker, observer=metrics)
+    return Orchestrator((*_default_bridges()[:4], guarded)), guarded
+
+
+def test_breaker_opens_fails_fast_and_recovers_through_half_open() -> None:
+    clock, metrics, qwg = FakeClock(), StageHistograms(), FlakyQWGBridge()
+    orchestrator, guarded = _guarded(qwg, clock, metrics)
+
+    assert [orchestrator.orchestrate(make_request()).reason_ids for _ in range(2)] == [("COMPONENT_ERROR",)] * 2
+    assert guarded.breaker.state == "open"
+
+    # Open: the component is not called and the DENY is deterministic.
+    first, second = orchestrator.orchestrate(make_request()), orchestrator.orchestrate(make_request())
+    assert qwg.calls == 2
+    assert first == second
+    assert first.reason_ids == ("COMPONENT_UNAVAILABLE",)
+    assert (first.trace[5].status, first.trace[5].notes) == ("ERROR", "circuit_open")
+
+    # Half-open trial fails: re-opened.
+    clock.now = 10
+    assert guarded.breaker.state == "half_open"
+    assert orchestrator.orchestrate(make_request()).reason_ids == ("COMPONENT_ERROR",)
+    assert guarded.breaker.state == "open"
+
+    # Half-open trial succeeds: closed, envelope back to normal.
+    clock.now = 20
+    qwg.failing = False
+    assert orchestrator.orchestrate(make_request()) == orchestrate(make_request())
+    assert guarded.breaker.state == "closed"
+
+    assert metrics.breaker_state("qwg") == "closed"
+    text = metrics.to_prometheus()
+    assert 'shield_orchestrator_breaker_state{component="qwg",state="closed"} 1' in text
+    assert 'shield_orchestrator_component_rejections_total{component="qwg",reason="circuit_open"} 2' in text
+
+
+def test_slow_calls_count_as_failures() -> None:
+    clock = FakeClock()
+    breaker = CircuitBreaker("qwg", failure_threshold=1, latency_threshold_seconds=0.5, clock=clock)
+
+    assert breaker.allow()
+    breaker.record(ok=True, latency_seconds=0.1)
+    assert breaker.state == "closed"
+
+    assert breaker.allow()
+    breaker.record(ok=True, latency_seconds=0.6)
+    assert breaker.state == "open"
+    assert not breaker.allow()
+
+
+def test_half_open_admits_limited_trial_calls() -> None:
+    clock = FakeClock()
+    breaker = CircuitBreaker("qwg", failure_threshold=1, reset_seconds=1, half_open_calls=1, clock=clock)
+    breaker.allow()
+    breaker.record(ok=False, latency_seconds=0)
+
+    clock.now = 1
+    assert breaker.allow()
+    assert not breaker.allow()
+
+
+def test_bulkhead_rejects_excess_concurrency() -> None:
+    qwg = GatedQWGBridge()
+    metrics = StageHistograms()
+    guarded = GuardedBridge(qwg, bulkhead=Bulkhead(1), observer=metrics)
+    orchestrator = Orchestrator((*_default_bridges()[:4], guarded))
+
+    held = threading.Thread(target=orchestrator.orchestrate, args=(make_request(),))
+    held.start()
+    assert qwg.entered.wait(5)
+
+    resp = orchestrator.orchestrate(make_request())
+    qwg.release.set()
+    held.join()
+
+    assert resp.reason_ids == ("COMPONENT_UNAVAILABLE",)
+    assert resp.trace[5].notes == "bulkhead_full"
+    assert orchestrator.orchestrate(make_request()) == orchestrate(make_request())
+
+
+def test_guard_bridges_keeps_order_and_envelopes() -> None:
+    guarded = guard_bridges(_default_bridges(), max_concurrent=4, latency_threshold_seconds=5)
+    assert [g.COMPONENT for g in guarded] == [b.COMPONENT for b in _default_bridges()]
+    assert Orchestrator(guarded).orchestrate(make_request()) == orchestrate(make_request())
+
+
+def test_invalid_thresholds_are_rejected() -> None:
+    with pytest.raises(ValueError):
+        CircuitBreaker("qwg", failure_threshold=0)
+    with pytest.raises(ValueError):
+        Bulkhead(0)
@@ -0,0 +1,151 @@
+import enum
+import json
+import random
+
+import pytest
+
+from shield_orchestrator.v3 import canonical_json
+from shield_orchestrator.v3.canonical_json import (
+    CanonicalLimits,
+    check_canonical,
+    iter_canonical_json,
+    to_canonical_bytes,
+    to_canonical_json,
+)
+from shield_orchestrator.v3.orchestrate import orchestrate
+
+from conftest import make_request
+
+
+class Color(str, enum.Enum):
+    RED = "red"
+
+
+class Level(enum.IntEnum):
+    HIGH = 3
+
+
+def _nested(depth: int) -> list:
+    doc: list = []
+    for _ in range(depth - 1):
+        doc = [doc]
+    return doc
+
+
+# Conformance corpus: every entry must encode exactly like the original
+# json.dumps(sort_keys=True, separators=(",", ":"), ensure_ascii=False).
+CORPUS = [
+    None, True, False, 0, -1, 2**63 - 1, -(2**63), 2**64 - 1,
+    0.0, -0.0, 1.0, 0.1, -2.5, 1e-4, 9.999e-5, 1e15, 9999999999999998.0, 1e16, 1e-7,
+    1.5e300, 5e-324, 123456789.123, 1e22,
+    "", "plain", "é", "\U0001f600", "  ", "\x00\x1f\x7f", '"\\/', "\n\r\t\b\f", "퟿￿",
+    [], {}, (), (1, "a"), [None, [[]], {}],
+    {"b": 1, "a": 2, "é": 3, "Z": 4, "\U0001f600": 5, "￿": 6, "": 7},
+    {"nested": {"z": [1, 2.5, {"y": None}], "a": {"k": "v"}}},
+    {"amount": 12345678, "fee": 0.0001, "memo": "x" * 48, "to": "dgb1qexample"},
+    Color.RED, Level.HIGH, {"c": Color.RED, "l": [Level.HIGH]},
+    # orjson's nesting limit (255) sits below DEFAULT_LIMITS.max_depth (256).
+    _nested(254), _nested(255), _nested(256),
+]
+
+
+def _reference(obj) -> bytes:
+    return json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _random_value(rng: random.Random, depth: int = 0):
+    kinds = ["int", "float", "str", "bool", "none"] + (["list", "dict"] if depth < 4 else [])
+    kind = rng.choice(kinds)
+    if kind == "int":
+        return rng.randint(-(2**63), 2**64 - 1) if rng.random() < 0.2 else rng.randint(-1000, 1000)
+    if kind == "float":
+        return rng.choice([rng.uniform(-1e3, 1e3), rng.uniform(-1, 1) * 10 ** rng.randint(-30, 30)])
+    if kind == "str":
+        ranges = [(0, 0x7F), (0x80, 0xD7FF), (0xE000, 0x10FFFF)]  # no lone surrogates
+        return "".join(chr(rng.randint(*rng.choice(ranges))) for _ in range(rng.randint(0, 8)))
+    if kind == "bool":
+        return rng.random() < 0.5
+    if kind == "none":
+        return None
+    if kind == "list":
+        return [_random_value(rng, depth + 1) for _ in range(rng.randint(0, 5))]
+    return {str(_random_value(rng, 4)): _random_value(rng, depth + 1) for _ in range(rng.randint(0, 5))}
+
+
+@pytest.fixture(params=["orjson", "json"])
+def backend(request, monkeypatch):
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(canonical_json, "_orjson", None)
+    return request.param
+
+
+@pytest.mark.parametrize("obj", CORPUS, ids=lambda obj: repr(obj)[:40])
+def test_corpus_matches_reference_encoder(backend, obj) -> None:
+    expected = _reference(obj)
+    assert to_canonical_bytes(obj) == expected
+    assert to_canonical_json(obj).encode("utf-8") == expected
+    assert "".join(iter_canonical_json(obj)).encode("utf-8") == expected
+
+
+def test_random_documents_match_reference_encoder(backend) -> None:
+    rng = random.Random(1337)
+    for _ in range(500):
+        doc = {"payload": _random_value(rng)}
+        assert to_canonical_bytes(doc) == _reference(doc)
+
+
+def test_bounded_check_agrees_with_the_rule_check() -> None:
+    # The byte estimate is a lower bound, so a budget of the exact size passes.
+    rng = random.Random(7)
+    for doc in CORPUS + [{"payload": _random_value(rng)} for _ in range(300)]:
+        limits = CanonicalLimits(max_bytes=len(to_canonical_bytes(doc)))
+        assert check_canonical(doc, limits) is check_canonical(doc)
+        assert to_canonical_bytes(doc, limits) == to_canonical_bytes(doc)
+
+
+@pytest.mark.parametrize(
+    "obj, error",
+    [
+        (float("nan"), ValueError),
+        ({"x": [float("inf")]}, ValueError),
+        (-float("inf"), ValueError),
+        (2**64, ValueError),
+        ([-(2**63) - 1], ValueError),
+        ({1: "a"}, TypeError),
+        ({"a": {None: 1}}, TypeError),
+        ({"x": object()}, TypeError),
+        ({"x": b"bytes"}, TypeError),
+        ({"x": {1, 2}}, TypeError),
+    ],
+)
+def test_rule_violations_are_rejected(backend, obj, error) -> None:
+    with pytest.raises(error):
+        to_canonical_bytes(obj)
+    with pytest.raises(error):
+        to_canonical_json(obj)
+
+
+def test_lone_surrogates_are_rejected(backend) -> None:
+    with pytest.raises((TypeError, ValueError)):
+        to_canonical_bytes({"x": "\ud800"})
+
+
+def test_only_exponent_floats_and_subclasses_need_the_reference_encoder() -> None:
+    assert check_canonical({"a": [1, 0.5, "s", None, True]}) is False
+    assert check_canonical({"a": [1e16]}) is True
+    assert check_canonical({"a": Color.RED}) is True
+    assert check_canonical({Color.RED: 1}) is True
+
+
+def test_rule_violations_map_to_hashing_failed() -> None:
+    for payload in ({"x": float("nan")}, {1: "a"}, {"x": 2**70}):
+        assert orchestrate(make_request(payload=payload)).reason_ids == ("HASHING_FAILED",)
+
+
+def test_nesting_up_to_max_depth_is_evaluated_on_every_backend(backend) -> None:
+    # The hashed request material wraps the payload in one more level.
+    assert orchestrate(make_request(payload=_nested(254))).reason_ids == ("DENY_BY_POLICY",)
+    assert orchestrate(make_request(payload=_nested(255))).reason_ids == ("DENY_BY_POLICY",)
+    assert orchestrate(make_request(payload=_nested(256))).reason_ids == ("INVALID_REQUEST",)
@@ -0,0 +1,74 @@
+import gc
+from dataclasses import asdict
+from unittest import mock
+
+from shield_orchestrator.bridges.adaptive_core_bridge import AdaptiveCoreBridge
+from shield_orchestrator.bridges.sentinel_bridge import SentinelBridge
+from shield_orchestrator.v3 import canonical_request
+from shield_orchestrator.v3.canonical_json import to_canonical_json
+from shield_orchestrator.v3.canonical_request import CanonicalRequest, memo_size
+from shield_orchestrator.v3.context_hash import compute_context_hash, compute_spliced_context_hash
+from shield_orchestrator.v3.orchestrate import Orchestrator, orchestrate
+
+from conftest import make_request
+
+
+def test_spliced_hash_matches_full_material_hash() -> None:
+    req = make_request()
+    canonical = CanonicalRequest.from_request(req)
+
+    material = {"component": "c", "outcome": "DENY", "reason_ids": ["DENY_BY_POLICY"]}
+    expected = compute_context_hash({**material, "request": asdict(req)})
+
+    assert compute_spliced_context_hash(material, {"request": canonical.canonical}) == expected
+
+
+def test_bridges_hash_identically_with_and_without_canonical() -> None:
+    req = make_request()
+    canonical = CanonicalRequest.from_request(req)
+
+    assert SentinelBridge().evaluate_v3(req) == SentinelBridge().evaluate_v3(req, canonical=canonical)
+    assert AdaptiveCoreBridge().report_v3(
+        req, outcome="DENY", reason_ids=("DENY_BY_POLICY",)
+    ) == AdaptiveCoreBridge().report_v3(
+        req, outcome="DENY", reason_ids=("DENY_BY_POLICY",), canonical=canonical
+    )
+
+
+def test_circular_payload_maps_to_hashing_failed() -> None:
+    payload: dict = {}
+    payload["self"] = payload
+
+    resp = orchestrate(make_request(payload=payload))
+    assert resp.outcome == "DENY"
+    assert resp.reason_ids == ("HASHING_FAILED",)
+
+
+def test_memoized_encoding_is_reused_per_request_object() -> None:
+    req = make_request()
+    first = CanonicalRequest.memoized(req)
+
+    with mock.patch.object(canonical_request, "to_canonical_bytes", side_effect=AssertionError):
+        again = CanonicalRequest.memoized(req)
+
+    assert again == first == CanonicalRequest.from_request(req)
+    assert again.canonical == to_canonical_json({"request": asdict(req)}).encode()[len('{"request":') : -1]
+
+
+def test_memo_is_identity_keyed_and_released_with_the_request() -> None:
+    gc.collect()
+    before = memo_size()
+    a, b = make_request(), make_request(payload={"x": 2})
+    assert CanonicalRequest.memoized(a).digest != CanonicalRequest.memoized(b).digest
+    assert memo_size() == before + 2
+
+    del a, b
+    gc.collect()
+    assert memo_size() == before
+
+
+def test_memoized_orchestrator_is_byte_identical() -> None:
+    req = make_request()
+    orchestrator = Orchestrator(memoize_requests=True)
+    assert orchestrator.orchestrate(req) == orchestrator.orchestrate(req) == orchestrate(req)
+    assert orchestrator.orchestrate(make_request(payload={"bad": object()})).reason_ids == ("HASHING_FAILED",)
@@ -0,0 +1,212 @@
+import json
+import time
+
+import pytest
+
+from shield_orchestrator.v3.canonical_json import to_canonical_bytes
+from shield_orchestrator.v3.codec import (
+    CODEC_VERSION,
+    STRING_TABLE,
+    CodecError,
+    decode_request,
+    decode_response,
+    encode_request,
+    encode_response,
+    is_binary,
+)
+from shield_orchestrator.v3.contracts.envelope import OrchestratorV3Response, TraceEntry
+from shield_orchestrator.v3.orchestrate import orchestrate
+from shield_orchestrator.v3.service import OrchestratorService, ServiceClient
+
+from conftest import make_request
+
+
+# Wire format of CODEC_VERSION 1: any change to the string table needs a new version.
+_TABLE_V1 = {
+    0: "input_validation",
+    1: "orchestrator",
+    2: "sentinel_ai",
+    3: "dqsn",
+    4: "adn",
+    5: "guardian_wallet",
+    6: "qwg",
+    7: "final_synthesis",
+    8: "adaptive_core",
+    9: "fail_closed",
+    10: "internal_error",
+    11: "OK",
+    12: "DENY",
+    13: "ERROR",
+    14: "SKIPPED",
+    15: "ALLOW",
+    16: "ESCALATE",
+    17: "INVALID_CONTRACT_VERSION",
+    18: "INVALID_REQUEST",
+    19: "NONCE_REPLAY",
+    20: "HASHING_FAILED",
+    21: "COMPONENT_ERROR",
+    22: "COMPONENT_INVALID_RESPONSE",
+    23: "COMPONENT_MISSING",
+    24: "COMPONENT_TIMEOUT",
+    25: "COMPONENT_UNAVAILABLE",
+    26: "DENY_BY_POLICY",
+    27: "INTERNAL_ERROR",
+    28: "phase3_bridge_stub",
+    29: "phase3_sink_stub",
+    30: "phase3_sink_failed",
+    31: "deadline_exceeded",
+    32: "short_circuit",
+    33: "tva_error",
+    34: "bulkhead_full",
+    35: "circuit_open",
+}
+
+
+def test_string_table_indexes_are_pinned() -> None:
+    assert CODEC_VERSION == 1
+    assert dict(enumerate(STRING_TABLE)) == _TABLE_V1
+
+    # A fixed envelope encodes to fixed bytes: "NONCE_REPLAY" is tag 3 + 19.
+    response = OrchestratorV3Response(
+        contract_version=3,
+        context_hash="ab" * 32,
+        outcome="DENY",
+        reason_ids=("NONCE_REPLAY",),
+        trace=(TraceEntry("fail_closed", "orchestrator", "DENY", ("NONCE_REPLAY",), None, "tva_error"),),
+    )
+    assert encode_response(response).hex() == (
+        "53510102" "06" "02" + "ab" * 32 + "0f" "0116" "01" "06" "0c040f011624" "00" "00"
+    )
+
+
+def test_request_round_trip_is_exact() -> None:
+    requests = [
+        make_request(),
+        make_request(payload={}),
+        make_request(payload={"x": 1.5, "y": ["a", "é"], "z": -7, "n": None}),
+        make_request(payload={"blob": "ß✓" * 300, "deep": [[[{"k": True}]]]}),
+        make_request(wallet_id="", action="unknown-action", ttl_seconds=-5, contract_version=-1),
+        make_request(nonce="f" * 64),
+    ]
+    for request in requests:
+        data = encode_request(request)
+        assert is_binary(data)
+        assert decode_request(data) == request
+        assert decode_request(memoryview(data)) == request
+        assert decode_request(bytearray(data)) == request
+
+
+@pytest.mark.parametrize("merkle", [False, True])
+def test_response_round_trip_preserves_context_hash(merkle: bool) -> None:
+    responses = [
+        orchestrate(make_request(), merkle=merkle),
+        orchestrate(make_request(wallet_id=""), merkle=merkle),  # fail-closed at input validation
+        orchestrate(make_request(payload={"bad": float("nan")}), merkle=merkle),  # fail-closed at canonicalization
+    ]
+    for response in responses:
+        decoded = decode_response(encode_response(response))
+        assert decoded == response
+        assert decoded.context_hash == response.context_hash
+        assert decoded.merkle_root == response.merkle_root
+        assert decoded.to_hash_material() == response.to_hash_material()
+
+
+def test_strings_outside_the_table_round_trip() -> None:
+    response = OrchestratorV3Response(
+        contract_version=3,
+        context_hash="ABCDEF" * 10 + "abcd",  # 64 chars but not lowercase hex
+        outcome="custom-outcome",
+        reason_ids=("NOT_A_REGISTERED_ID", "é"),
+        trace=(
+            TraceEntry("custom_stage", "custom", "OK", (), "0" * 64, None),
+            TraceEntry("custom_stage", "custom", "OK", (), None, "x" * 200),
+            TraceEntry("qwg", "qwg", "OK", ("COMPONENT_ERROR",), "short", "phase3_bridge_stub"),
+        ),
+        merkle_root=None,
+    )
+    assert decode_response(encode_response(response)) == response
+
+
+def test_encoding_is_deterministic_and_compact() -> None:
+    response = orchestrate(make_request())
+    again = orchestrate(make_request())
+    assert response is not again
+    assert encode_response(response) == encode_response(again)
+    payload = {"x": 1.5, "y": ["a", "é"], "z": -7, "n": None}
+    reordered = dict(reversed(payload.items()))
+    assert encode_request(make_request(payload=payload)) == encode_request(make_request(payload=reordered))
+
+    json_size = len(to_canonical_bytes(response.to_hash_material()))
+    assert len(encode_response(response)) * 4 < json_size
+
+
+def test_unencodable_requests_raise_codec_error() -> None:
+    for request in (
+        make_request(payload={"bad": float("nan")}),
+        make_request(contract_version=3.0),
+        make_request(ttl_seconds=True),
+        make_request(wallet_id=7),
+        make_request(ttl_seconds=1 << 63),
+        make_request(contract_version=-(1 << 63) - 1),
+    ):
+        with pytest.raises(CodecError):
+            encode_request(request)
+
+
+def test_malformed_input_raises_codec_error() -> None:
+    request = encode_request(make_request())
+    response = encode_response(orchestrate(make_request()))
+
+    cases = [
+        b"",
+        b"{}",
+        b"SQ\x02\x01",
+        response[:4] + request[4:],  # response header on a request decoder
+        request[:-1],
+        request + b"\x00",
+        request[:4] + b"\x06\x01\x05\xff\xfe",  # invalid UTF-8 literal
+        request[:-2] + b"}}",
+    ]
+    for data in cases:
+        with pytest.raises(CodecError):
+            decode_request(data)
+
+    for data in (
+        request,
+        response[:-1],
+        response + b"\x00",
+        response[:4] + b"\x06\xff",  # unknown string table index
+        response[:40],
+    ):
+        with pytest.raises(CodecError):
+            decode_response(data)
+    assert not is_binary(json.dumps({"a": 1}).encode())
+
+
+def test_overlong_varints_are_rejected_in_constant_time() -> None:
+    long_run = b"\xff" * 200_000 + b"\x00"
+    for decode, header in ((decode_request, b"SQ\x01\x01"), (decode_response, b"SQ\x01\x02")):
+        started = time.perf_counter()
+        with pytest.raises(CodecError, match="longer than 10 bytes"):
+            decode(header + long_run)
+        assert time.perf_counter() - started < 0.05
+
+    # Ten bytes carry 64 bits; anything above is not a varint this codec emits.
+    with pytest.raises(CodecError, match="exceeds 64 bits"):
+        decode_request(b"SQ\x01\x01" + b"\xff" * 9 + b"\x02")
+
+    extremes = [make_request(ttl_seconds=(1 << 63) - 1, contract_version=-(1 << 63))]
+    assert [decode_request(encode_request(r)) for r in extremes] == extremes
+
+
+def test_service_binary_frames_match_in_process_orchestration(tmp_path) -> None:
+    path = str(tmp_path / "shield.sock")
+    requests = [
+        make_request(),
+        make_request("n2", wallet_id=""),
+        make_request("n3", payload={"bad": float("nan")}),  # not encodable: sent as JSON, answered locally
+        make_request("n4", contract_version=3.0),  # not encodable: sent as JSON
+    ]
+    with OrchestratorService(path, workers=1), ServiceClient(path, binary=True) as client:
+        for request in requests:
+            assert client.orchestrate(request) == orchestrate(request)
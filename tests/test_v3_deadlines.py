@@ -0,0 +1,93 @@
+import asyncio
+
+from shield_orchestrator.bridges.adaptive_core_bridge import AdaptiveCoreBridge
+from shield_orchestrator.v3.async_bridges import SyncBridgeAdapter
+from shield_orchestrator.v3.deadlines import BudgetLedger, DeadlineScheduler
+from shield_orchestrator.v3.orchestrate import _default_bridges, _orchestrate, orchestrate_async
+
+from conftest import FakeClock, make_request
+
+
+class SlowBridge:
+    """Stand-in bridge that 'takes' `cost` seconds on the fake clock."""
+
+    def __init__(self, bridge, clock: FakeClock, cost: float) -> None:
+        self.bridge = bridge
+        self.COMPONENT = bridge.COMPONENT
+        self.STAGE = bridge.STAGE
+        self.clock = clock
+        self.cost = cost
+        self.calls = 0
+
+    def evaluate_v3(self, request, *, canonical):
+        self.calls += 1
+        self.clock.now += self.cost
+        return self.bridge.evaluate_v3(request, canonical=canonical)
+
+
+def _run(costs, ttl_seconds: int = 60):
+    clock = FakeClock()
+    bridges = tuple(SlowBridge(b, clock, c) for b, c in zip(_default_bridges(), costs))
+    resp = _orchestrate(make_request(ttl_seconds=ttl_seconds), bridges=bridges, sink=AdaptiveCoreBridge(), clock=clock)
+    return resp, bridges
+
+
+def test_scheduler_passes_unused_budget_to_later_components() -> None:
+    clock = FakeClock()
+    deadline = DeadlineScheduler(60, 3, clock=clock)
+
+    assert deadline.next_budget() == 20
+    clock.now = 5
+    assert deadline.next_budget() == 27.5
+    clock.now = 61
+    assert deadline.next_budget() < 0
+
+
+def test_ledger_replays_sequential_shares_over_run_times() -> None:
+    ledger = BudgetLedger(DeadlineScheduler(60, 3, clock=FakeClock()))
+
+    assert ledger.next_budget() == 20
+    ledger.charge(5)
+    assert ledger.next_budget() == 27.5
+    ledger.charge(float("inf"))  # abandoned at the request deadline
+    assert ledger.next_budget() < 0
+
+
+def test_overrunning_bridge_is_abandoned_with_component_timeout() -> None:
+    resp, _ = _run([0, 30, 0, 0, 0])  # dqsn budget is 15s out of 60s
+
+    assert resp.outcome == "DENY"
+    assert resp.reason_ids == ("COMPONENT_TIMEOUT",)
+    dqsn = resp.trace[2]
+    assert (dqsn.component, dqsn.status, dqsn.reason_ids) == ("dqsn", "ERROR", ("COMPONENT_TIMEOUT",))
+    assert dqsn.component_context_hash is None
+    assert [t.status for t in resp.trace[3:6]] == ["OK", "OK", "OK"]
+    assert resp.trace[6].reason_ids == ("COMPONENT_TIMEOUT",)
+
+
+def test_exhausted_deadline_skips_remaining_components() -> None:
+    resp, bridges = _run([100, 0, 0, 0, 0])
+
+    assert [b.calls for b in bridges] == [1, 0, 0, 0, 0]
+    assert all(t.reason_ids == ("COMPONENT_TIMEOUT",) for t in resp.trace[1:6])
+
+
+def test_timeouts_are_deterministic_for_the_same_overrun() -> None:
+    assert _run([0, 30, 0, 0, 0])[0] == _run([0, 30, 0, 0, 0])[0]
+
+
+class HangingBridge(SyncBridgeAdapter):
+    async def evaluate_v3_async(self, request, *, canonical):
+        await asyncio.sleep(30)
+        raise AssertionError("should have been cancelled")
+
+
+def test_orchestrate_async_cancels_bridge_past_ttl() -> None:
+    bridges = [SyncBridgeAdapter(b) for b in _default_bridges()]
+    bridges[4] = HangingBridge(bridges[4].bridge)
+
+    resp = asyncio.run(orchestrate_async(make_request(ttl_seconds=1), bridges=bridges))
+
+    assert resp.reason_ids == ("COMPONENT_TIMEOUT",)
+    assert resp.trace[5].component == "qwg"
+    assert resp.trace[5].reason_ids == ("COMPONENT_TIMEOUT",)
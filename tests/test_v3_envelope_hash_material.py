@@ -0,0 +1,25 @@
+from dataclasses import asdict
+
+from shield_orchestrator.v3.canonical_json import to_canonical_json
+from shield_orchestrator.v3.contracts.envelope import OrchestratorV3Request, TraceEntry
+from shield_orchestrator.v3.orchestrate import orchestrate
+
+
+def test_to_hash_material_matches_asdict_canonically() -> None:
+    req = OrchestratorV3Request(
+        contract_version=3,
+        wallet_id="w1",
+        action="SEND",
+        nonce="n1",
+        ttl_seconds=60,
+        payload={"x": [1, (2, 3)], "é": {"b": None}},
+    )
+    resp = orchestrate(req)
+
+    for obj in (req, resp, *resp.trace):
+        assert to_canonical_json(obj.to_hash_material()) == to_canonical_json(asdict(obj))
+
+
+def test_envelopes_are_slotted() -> None:
+    entry = TraceEntry(stage="s", component="c", status="OK")
+    assert not hasattr(entry, "__dict__")
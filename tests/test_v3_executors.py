@@ -0,0 +1,158 @@
+import functools
+import os
+import time
+
+import pytest
+
+from shield_orchestrator.bridges.adaptive_core_bridge import AdaptiveCoreBridge
+from shield_orchestrator.bridges.qwg_bridge import QWGBridge
+from shield_orchestrator.bridges.sentinel_bridge import SentinelBridge
+from shield_orchestrator.v3.breaker import guard_bridges
+from shield_orchestrator.v3.executors import InlineExecutor, ProcessExecutor, ThreadExecutor
+from shield_orchestrator.v3.instrumentation import StageObserver
+from shield_orchestrator.v3.orchestrate import (
+    Orchestrator,
+    _default_bridges,
+    _orchestrate,
+    orchestrate,
+    orchestrate_many,
+)
+
+from conftest import make_request
+
+# Tuples and non-ASCII keys must reach a worker process unchanged.
+_req = functools.partial(make_request, payload={"x": 1, "y": ["a", (1, 2)], "z": {"é": None}})
+
+
+class UnhashableQWGBridge(QWGBridge):
+    def evaluate_v3(self, request, *, canonical):
+        raise TypeError("not serializable")
+
+
+class BlockingQWGBridge(QWGBridge):
+    def evaluate_v3(self, request, *, canonical):
+        time.sleep(3)
+        return super().evaluate_v3(request, canonical=canonical)
+
+
+_PARENT_PID = os.getpid()
+
+
+class WorkerOnlyBrokenQWGBridge(QWGBridge):
+    """Constructible here, but not in a pool worker (e.g. a missing model file)."""
+
+    def __init__(self) -> None:
+        if os.getpid() != _PARENT_PID:
+            raise TypeError("model not loaded")
+        super().__init__()
+
+
+class SlowSentinelBridge(SentinelBridge):
+    """Over its fair share (ttl 1s / 5 components) but well within the TTL."""
+
+    def evaluate_v3(self, request, *, canonical):
+        time.sleep(0.4)
+        return super().evaluate_v3(request, canonical=canonical)
+
+
+def _with_qwg(bridge):
+    return (*_default_bridges()[:4], bridge)
+
+
+@pytest.mark.parametrize("backend", [InlineExecutor, ThreadExecutor, ProcessExecutor])
+def test_backends_are_bit_identical(backend) -> None:
+    requests = [_req("n1"), _req("n2"), _req("n3", ttl_seconds=0)]
+
+    with backend() as executor:
+        assert orchestrate(requests[0], executor=executor) == orchestrate(requests[0])
+        assert orchestrate_many(requests, executor=executor) == orchestrate_many(requests)
+
+
+@pytest.mark.parametrize("backend", [ThreadExecutor, ProcessExecutor])
+def test_pool_backends_map_worker_failures_like_inline(backend) -> None:
+    with backend(max_workers=2) as executor:
+        resp = _orchestrate(
+            _req(),
+            bridges=_with_qwg(UnhashableQWGBridge()),
+            sink=AdaptiveCoreBridge(),
+            executor=executor,
+        )
+
+    assert resp.reason_ids == ("HASHING_FAILED",)
+
+
+def test_thread_backend_abandons_bridge_at_deadline() -> None:
+    with ThreadExecutor() as executor:
+        t0 = time.perf_counter()
+        resp = _orchestrate(
+            _req(ttl_seconds=1),
+            bridges=_with_qwg(BlockingQWGBridge()),
+            sink=AdaptiveCoreBridge(),
+            executor=executor,
+        )
+        elapsed = time.perf_counter() - t0
+
+    assert elapsed < 2
+    assert resp.reason_ids == ("COMPONENT_TIMEOUT",)
+    assert [t.status for t in resp.trace[1:6]] == ["OK", "OK", "OK", "OK", "ERROR"]
+
+
+@pytest.mark.parametrize("backend", [InlineExecutor, ThreadExecutor, ProcessExecutor])
+def test_backends_apply_the_same_per_bridge_budget(backend) -> None:
+    with backend() as executor:
+        resp = _orchestrate(
+            _req(ttl_seconds=1),
+            bridges=(SlowSentinelBridge(), *_default_bridges()[1:]),
+            sink=AdaptiveCoreBridge(),
+            executor=executor,
+        )
+
+    assert resp.reason_ids == ("COMPONENT_TIMEOUT",)
+    assert [t.status for t in resp.trace[1:6]] == ["ERROR", "OK", "OK", "OK", "OK"]
+    assert resp.trace[1].notes == "deadline_exceeded"
+
+
+def test_process_backend_rejects_bridges_it_cannot_rebuild() -> None:
+    with ProcessExecutor() as executor:
+        with pytest.raises(ValueError, match="GuardedBridge"):
+            Orchestrator(guard_bridges(_default_bridges()), executor=executor)
+        Orchestrator(guard_bridges(_default_bridges()), executor=InlineExecutor())
+
+        # A class that only fails to build inside the worker is a component error, not a hashing failure.
+        orchestrator = Orchestrator(_with_qwg(WorkerOnlyBrokenQWGBridge()), executor=executor)
+        assert orchestrator.orchestrate(_req()).reason_ids == ("COMPONENT_ERROR",)
+
+
+def test_process_backend_closes_every_stage_it_starts() -> None:
+    events = []
+
+    class Recorder(StageObserver):
+        def on_stage_start(self, stage):
+            events.append(("start", stage))
+
+        def on_stage_stop(self, stage, *, wall_seconds, cpu_seconds, ok):
+            events.append(("stop", stage, ok))
+
+    components = [b.STAGE for b in _default_bridges()]
+    with ProcessExecutor() as executor:
+        # A worker failure, then a timeout that short-circuits the four bridges after it.
+        _orchestrate(
+            _req(),
+            bridges=_with_qwg(UnhashableQWGBridge()),
+            sink=AdaptiveCoreBridge(),
+            executor=executor,
+            observer=Recorder(),
+        )
+        _orchestrate(
+            _req(ttl_seconds=1),
+            bridges=(SlowSentinelBridge(), *_default_bridges()[1:]),
+            sink=AdaptiveCoreBridge(),
+            executor=executor,
+            observer=Recorder(),
+            short_circuit=True,
+        )
+
+    stops = [e for e in events if e[0] == "stop" and e[1] in components]
+    assert [e[1] for e in events if e[0] == "start" and e[1] in components] == components * 2
+    assert sorted(e[1] for e in stops) == sorted(components * 2)
+    assert [e[1] for e in stops if not e[2]] == ["qwg", "dqsn", "adn", "guardian_wallet", "qwg"]
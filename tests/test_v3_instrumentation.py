@@ -0,0 +1,71 @@
+from shield_orchestrator.v3.executors import ThreadExecutor
+from shield_orchestrator.v3.instrumentation import StageHistograms, StageObserver
+from shield_orchestrator.v3.orchestrate import orchestrate
+
+from conftest import make_request
+
+STAGES = [
+    "input_validation",
+    "canonicalize",
+    "sentinel_ai",
+    "dqsn",
+    "adn",
+    "guardian_wallet",
+    "qwg",
+    "final_synthesis",
+    "adaptive_core",
+    "context_hash",
+]
+
+
+class Recorder(StageObserver):
+    def __init__(self) -> None:
+        self.events: list[tuple[str, str]] = []
+
+    def on_stage_start(self, stage):
+        self.events.append(("start", stage))
+
+    def on_stage_stop(self, stage, *, wall_seconds, cpu_seconds, ok):
+        assert wall_seconds >= 0 and cpu_seconds >= 0 and ok
+        self.events.append(("stop", stage))
+
+
+class Broken(StageObserver):
+    def on_stage_start(self, stage):
+        raise RuntimeError("observer bug")
+
+
+def test_observer_sees_every_stage_without_changing_the_envelope() -> None:
+    recorder = Recorder()
+
+    resp = orchestrate(make_request(), observer=recorder)
+
+    assert resp == orchestrate(make_request())
+    assert recorder.events == [(kind, s) for s in STAGES for kind in ("start", "stop")]
+    assert orchestrate(make_request(), observer=Broken()) == resp
+
+
+def test_thread_executor_reports_bridge_stages() -> None:
+    histograms = StageHistograms()
+
+    with ThreadExecutor() as executor:
+        orchestrate(make_request(), executor=executor, observer=histograms)
+
+    assert all(histograms.count(stage) == 1 for stage in STAGES)
+
+
+def test_histograms_dump_prometheus_text(tmp_path) -> None:
+    histograms = StageHistograms(buckets=(0.5, 1.0))
+    histograms.on_stage_stop("dqsn", wall_seconds=0.25, cpu_seconds=0.1, ok=True)
+    histograms.on_stage_stop("dqsn", wall_seconds=2.0, cpu_seconds=0.1, ok=False)
+
+    path = tmp_path / "shield.prom"
+    histograms.write_prometheus(str(path))
+    text = path.read_text()
+
+    assert "# TYPE shield_orchestrator_stage_wall_seconds histogram" in text
+    assert 'shield_orchestrator_stage_wall_seconds_bucket{stage="dqsn",le="0.5"} 1' in text
+    assert 'shield_orchestrator_stage_wall_seconds_bucket{stage="dqsn",le="1"} 1' in text
+    assert 'shield_orchestrator_stage_wall_seconds_bucket{stage="dqsn",le="+Inf"} 2' in text
+    assert 'shield_orchestrator_stage_wall_seconds_count{stage="dqsn"} 2' in text
+    assert 'shield_orchestrator_stage_errors_total{stage="dqsn"} 1' in text
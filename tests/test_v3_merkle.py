@@ -0,0 +1,129 @@
+import asyncio
+import dataclasses
+import hashlib
+import io
+import json
+
+import pytest
+
+from shield_orchestrator.v3 import orchestrate_async
+from shield_orchestrator.v3.audit_log import AuditLog
+from shield_orchestrator.v3.canonical_json import to_canonical_bytes
+from shield_orchestrator.v3.canonical_request import CanonicalRequest
+from shield_orchestrator.v3.merkle import (
+    REQUEST_LEAF,
+    TRACE_LEAF_OFFSET,
+    VERDICT_LEAF,
+    InclusionProof,
+    audit_path,
+    compute_merkle_root,
+    leaf_hash,
+    merkle_root,
+    prove,
+    verify_inclusion,
+    verify_request,
+    verify_trace_entry,
+    verify_verdict,
+)
+from shield_orchestrator.v3.orchestrate import Orchestrator, orchestrate, orchestrate_many
+from shield_orchestrator.v3.replay import iter_lines, replay
+
+from conftest import make_request
+
+
+def test_merkle_mode_keeps_context_hash_and_sets_root() -> None:
+    plain = orchestrate(make_request())
+    response = orchestrate(make_request(), merkle=True)
+
+    assert plain.merkle_root is None
+    assert dataclasses.replace(response, merkle_root=None) == plain
+    digest = CanonicalRequest.from_request(make_request()).digest
+    assert response.merkle_root == compute_merkle_root(digest, response)
+
+
+def test_every_entry_verifies_against_the_root() -> None:
+    request = make_request()
+    response = orchestrate(request, merkle=True)
+    digest = CanonicalRequest.from_request(request).digest
+    root = response.merkle_root
+
+    assert verify_verdict(response.outcome, response.reason_ids, prove(digest, response, VERDICT_LEAF), root)
+    assert verify_request(digest, prove(digest, response, REQUEST_LEAF), root)
+    for position, entry in enumerate(response.trace):
+        proof = prove(digest, response, TRACE_LEAF_OFFSET + position)
+        proof = InclusionProof.from_dict(json.loads(json.dumps(proof.to_dict())))
+        assert verify_trace_entry(entry, position, proof, root)
+        assert verify_trace_entry(entry.to_hash_material(), position, proof, root)
+
+
+def test_tampering_is_detected() -> None:
+    request = make_request()
+    response = orchestrate(request, merkle=True)
+    digest = CanonicalRequest.from_request(request).digest
+    root = response.merkle_root
+    proof = prove(digest, response, TRACE_LEAF_OFFSET)
+    entry = response.trace[0]
+
+    assert not verify_trace_entry(dataclasses.replace(entry, status="DENY"), 0, proof, root)
+    assert not verify_trace_entry(entry, 1, proof, root)
+    assert not verify_trace_entry(entry, 0, dataclasses.replace(proof, path=proof.path[::-1]), root)
+    assert not verify_trace_entry(entry, 0, dataclasses.replace(proof, path=proof.path[:-1]), root)
+    assert not verify_trace_entry(entry, 0, dataclasses.replace(proof, path=("zz",)), root)
+    assert not verify_verdict("ALLOW", (), prove(digest, response, VERDICT_LEAF), root)
+    assert not verify_request("0" * 64, prove(digest, response, REQUEST_LEAF), root)
+    assert not verify_request("not hex", prove(digest, response, REQUEST_LEAF), root)
+
+
+@pytest.mark.parametrize("size", range(1, 21))
+def test_proofs_hold_for_every_tree_shape(size: int) -> None:
+    leaves = [f"leaf-{i}".encode() for i in range(size)]
+    hashes = [leaf_hash(leaf) for leaf in leaves]
+    root = merkle_root(hashes).hex()
+
+    for index, leaf in enumerate(leaves):
+        proof = InclusionProof(index, size, tuple(p.hex() for p in audit_path(hashes, index)))
+        assert verify_inclusion(leaf, proof, root)
+        assert not verify_inclusion(leaf + b"!", proof, root)
+        if size > 1:
+            assert not verify_inclusion(leaf, dataclasses.replace(proof, path=proof.path[:-1]), root)
+            assert not verify_inclusion(leaf, dataclasses.replace(proof, index=(index + 1) % size), root)
+    with pytest.raises(IndexError):
+        audit_path(hashes, size)
+
+
+def test_fail_closed_responses_get_a_root_over_the_hashed_material() -> None:
+    request = make_request(wallet_id="")
+    response = orchestrate(request, merkle=True)
+    material = {
+        "contract_version": 3,
+        "wallet_id": "",
+        "action": "SEND",
+        "nonce": "n1",
+        "ttl_seconds": 60,
+        "payload": None,
+    }
+    digest = hashlib.sha256(to_canonical_bytes(material)).hexdigest()
+
+    assert response.outcome == "DENY"
+    assert verify_request(digest, prove(digest, response, REQUEST_LEAF), response.merkle_root)
+
+
+def test_orchestrator_batch_and_async_paths_agree() -> None:
+    expected = [orchestrate(make_request(f"n{i}"), merkle=True) for i in range(3)]
+
+    with Orchestrator(merkle=True) as orchestrator:
+        assert [orchestrator.orchestrate(make_request(f"n{i}")) for i in range(3)] == expected
+        assert orchestrator.orchestrate_many([make_request(f"n{i}") for i in range(3)]) == expected
+    assert orchestrate_many([make_request(f"n{i}") for i in range(3)], merkle=True) == expected
+    assert asyncio.run(orchestrate_async(make_request("n0"), merkle=True)) == expected[0]
+
+
+def test_audit_records_carry_the_root_and_replay_matches(tmp_path) -> None:
+    with AuditLog(str(tmp_path / "audit")) as log:
+        response = orchestrate(make_request(), audit=log, merkle=True)
+        log.flush()
+        assert log.get(response.context_hash)["response"]["merkle_root"] == response.merkle_root
+        lines = list(iter_lines(io.BytesIO(b"".join(json.dumps(r).encode() + b"\n" for r in log.records()))))
+
+    report = replay(lines)
+    assert (report.compared, report.matched) == (1, 1)
@@ -0,0 +1,53 @@
+from shield_orchestrator.v3.nonce_store import InMemoryNonceStore, nonce_key
+from shield_orchestrator.v3.orchestrate import orchestrate, orchestrate_many
+from shield_orchestrator.v3.response_cache import ResponseCache
+
+from conftest import FakeClock, make_request
+
+
+def test_store_rejects_replay_until_ttl_expires() -> None:
+    clock = FakeClock()
+    store = InMemoryNonceStore(bucket_seconds=5, clock=clock)
+
+    assert store.check_and_record("w1", "n1", 10) is True
+    assert store.check_and_record("w1", "n1", 10) is False
+    assert store.check_and_record("w2", "n1", 10) is True
+
+    clock.now = 9.99
+    assert store.check_and_record("w1", "n1", 10) is False
+    clock.now = 10.0
+    assert store.check_and_record("w1", "n1", 10) is True
+    assert len(store) == 1  # expired buckets were swept
+
+
+def test_nonce_key_is_unambiguous() -> None:
+    assert nonce_key("ab", "c") != nonce_key("a", "bc")
+
+
+def test_orchestrate_denies_replayed_nonce_before_bridges() -> None:
+    store = InMemoryNonceStore()
+
+    first = orchestrate(make_request(payload={"x": 1}), nonces=store)
+    replay = orchestrate(make_request(payload={"x": 2}), nonces=store)
+
+    assert first.reason_ids == ("DENY_BY_POLICY",)
+    assert replay.reason_ids == ("NONCE_REPLAY",)
+    assert [t.stage for t in replay.trace] == ["fail_closed"]
+
+    batch = orchestrate_many([make_request("b1"), make_request("b1"), make_request("b2")], nonces=InMemoryNonceStore())
+    assert [r.reason_ids for r in batch] == [("DENY_BY_POLICY",), ("NONCE_REPLAY",), ("DENY_BY_POLICY",)]
+
+
+def test_replay_check_runs_before_the_cache() -> None:
+    store, cache = InMemoryNonceStore(), ResponseCache()
+
+    first = orchestrate(make_request(), nonces=store, cache=cache)
+    replay = orchestrate(make_request(), nonces=store, cache=cache)
+
+    assert first.reason_ids == ("DENY_BY_POLICY",)
+    assert replay.reason_ids == ("NONCE_REPLAY",)
+    assert (cache.stats().hits, cache.stats().misses) == (0, 1)
+
+    # Without a nonce store the cache still answers the duplicate.
+    assert orchestrate(make_request(), cache=cache) == first
+    assert cache.stats().hits == 1
@@ -0,0 +1,136 @@
+import asyncio
+import time
+
+from shield_orchestrator.v3 import orchestrate_async
+from shield_orchestrator.v3.instrumentation import StageObserver
+from shield_orchestrator.v3.nonce_store import InMemoryNonceStore
+from shield_orchestrator.v3.orchestrate import Orchestrator, _default_bridges, orchestrate
+from shield_orchestrator.v3.response_cache import ResponseCache
+
+from conftest import make_request
+
+
+class DelayedBridge:
+    """Local stand-in for a remote component: real stub output after a delay."""
+
+    def __init__(self, bridge, delay: float, error: Exception | None = None) -> None:
+        self.bridge = bridge
+        self.COMPONENT = bridge.COMPONENT
+        self.STAGE = bridge.STAGE
+        self.delay = delay
+        self.error = error
+
+    async def evaluate_v3_async(self, request, *, canonical):
+        await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return self.bridge.evaluate_v3(request, canonical=canonical)
+
+
+class SlowBridge:
+    """Sync counterpart of DelayedBridge."""
+
+    def __init__(self, bridge, delay: float) -> None:
+        self.bridge = bridge
+        self.COMPONENT = bridge.COMPONENT
+        self.STAGE = bridge.STAGE
+        self.delay = delay
+
+    def evaluate_v3(self, request, *, canonical):
+        time.sleep(self.delay)
+        return self.bridge.evaluate_v3(request, canonical=canonical)
+
+
+def test_orchestrate_async_default_bridges_matches_sync() -> None:
+    req = make_request()
+    assert asyncio.run(orchestrate_async(req)) == orchestrate(req)
+
+
+def test_orchestrate_async_runs_bridges_concurrently_in_canonical_trace_order() -> None:
+    req = make_request()
+    # Reverse delays: the last component finishes first.
+    delays = (0.10, 0.08, 0.06, 0.04, 0.02)
+    bridges = [DelayedBridge(b, d) for b, d in zip(_default_bridges(), delays)]
+
+    t0 = time.perf_counter()
+    resp = asyncio.run(orchestrate_async(req, bridges=bridges))
+    elapsed = time.perf_counter() - t0
+
+    assert elapsed < sum(delays)
+    assert resp == orchestrate(req)
+    assert [t.component for t in resp.trace[1:6]] == [
+        "sentinel_ai",
+        "dqsn",
+        "adn",
+        "guardian_wallet",
+        "qwg",
+    ]
+
+
+def test_orchestrate_async_first_failure_in_canonical_order_wins() -> None:
+    bridges = list(DelayedBridge(b, 0.0) for b in _default_bridges())
+    bridges[1] = DelayedBridge(bridges[1].bridge, 0.02, RuntimeError("dqsn down"))
+    bridges[3] = DelayedBridge(bridges[3].bridge, 0.0, TypeError("unhashable"))
+
+    resp = asyncio.run(orchestrate_async(make_request(), bridges=bridges))
+
+    assert resp.outcome == "DENY"
+    assert resp.reason_ids == ("COMPONENT_ERROR",)
+
+
+def test_orchestrate_async_applies_the_per_bridge_budget_like_sync() -> None:
+    # ttl 1s over 5 components: a 0.4s Sentinel is over its share but within the ttl.
+    bridges = _default_bridges()
+    sync = Orchestrator((SlowBridge(bridges[0], 0.4), *bridges[1:])).orchestrate(make_request(ttl_seconds=1))
+    delayed = [DelayedBridge(bridges[0], 0.4), *(DelayedBridge(b, 0) for b in bridges[1:])]
+    concurrent = asyncio.run(orchestrate_async(make_request(ttl_seconds=1), bridges=delayed))
+
+    assert sync.reason_ids == ("COMPONENT_TIMEOUT",)
+    assert concurrent == sync
+    assert [t.status for t in concurrent.trace[1:6]] == ["ERROR", "OK", "OK", "OK", "OK"]
+
+
+def test_orchestrate_async_invalid_request_fails_closed() -> None:
+    resp = asyncio.run(orchestrate_async(make_request(payload={"bad": object()})))
+    assert resp.reason_ids == ("HASHING_FAILED",)
+
+
+
+def test_orchestrator_async_rejects_replayed_nonce() -> None:
+    orchestrator = Orchestrator(nonces=InMemoryNonceStore())
+    first = asyncio.run(orchestrator.orchestrate_async(make_request()))
+    second = asyncio.run(orchestrator.orchestrate_async(make_request()))
+
+    assert first == orchestrate(make_request())
+    assert second.reason_ids == ("NONCE_REPLAY",)
+    assert second == orchestrate(make_request(), nonces=orchestrator.nonces)
+
+
+def test_orchestrate_async_runs_replay_check_before_the_cache() -> None:
+    cache, nonces = ResponseCache(), InMemoryNonceStore()
+    bridges = [DelayedBridge(b, 0) for b in _default_bridges()]
+
+    first, replay = [
+        asyncio.run(orchestrate_async(make_request(), bridges=bridges, cache=cache, nonces=nonces)) for _ in range(2)
+    ]
+
+    assert first == orchestrate(make_request())
+    assert replay.reason_ids == ("NONCE_REPLAY",)
+    assert replay == orchestrate(make_request(), nonces=nonces, cache=cache)
+    assert (cache.stats().hits, cache.stats().misses) == (0, 1)
+
+
+def test_orchestrate_async_reports_stages_to_observer() -> None:
+    stages = []
+
+    class Recorder(StageObserver):
+        def on_stage_stop(self, stage, *, wall_seconds, cpu_seconds, ok):
+            stages.append((stage, ok))
+
+    bridges = [DelayedBridge(b, 0.01 * (5 - i)) for i, b in enumerate(_default_bridges())]
+    asyncio.run(orchestrate_async(make_request(), bridges=bridges, observer=Recorder()))
+
+    components = ["sentinel_ai", "dqsn", "adn", "guardian_wallet", "qwg"]
+    assert stages[:2] == [("input_validation", True), ("canonicalize", True)]
+    assert sorted(stages[2:7]) == sorted((c, True) for c in components)
+    assert [s for s, _ in stages[7:]] == ["final_synthesis", "adaptive_core", "context_hash"]
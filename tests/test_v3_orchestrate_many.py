@@ -0,0 +1,25 @@
+from shield_orchestrator.v3 import orchestrate_many
+from shield_orchestrator.v3.orchestrate import orchestrate
+
+from conftest import make_request
+
+
+def test_orchestrate_many_matches_orchestrate_in_input_order() -> None:
+    requests = [make_request("n1"), make_request("n2"), make_request("n1"), make_request("n3", ttl_seconds=0)]
+
+    assert orchestrate_many(requests) == [orchestrate(r) for r in requests]
+
+
+def test_orchestrate_many_isolates_bad_payload() -> None:
+    requests = [make_request("n1"), make_request("n2", {"bad": object()}), make_request("n3")]
+
+    responses = orchestrate_many(requests)
+
+    assert responses[1].reason_ids == ("HASHING_FAILED",)
+    assert responses[0] == orchestrate(requests[0])
+    assert responses[2] == orchestrate(requests[2])
+    assert responses[2].reason_ids == ("DENY_BY_POLICY",)
+
+
+def test_orchestrate_many_empty_batch() -> None:
+    assert orchestrate_many([]) == []
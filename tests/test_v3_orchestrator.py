@@ -0,0 +1,111 @@
+import asyncio
+
+import pytest
+
+from shield_orchestrator.bridges.adaptive_core_bridge import AdaptiveCoreBridge
+from shield_orchestrator.bridges.sentinel_bridge import SentinelBridge
+from shield_orchestrator.v3 import Orchestrator
+from shield_orchestrator.v3.orchestrate import (
+    _default_bridges,
+    default_orchestrator,
+    orchestrate,
+    orchestrate_many,
+)
+from shield_orchestrator.v3.registry import CANONICAL_COMPONENTS, BridgeRegistry
+
+from conftest import make_request
+
+
+class LifecycleSentinelBridge(SentinelBridge):
+    def __init__(self, events: list) -> None:
+        self.events = events
+        self.calls = 0
+
+    def warm_up(self) -> None:
+        self.events.append("warm_up")
+
+    def close(self) -> None:
+        self.events.append("close")
+
+    def evaluate_v3(self, request, *, canonical=None):
+        self.calls += 1
+        return super().evaluate_v3(request, canonical=canonical)
+
+
+class LifecycleSink(AdaptiveCoreBridge):
+    def __init__(self, events: list, fail_warm_up: bool = False) -> None:
+        self.events = events
+        self.fail_warm_up = fail_warm_up
+
+    def warm_up(self) -> None:
+        if self.fail_warm_up:
+            raise ConnectionError("unreachable")
+        self.events.append("sink_warm_up")
+
+    def close(self) -> None:
+        self.events.append("sink_close")
+
+
+def test_default_instance_backs_module_entrypoints() -> None:
+    req = make_request()
+    registry = default_orchestrator().registry
+
+    assert default_orchestrator() is default_orchestrator()
+    assert tuple(b.COMPONENT for b in registry.bridges) == CANONICAL_COMPONENTS
+    assert Orchestrator().orchestrate(req) == orchestrate(req)
+    assert Orchestrator().orchestrate_many([req, make_request("n2")]) == orchestrate_many([req, make_request("n2")])
+    assert asyncio.run(Orchestrator().orchestrate_async(req)) == orchestrate(req)
+
+
+def test_bridge_instances_are_reused_across_requests() -> None:
+    events: list = []
+    sentinel = LifecycleSentinelBridge(events)
+    orchestrator = Orchestrator((sentinel, *_default_bridges()[1:]))
+
+    orchestrator.orchestrate(make_request("n1"))
+    orchestrator.orchestrate_many([make_request("n2"), make_request("n3")])
+
+    assert sentinel.calls == 3
+
+
+def test_lifecycle_hooks_run_once_in_order() -> None:
+    events: list = []
+    bridges = (LifecycleSentinelBridge(events), *_default_bridges()[1:])
+
+    with Orchestrator(bridges, LifecycleSink(events)) as orchestrator:
+        orchestrator.warm_up()
+        assert orchestrator.orchestrate(make_request()).outcome == "DENY"
+
+    orchestrator.close()
+    assert events == ["warm_up", "sink_warm_up", "sink_close", "close"]
+    assert orchestrator.registry.closed
+    with pytest.raises(RuntimeError):
+        orchestrator.warm_up()
+
+
+def test_failed_warm_up_closes_already_warmed_bridges() -> None:
+    events: list = []
+    sink = LifecycleSink(events, fail_warm_up=True)
+    registry = BridgeRegistry((LifecycleSentinelBridge(events), *_default_bridges()[1:]), sink)
+
+    with pytest.raises(ConnectionError):
+        registry.warm_up()
+    assert events == ["warm_up", "close"]
+
+
+@pytest.mark.parametrize(
+    "bridges",
+    [
+        _default_bridges()[::-1],
+        _default_bridges()[:4],
+        (*_default_bridges(), _default_bridges()[0]),
+    ],
+)
+def test_non_canonical_order_is_rejected(bridges) -> None:
+    with pytest.raises(ValueError, match="canonical order"):
+        Orchestrator(bridges)
+
+
+def test_sink_without_report_is_rejected() -> None:
+    with pytest.raises(ValueError, match="report_v3"):
+        Orchestrator(sink=object())
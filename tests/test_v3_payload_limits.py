@@ -0,0 +1,109 @@
+import asyncio
+from unittest import mock
+
+import pytest
+
+from shield_orchestrator.bridges.sentinel_bridge import SentinelBridge
+from shield_orchestrator.v3 import orchestrate_async
+from shield_orchestrator.v3.canonical_json import (
+    CanonicalLimits,
+    LimitExceeded,
+    check_canonical,
+    to_canonical_bytes,
+)
+from shield_orchestrator.v3.canonical_request import CanonicalRequest
+from shield_orchestrator.v3.contracts.envelope import OrchestratorV3Request
+from shield_orchestrator.v3.nonce_store import InMemoryNonceStore
+from shield_orchestrator.v3.orchestrate import Orchestrator, orchestrate, orchestrate_many
+
+from conftest import make_request
+
+
+def _nested(depth: int) -> dict:
+    node: dict = {}
+    for _ in range(depth - 1):
+        node = {"n": node}
+    return node
+
+
+def _size(req: OrchestratorV3Request) -> int:
+    return len(CanonicalRequest.from_request(req).canonical)
+
+
+def test_depth_limit_counts_the_envelope_as_depth_one() -> None:
+    limits = CanonicalLimits(max_depth=8)
+    assert orchestrate(make_request(payload=_nested(7)), limits=limits).reason_ids == ("DENY_BY_POLICY",)
+
+    resp = orchestrate(make_request(payload=_nested(8)), limits=limits)
+    assert resp.outcome == "DENY"
+    assert resp.reason_ids == ("INVALID_REQUEST",)
+
+
+def test_key_limit_counts_every_object_key() -> None:
+    # The envelope itself has 6 keys.
+    payload = {"a": {"b": 1}, "c": [{"d": 2}]}
+    request = make_request(payload=payload)
+    assert orchestrate(request, limits=CanonicalLimits(max_keys=10)).reason_ids == ("DENY_BY_POLICY",)
+    assert orchestrate(request, limits=CanonicalLimits(max_keys=9)).reason_ids == ("INVALID_REQUEST",)
+
+
+@pytest.mark.parametrize("payload", [{"memo": "x" * 300}, {"memo": "é" * 300}, {"v": list(range(100))}])
+def test_byte_limit_is_exact_on_the_canonical_encoding(payload) -> None:
+    req = make_request(payload=payload)
+    size = _size(req)
+    assert orchestrate(req, limits=CanonicalLimits(max_bytes=size)).reason_ids == ("DENY_BY_POLICY",)
+    assert orchestrate(req, limits=CanonicalLimits(max_bytes=size - 1)).reason_ids == ("INVALID_REQUEST",)
+
+
+def test_oversized_ascii_is_rejected_before_encoding() -> None:
+    material = make_request(payload={"memo": "x" * 1000}).to_hash_material()
+    with pytest.raises(LimitExceeded):
+        check_canonical(material, CanonicalLimits(max_bytes=500))
+
+
+def test_non_ascii_over_the_estimate_is_caught_by_the_exact_check() -> None:
+    material = make_request(payload={"memo": "é" * 300}).to_hash_material()
+    limits = CanonicalLimits(max_bytes=len(to_canonical_bytes(material)) - 100)
+
+    assert check_canonical(material, limits) is False  # lower bound fits
+    with pytest.raises(LimitExceeded):
+        to_canonical_bytes(material, limits)
+
+
+def test_rejected_request_runs_no_bridge_and_consumes_no_nonce() -> None:
+    nonces = InMemoryNonceStore()
+    with mock.patch.object(SentinelBridge, "evaluate_v3", side_effect=AssertionError):
+        orchestrator = Orchestrator(nonces=nonces, limits=CanonicalLimits(max_depth=4))
+        assert orchestrator.orchestrate(make_request(payload=_nested(10))).reason_ids == ("INVALID_REQUEST",)
+
+    assert orchestrator.orchestrate(make_request()).reason_ids == ("DENY_BY_POLICY",)
+
+
+def test_limits_apply_to_batch_and_async_paths() -> None:
+    limits = CanonicalLimits(max_depth=4)
+    deep, ok = make_request(payload=_nested(10)), make_request()
+
+    batch = orchestrate_many([deep, ok], limits=limits)
+    assert [r.reason_ids for r in batch] == [("INVALID_REQUEST",), ("DENY_BY_POLICY",)]
+    assert asyncio.run(orchestrate_async(deep, limits=limits)) == batch[0]
+
+
+def test_limits_take_precedence_over_rule_violations_below_them() -> None:
+    payload = _nested(10)
+    payload["bad"] = float("nan")
+    request = make_request(payload=payload)
+    assert orchestrate(request, limits=CanonicalLimits(max_depth=4)).reason_ids == ("INVALID_REQUEST",)
+    assert orchestrate(request).reason_ids == ("HASHING_FAILED",)
+
+
+def test_memoized_encoding_is_rechecked_under_stricter_limits() -> None:
+    req = make_request(payload=_nested(10))
+    assert Orchestrator(memoize_requests=True).orchestrate(req).reason_ids == ("DENY_BY_POLICY",)
+
+    strict = Orchestrator(memoize_requests=True, limits=CanonicalLimits(max_depth=4))
+    assert strict.orchestrate(req).reason_ids == ("INVALID_REQUEST",)
+
+
+def test_default_limits_admit_deep_and_large_workloads() -> None:
+    payload = {"items": [{"i": i, "memo": "x" * 48} for i in range(5000)], "deep": _nested(200)}
+    assert orchestrate(make_request(payload=payload)).reason_ids == ("DENY_BY_POLICY",)
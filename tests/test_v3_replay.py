@@ -0,0 +1,116 @@
+import io
+import json
+from dataclasses import asdict
+
+from shield_orchestrator.v3.audit_log import AuditLog
+from shield_orchestrator.v3.orchestrate import orchestrate
+from shield_orchestrator.v3.replay import (
+    LatencyHistogram,
+    _chunks,
+    _run_chunks,
+    iter_lines,
+    main,
+    replay,
+)
+
+from conftest import make_request
+
+
+def _write_jsonl(path, docs) -> None:
+    path.write_text("".join(json.dumps(d) + "\n" for d in docs), encoding="utf-8")
+
+
+def _lines(docs) -> list[tuple[int, bytes]]:
+    return list(iter_lines(io.BytesIO("".join(json.dumps(d) + "\n" for d in docs).encode())))
+
+
+def test_record_then_replay_reproduces_every_envelope(tmp_path, capsys) -> None:
+    requests = tmp_path / "requests.jsonl"
+    baseline = tmp_path / "baseline.jsonl"
+    rows = [asdict(make_request(f"n{i}")) for i in range(10)] + [asdict(make_request("bad", wallet_id=""))]
+    _write_jsonl(requests, rows)
+
+    assert main([str(requests), "--workers", "1", "--record", str(baseline)]) == 0
+    assert "requests=11 compared=0" in capsys.readouterr().out
+    recorded = [json.loads(line) for line in baseline.read_text(encoding="utf-8").splitlines()]
+    assert [r["response"]["context_hash"] for r in recorded[:10]] == [
+        orchestrate(make_request(f"n{i}")).context_hash for i in range(10)
+    ]
+
+    assert main([str(baseline), "--workers", "1", "--json"]) == 0
+    report = json.loads(capsys.readouterr().out)
+    assert (report["requests"], report["compared"], report["matched"]) == (11, 11, 11)
+    assert set(report["latency_us"]) == {"p50", "p90", "p99", "p99.9"}
+
+
+def test_mismatches_and_invalid_lines_are_reported(tmp_path, capsys) -> None:
+    good = {"request": asdict(make_request("n1")), "response": orchestrate(make_request("n1")).to_hash_material()}
+    other_hash = {**good, "response": {**good["response"], "context_hash": "0" * 64}}
+    other_envelope = {**good, "response": {**good["response"], "outcome": "ALLOW"}}
+    path = tmp_path / "traffic.jsonl"
+    _write_jsonl(path, [good, other_hash, other_envelope, {"wallet": "w1"}])
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("not json\n\n")
+
+    assert main([str(path), "--workers", "1"]) == 1
+    out = capsys.readouterr().out
+    assert "requests=3 compared=3 matched=1 mismatched=2 invalid=2" in out
+    assert "line 2: context_hash" in out
+    assert "line 3: envelope" in out
+    assert "line 4: invalid" in out and "line 5: invalid" in out
+
+
+def test_audit_log_records_replay(tmp_path) -> None:
+    with AuditLog(str(tmp_path / "audit")) as log:
+        for request in (
+            make_request("n1"),
+            make_request("n2", wallet_id=""),
+            make_request("n3", payload={"bad": float("nan")}),
+        ):
+            orchestrate(request, audit=log)
+        log.flush()
+        report = replay(_lines(log.records()))
+
+    # The NaN payload was recorded as null, so its HASHING_FAILED is not reproducible.
+    assert (report.compared, report.matched, report.unreplayable) == (3, 2, 1)
+    assert report.ok
+
+
+def test_process_pool_keeps_input_order() -> None:
+    docs = [asdict(make_request(f"n{i}")) for i in range(40)]
+    inline, pooled = io.BytesIO(), io.BytesIO()
+
+    replay(_lines(docs), record_to=inline)
+    report = replay(_lines(docs), workers=2, chunk_size=3, max_inflight=2, record_to=pooled)
+
+    assert report.requests == 40
+    assert pooled.getvalue() == inline.getvalue()
+
+
+def test_read_ahead_is_bounded() -> None:
+    consumed = 0
+
+    def lines():
+        nonlocal consumed
+        for i in range(1000):
+            consumed += 1
+            yield i + 1, json.dumps(asdict(make_request(f"n{i}"))).encode()
+
+    results = _run_chunks(_chunks(lines(), 5), workers=2, max_inflight=3, record=False)
+    assert next(results).requests == 5
+    assert consumed <= 5 * 3
+    results.close()
+
+
+def test_latency_percentiles_are_within_one_percent() -> None:
+    hist, other = LatencyHistogram(), LatencyHistogram()
+    for us in range(1, 501):
+        hist.record(us / 1e6)
+    for us in range(501, 1001):
+        other.record(us / 1e6)
+    hist.merge(other)
+
+    assert hist.count == 1000
+    assert abs(hist.percentile(0.5) / 500e-6 - 1) <= 0.01
+    assert abs(hist.percentile(0.99) / 990e-6 - 1) <= 0.01
+    assert LatencyHistogram().percentile(0.5) == 0.0
@@ -0,0 +1,60 @@
+from shield_orchestrator.v3.contracts.envelope import OrchestratorV3Response, TraceEntry
+from shield_orchestrator.v3.orchestrate import orchestrate, orchestrate_many
+from shield_orchestrator.v3.response_cache import ResponseCache
+
+from conftest import FakeClock, make_request
+
+
+def test_cache_hit_replays_identical_envelope() -> None:
+    cache = ResponseCache()
+
+    first = orchestrate(make_request(), cache=cache)
+    second = orchestrate(make_request(), cache=cache)
+
+    assert first is second
+    assert second == orchestrate(make_request())
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+
+
+def test_cache_entries_expire_after_request_ttl() -> None:
+    clock = FakeClock()
+    cache = ResponseCache(clock=clock)
+
+    orchestrate(make_request(ttl_seconds=10), cache=cache)
+    clock.now = 9.9
+    orchestrate(make_request(ttl_seconds=10), cache=cache)
+    clock.now = 10.0
+    orchestrate(make_request(ttl_seconds=10), cache=cache)
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.expirations) == (1, 2, 1)
+
+
+def test_cache_is_bounded_lru() -> None:
+    cache = ResponseCache(max_entries=2)
+
+    orchestrate_many([make_request("a"), make_request("b"), make_request("a"), make_request("c")], cache=cache)
+
+    stats = cache.stats()
+    assert (stats.size, stats.evictions) == (2, 1)
+    orchestrate(make_request("a"), cache=cache)  # "a" was most recently used, so "b" was evicted
+    assert cache.stats().hits == 2
+
+
+def test_error_and_fail_closed_envelopes_are_never_cached() -> None:
+    cache = ResponseCache()
+
+    orchestrate(make_request(ttl_seconds=0), cache=cache)
+    assert cache.stats().size == 0
+
+    errored = OrchestratorV3Response.deny(
+        context_hash="h",
+        reason_ids=("COMPONENT_TIMEOUT",),
+        trace=(
+            TraceEntry(stage="input_validation", component="orchestrator", status="OK"),
+            TraceEntry(stage="qwg", component="qwg", status="ERROR", reason_ids=("COMPONENT_TIMEOUT",)),
+        ),
+    )
+    assert cache.put("digest", errored, ttl_seconds=60) is False
+    assert cache.get("digest") is None
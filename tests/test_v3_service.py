@@ -0,0 +1,264 @@
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from shield_orchestrator.bridges.qwg_bridge import QWGBridge
+from shield_orchestrator.v3.canonical_json import CanonicalLimits
+from shield_orchestrator.v3.orchestrate import Orchestrator, _default_bridges, orchestrate
+from shield_orchestrator.v3.service import OrchestratorService, ServiceClient, ServiceError, _bind, _Worker
+from shield_orchestrator.v3.transport import FRAME_HEADER
+
+from conftest import make_request
+
+
+class SlowQWGBridge(QWGBridge):
+    def evaluate_v3(self, request, *, canonical=None):
+        time.sleep(0.2)
+        return super().evaluate_v3(request, canonical=canonical)
+
+
+def _slow_orchestrator() -> Orchestrator:
+    return Orchestrator((*_default_bridges()[:4], SlowQWGBridge()))
+
+
+def _failing_factory() -> Orchestrator:
+    raise RuntimeError("bridge configuration missing")
+
+
+def _wait_for(predicate) -> None:
+    deadline = time.monotonic() + 10
+    while not predicate():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def _accepting(path: str) -> bool:
+    # The socket file exists from bind(), before listen(): only a successful
+    # connect shows the service is accepting.
+    with socket.socket(socket.AF_UNIX) as probe:
+        try:
+            probe.connect(path)
+        except OSError:
+            return False
+    return True
+
+
+def _raw_call(sock: socket.socket, body: bytes) -> dict:
+    sock.sendall(FRAME_HEADER.pack(len(body)) + body)
+    header = sock.recv(FRAME_HEADER.size, socket.MSG_WAITALL)
+    return json.loads(sock.recv(FRAME_HEADER.unpack(header)[0], socket.MSG_WAITALL))
+
+
+def test_envelopes_match_in_process_orchestration(tmp_path) -> None:
+    path = str(tmp_path / "shield.sock")
+    limits = CanonicalLimits(max_bytes=4096)
+    requests = [
+        make_request(),
+        make_request("n2", wallet_id=""),
+        make_request("n3", payload={"bad": float("nan")}),
+        make_request("n4", {"x": "y" * 5000}),
+    ]
+
+    with OrchestratorService(path, workers=2, factory=lambda: Orchestrator(limits=limits)):
+        with ServiceClient(path, limits=limits) as client:
+            for request in requests:
+                assert client.orchestrate(request) == orchestrate(request, limits=limits)
+        # A client with looser limits sends the oversized request; the service refuses the frame.
+        with ServiceClient(path) as client, pytest.raises(ServiceError, match="frame too large"):
+            client.orchestrate(requests[3])
+    assert not os.path.exists(path)
+
+
+def test_concurrent_callers_are_spread_over_workers(tmp_path) -> None:
+    path = str(tmp_path / "shield.sock")
+    with OrchestratorService(path, workers=2, factory=_slow_orchestrator), ServiceClient(path) as client:
+        results = []
+        threads = [
+            threading.Thread(target=lambda i=i: results.append(client.orchestrate(make_request(f"n{i}"))))
+            for i in range(4)
+        ]
+        t0 = time.perf_counter()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(10)
+        elapsed = time.perf_counter() - t0
+
+    expected = sorted(orchestrate(make_request(f"n{i}")).context_hash for i in range(4))
+    assert sorted(r.context_hash for r in results) == expected
+    assert elapsed < 0.75  # 4 x 0.2 s evaluations, two at a time
+
+
+def test_reload_and_worker_crash_do_not_fail_requests(tmp_path) -> None:
+    path = str(tmp_path / "shield.sock")
+    expected = orchestrate(make_request())
+    errors, answered = [], []
+    stop = threading.Event()
+
+    with OrchestratorService(path, workers=2) as service, ServiceClient(path) as client:
+
+        def hammer() -> None:
+            while not stop.is_set():
+                try:
+                    answered.append(client.orchestrate(make_request()) == expected)
+                except Exception as e:  # pragma: no cover - reported below
+                    errors.append(e)
+
+        threads = [threading.Thread(target=hammer) for _ in range(3)]
+        for t in threads:
+            t.start()
+
+        first = service.worker_pids
+        service.reload()
+        reloaded = service.worker_pids
+        os.kill(reloaded[0], signal.SIGKILL)
+        _wait_for(lambda: reloaded[0] not in service.worker_pids and len(service.worker_pids) == 2)
+        count = len(answered)
+        _wait_for(lambda: len(answered) > count + 10)
+
+        stop.set()
+        for t in threads:
+            t.join(10)
+
+    assert not set(first) & set(reloaded)
+    assert errors == []
+    assert answered and all(answered)
+
+
+def test_close_drains_requests_in_flight(tmp_path) -> None:
+    path = str(tmp_path / "shield.sock")
+    service = OrchestratorService(path, workers=1, factory=_slow_orchestrator).start()
+    client = ServiceClient(path)
+    results = []
+    caller = threading.Thread(target=lambda: results.append(client.orchestrate(make_request())))
+    caller.start()
+    time.sleep(0.1)  # the request is being evaluated
+
+    service.close()
+    caller.join(10)
+
+    assert results == [orchestrate(make_request())]
+    with pytest.raises(ServiceError):
+        client.orchestrate(make_request())
+    client.close()
+
+
+def test_worker_loop_handles_pipelining_bad_frames_and_drain(tmp_path) -> None:
+    listener = _bind(str(tmp_path / "shield.sock"), 8)
+    worker = _Worker(listener, Orchestrator(limits=CanonicalLimits(max_bytes=1024)))
+    loop = threading.Thread(target=worker.run)
+    loop.start()
+
+    with socket.socket(socket.AF_UNIX) as a, socket.socket(socket.AF_UNIX) as b:
+        a.connect(listener.getsockname())
+        b.connect(listener.getsockname())
+        frames = [json.dumps(r.to_hash_material()).encode() for r in (make_request("n1"), make_request("n2"))]
+        a.sendall(b"".join(FRAME_HEADER.pack(len(f)) + f for f in frames))
+        for nonce in ("n1", "n2"):
+            header = a.recv(FRAME_HEADER.size, socket.MSG_WAITALL)
+            body = a.recv(FRAME_HEADER.unpack(header)[0], socket.MSG_WAITALL)
+            assert json.loads(body)["context_hash"] == orchestrate(make_request(nonce)).context_hash
+
+        assert _raw_call(b, b"not json") == {"error": "invalid request"}
+        assert _raw_call(b, b'{"wallet_id": "w1"}') == {"error": "invalid request"}
+        b.sendall(FRAME_HEADER.pack(1 << 20))
+        header = b.recv(FRAME_HEADER.size, socket.MSG_WAITALL)
+        assert json.loads(b.recv(FRAME_HEADER.unpack(header)[0], socket.MSG_WAITALL)) == {"error": "frame too large"}
+        assert b.recv(1) == b""
+
+        # A partly received request is still answered during drain.
+        body = json.dumps(make_request().to_hash_material()).encode()
+        a.sendall(FRAME_HEADER.pack(len(body)) + body[:10])
+        time.sleep(0.05)
+        worker.drain()
+        worker.drain()
+        a.sendall(body[10:])
+        header = a.recv(FRAME_HEADER.size, socket.MSG_WAITALL)
+        assert json.loads(a.recv(FRAME_HEADER.unpack(header)[0], socket.MSG_WAITALL))["outcome"] == "DENY"
+        loop.join(5)
+        assert not loop.is_alive()
+        assert a.recv(1) == b""
+    listener.close()
+
+
+def _flood(sock: socket.socket, count: int) -> None:
+    """Pipeline `count` requests without ever reading a reply."""
+    body = json.dumps(make_request().to_hash_material()).encode()
+    data = (FRAME_HEADER.pack(len(body)) + body) * count
+    sock.setblocking(False)
+    try:
+        sock.sendall(data)
+    except BlockingIOError:
+        pass  # the worker stopped reading: its reply queue is full
+
+
+def test_client_that_never_reads_does_not_stall_the_others(tmp_path) -> None:
+    path = str(tmp_path / "shield.sock")
+    with OrchestratorService(path, workers=1) as service, socket.socket(socket.AF_UNIX) as greedy:
+        greedy.connect(path)
+        _flood(greedy, 5000)
+        with ServiceClient(path, timeout=5) as client:
+            for i in range(3):
+                assert client.orchestrate(make_request(f"n{i}")) == orchestrate(make_request(f"n{i}"))
+        assert len(service.worker_pids) == 1
+
+
+def test_stalled_connection_is_dropped_and_does_not_block_drain(tmp_path) -> None:
+    listener = _bind(str(tmp_path / "shield.sock"), 8)
+    worker = _Worker(listener, Orchestrator(), send_timeout=0.3)
+    loop = threading.Thread(target=worker.run)
+    loop.start()
+
+    with socket.socket(socket.AF_UNIX) as greedy:
+        greedy.connect(listener.getsockname())
+        _flood(greedy, 5000)
+        time.sleep(0.1)
+        worker.drain()
+        loop.join(5)
+        assert not loop.is_alive()
+
+        # The worker closed the connection (with requests left unread: a reset).
+        greedy.setblocking(True)
+        greedy.settimeout(5)
+        with pytest.raises(ConnectionResetError):
+            while greedy.recv(1 << 16):
+                pass
+    listener.close()
+
+
+def test_failed_start_and_bad_arguments(tmp_path) -> None:
+    path = str(tmp_path / "shield.sock")
+    with pytest.raises(RuntimeError):
+        OrchestratorService(path, workers=1, factory=_failing_factory).start()
+    assert not os.path.exists(path)
+    with pytest.raises(ValueError):
+        OrchestratorService(path, workers=0)
+    with pytest.raises(ServiceError):
+        ServiceClient(path).orchestrate(make_request())
+
+
+def test_cli_serves_reloads_and_drains_on_signals(tmp_path) -> None:
+    path = str(tmp_path / "shield.sock")
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "shield_orchestrator.v3.service", "--socket", path, "--workers", "1"]
+    )
+    try:
+        _wait_for(lambda: _accepting(path))
+        with ServiceClient(path) as client:
+            assert client.orchestrate(make_request()) == orchestrate(make_request())
+            proc.send_signal(signal.SIGHUP)
+            time.sleep(0.3)
+            assert client.orchestrate(make_request()) == orchestrate(make_request())
+        proc.send_signal(signal.SIGTERM)
+        assert proc.wait(10) == 0
+    finally:
+        proc.kill()
+        proc.wait()
+    assert not os.path.exists(path)
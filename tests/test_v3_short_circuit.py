@@ -0,0 +1,111 @@
+import asyncio
+
+import pytest
+
+from shield_orchestrator.bridges.adaptive_core_bridge import AdaptiveCoreBridge
+from shield_orchestrator.bridges.adn_bridge import ADNBridge
+from shield_orchestrator.bridges.qwg_bridge import QWGBridge
+from shield_orchestrator.v3 import orchestrate_async
+from shield_orchestrator.v3.async_bridges import SyncBridgeAdapter
+from shield_orchestrator.v3.contracts.envelope import TraceEntry
+from shield_orchestrator.v3.executors import InlineExecutor, ThreadExecutor
+from shield_orchestrator.v3.orchestrate import _default_bridges, _orchestrate, orchestrate
+from shield_orchestrator.v3.response_cache import ResponseCache
+
+from conftest import make_request
+
+
+class DenyingADNBridge(ADNBridge):
+    def evaluate_v3(self, request, *, canonical):
+        return TraceEntry(
+            stage=self.STAGE,
+            component=self.COMPONENT,
+            status="DENY",
+            reason_ids=("DENY_BY_POLICY",),
+        )
+
+
+class CountingQWGBridge(QWGBridge):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def evaluate_v3(self, request, *, canonical):
+        self.calls += 1
+        return super().evaluate_v3(request, canonical=canonical)
+
+
+class FailingQWGBridge(QWGBridge):
+    def evaluate_v3(self, request, *, canonical):
+        raise TypeError("not serializable")
+
+
+def _bridges(qwg=None):
+    sentinel, dqsn, _, guardian, default_qwg = _default_bridges()
+    return (sentinel, dqsn, DenyingADNBridge(), guardian, qwg or default_qwg)
+
+
+def test_default_mode_is_unchanged() -> None:
+    req = make_request()
+    full = orchestrate(req)
+    assert orchestrate(req, short_circuit=False) == full
+    # Stub bridges never deny, so short-circuiting has nothing to skip.
+    assert orchestrate(req, short_circuit=True) == full
+
+
+def test_deny_skips_remaining_components() -> None:
+    qwg = CountingQWGBridge()
+    resp = _orchestrate(
+        make_request(),
+        bridges=_bridges(qwg),
+        sink=AdaptiveCoreBridge(),
+        short_circuit=True,
+    )
+
+    assert qwg.calls == 0
+    assert resp.outcome == "DENY"
+    assert resp.reason_ids == ("DENY_BY_POLICY",)
+    assert [t.status for t in resp.trace[1:6]] == ["OK", "OK", "DENY", "SKIPPED", "SKIPPED"]
+    skipped = resp.trace[4]
+    assert (skipped.component, skipped.reason_ids, skipped.notes) == ("guardian_wallet", (), "short_circuit")
+
+
+def test_failure_after_decision_is_ignored() -> None:
+    resp = _orchestrate(
+        make_request(),
+        bridges=_bridges(FailingQWGBridge()),
+        sink=AdaptiveCoreBridge(),
+        short_circuit=True,
+    )
+    assert resp.reason_ids == ("DENY_BY_POLICY",)
+    assert resp.trace[5].status == "SKIPPED"
+
+
+@pytest.mark.parametrize("bridges", [_bridges(), _bridges(FailingQWGBridge())])
+def test_short_circuit_trace_is_identical_across_paths(bridges) -> None:
+    def run(executor):
+        with executor:
+            return _orchestrate(
+                make_request(),
+                bridges=bridges,
+                sink=AdaptiveCoreBridge(),
+                executor=executor,
+                short_circuit=True,
+            )
+
+    inline = run(InlineExecutor())
+    assert run(ThreadExecutor(max_workers=2)) == inline
+
+    adapted = tuple(SyncBridgeAdapter(b) for b in bridges)
+    assert asyncio.run(orchestrate_async(make_request(), bridges=adapted, short_circuit=True)) == inline
+
+
+def test_cache_keeps_modes_apart() -> None:
+    cache = ResponseCache()
+    req = make_request()
+    full = _orchestrate(req, bridges=_bridges(), sink=AdaptiveCoreBridge(), cache=cache)
+    short = _orchestrate(
+        req, bridges=_bridges(), sink=AdaptiveCoreBridge(), cache=cache, short_circuit=True
+    )
+
+    assert full.context_hash != short.context_hash
+    assert _orchestrate(req, bridges=_bridges(), sink=AdaptiveCoreBridge(), cache=cache) == full
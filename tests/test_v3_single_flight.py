@@ -0,0 +1,203 @@
+import asyncio
+import threading
+import time
+
+from shield_orchestrator.bridges.qwg_bridge import QWGBridge
+from shield_orchestrator.v3 import orchestrate_async
+from shield_orchestrator.v3.nonce_store import InMemoryNonceStore
+from shield_orchestrator.v3.orchestrate import Orchestrator, _default_bridges, orchestrate
+from shield_orchestrator.v3.single_flight import SingleFlight
+
+from conftest import make_request
+
+
+class GatedQWGBridge(QWGBridge):
+    def __init__(self, fail: bool = False) -> None:
+        self.calls = 0
+        self.fail = fail
+        self.entered = threading.Event()
+        self.release = threading.Event()
+
+    def evaluate_v3(self, request, *, canonical=None):
+        self.calls += 1
+        self.entered.set()
+        self.release.wait(5)
+        if self.fail:
+            raise ConnectionError("component down")
+        return super().evaluate_v3(request, canonical=canonical)
+
+
+class CountingAsyncBridge:
+    def __init__(self, bridge, error: Exception | None = None) -> None:
+        self.bridge = bridge
+        self.COMPONENT = bridge.COMPONENT
+        self.STAGE = bridge.STAGE
+        self.error = error
+        self.calls = 0
+
+    async def evaluate_v3_async(self, request, *, canonical):
+        self.calls += 1
+        await asyncio.sleep(0.02)
+        if self.error is not None:
+            raise self.error
+        return self.bridge.evaluate_v3(request, canonical=canonical)
+
+
+def _wait_for(predicate) -> None:
+    deadline = time.monotonic() + 5
+    while not predicate():
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+
+
+def _storm(orchestrator: Orchestrator, requests, qwg: GatedQWGBridge, joined: int) -> list:
+    responses = [None] * len(requests)
+
+    def call(i: int) -> None:
+        responses[i] = orchestrator.orchestrate(requests[i])
+
+    threads = [threading.Thread(target=call, args=(i,)) for i in range(len(requests))]
+    for t in threads:
+        t.start()
+    assert qwg.entered.wait(5)
+    _wait_for(lambda: orchestrator.single_flight.stats().coalesced == joined)
+    qwg.release.set()
+    for t in threads:
+        t.join(5)
+    return responses
+
+
+def test_concurrent_identical_requests_share_one_evaluation() -> None:
+    qwg = GatedQWGBridge()
+    flight = SingleFlight()
+    orchestrator = Orchestrator((*_default_bridges()[:4], qwg), single_flight=flight)
+
+    responses = _storm(orchestrator, [make_request() for _ in range(8)], qwg, joined=7)
+
+    assert responses == [orchestrate(make_request())] * 8
+    assert qwg.calls == 1
+    stats = flight.stats()
+    assert (stats.leaders, stats.coalesced, stats.failures, stats.in_flight) == (1, 7, 0, 0)
+
+    # Nothing is retained once the flight has landed.
+    orchestrator.orchestrate(make_request())
+    assert qwg.calls == 2
+
+
+def test_shared_failure_fails_each_caller_closed_and_is_not_retained() -> None:
+    qwg = GatedQWGBridge(fail=True)
+    flight = SingleFlight()
+    orchestrator = Orchestrator((*_default_bridges()[:4], qwg), single_flight=flight)
+
+    responses = _storm(orchestrator, [make_request() for _ in range(4)], qwg, joined=3)
+
+    assert qwg.calls == 1
+    assert len(set(responses)) == 1
+    assert responses[0].outcome == "DENY"
+    assert responses[0].reason_ids == ("COMPONENT_ERROR",)
+    assert flight.stats().failures == 1
+
+    qwg.fail = False
+    assert orchestrator.orchestrate(make_request()) == orchestrate(make_request())
+
+
+def test_replay_check_runs_before_joining_a_flight() -> None:
+    qwg = GatedQWGBridge()
+    flight = SingleFlight()
+    orchestrator = Orchestrator((*_default_bridges()[:4], qwg), single_flight=flight, nonces=InMemoryNonceStore())
+
+    first = threading.Thread(target=orchestrator.orchestrate, args=(make_request(),))
+    first.start()
+    assert qwg.entered.wait(5)
+    duplicate = orchestrator.orchestrate(make_request())
+    qwg.release.set()
+    first.join(5)
+
+    assert duplicate.reason_ids == ("NONCE_REPLAY",)
+    assert flight.stats().coalesced == 0
+
+
+def test_abandoned_flight_lets_waiters_run_their_own() -> None:
+    flight = SingleFlight()
+    release = threading.Event()
+    results = []
+
+    def interrupted() -> str:
+        release.wait(5)
+        raise KeyboardInterrupt
+
+    def leader() -> None:
+        try:
+            flight.do("k", interrupted)
+        except KeyboardInterrupt:
+            results.append("interrupted")
+
+    t = threading.Thread(target=leader)
+    t.start()
+    _wait_for(lambda: flight.stats().in_flight == 1)
+    waiter = threading.Thread(target=lambda: results.append(flight.do("k", lambda: "own")))
+    waiter.start()
+    _wait_for(lambda: flight.stats().coalesced == 1)
+    release.set()
+    t.join(5)
+    waiter.join(5)
+
+    assert sorted(results) == ["interrupted", "own"]
+    assert (flight.stats().leaders, flight.stats().coalesced) == (2, 0)
+
+
+def test_async_callers_share_one_fan_out_and_survive_cancellation() -> None:
+    bridges = [CountingAsyncBridge(b) for b in _default_bridges()]
+    flight = SingleFlight()
+
+    async def main():
+        calls = [
+            asyncio.ensure_future(orchestrate_async(make_request(), bridges=bridges, single_flight=flight))
+            for _ in range(5)
+        ]
+        await asyncio.sleep(0)
+        calls[0].cancel()
+        other = await orchestrate_async(make_request("n2"), bridges=bridges, single_flight=flight)
+        return await asyncio.gather(*calls[1:]), other
+
+    shared, other = asyncio.run(main())
+
+    assert shared == [orchestrate(make_request())] * 4
+    assert other == orchestrate(make_request("n2"))
+    assert [b.calls for b in bridges] == [2] * 5
+    stats = flight.stats()
+    assert (stats.leaders, stats.coalesced, stats.in_flight) == (2, 4, 0)
+
+
+def test_async_failure_is_shared_and_counted() -> None:
+    bridges = [*map(CountingAsyncBridge, _default_bridges()[:4]), CountingAsyncBridge(QWGBridge(), ConnectionError())]
+    flight = SingleFlight()
+
+    async def main():
+        return await asyncio.gather(
+            *(orchestrate_async(make_request(), bridges=bridges, single_flight=flight) for _ in range(3))
+        )
+
+    responses = asyncio.run(main())
+
+    assert len(set(responses)) == 1
+    assert responses[0].reason_ids == ("COMPONENT_ERROR",)
+    assert bridges[-1].calls == 1
+    assert flight.stats().failures == 1
+
+
+def test_async_replay_check_runs_before_joining_a_flight() -> None:
+    bridges = [CountingAsyncBridge(b) for b in _default_bridges()]
+    flight, nonces = SingleFlight(), InMemoryNonceStore()
+
+    async def main():
+        return await asyncio.gather(
+            *(orchestrate_async(make_request(), bridges=bridges, single_flight=flight, nonces=nonces) for _ in range(3))
+        )
+
+    first, *replays = asyncio.run(main())
+
+    assert first == orchestrate(make_request())
+    assert [r.reason_ids for r in replays] == [("NONCE_REPLAY",)] * 2
+    assert [b.calls for b in bridges] == [1] * 5
+    assert (flight.stats().leaders, flight.stats().coalesced) == (1, 0)
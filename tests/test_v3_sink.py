@@ -0,0 +1,120 @@
+import threading
+
+import pytest
+
+from shield_orchestrator.v3.canonical_request import CanonicalRequest
+from shield_orchestrator.v3.orchestrate import Orchestrator, orchestrate
+from shield_orchestrator.v3.sink import BatchingSink
+
+from conftest import make_request
+
+
+class Recorder:
+    def __init__(self, gate: threading.Event | None = None, fail: bool = False) -> None:
+        self.batches: list[list] = []
+        self.gate = gate
+        self.fail = fail
+        self.started = threading.Event()
+
+    def __call__(self, batch) -> None:
+        self.started.set()
+        if self.gate is not None:
+            self.gate.wait(5)
+        if self.fail:
+            raise ConnectionError("adaptive core unreachable")
+        self.batches.append(list(batch))
+
+
+def test_envelopes_are_unchanged_and_reports_delivered_on_close() -> None:
+    recorder = Recorder()
+    with Orchestrator(sink=BatchingSink(recorder, batch_size=8)) as orchestrator:
+        responses = [orchestrator.orchestrate(make_request(f"n{i}")) for i in range(20)]
+    stats = orchestrator.registry.sink.stats()
+
+    assert responses == [orchestrate(make_request(f"n{i}")) for i in range(20)]
+    reports = [r for batch in recorder.batches for r in batch]
+    expected = [CanonicalRequest.from_request(make_request(f"n{i}")).canonical for i in range(20)]
+    assert [r.request for r in reports] == expected
+    assert reports[0].outcome == "DENY" and reports[0].reason_ids == ("DENY_BY_POLICY",)
+    assert reports[0].component_context_hash == responses[0].trace[-1].component_context_hash
+    assert all(len(batch) <= 8 for batch in recorder.batches)
+    assert (stats.enqueued, stats.delivered, stats.pending) == (20, 20, 0)
+
+
+def test_bursts_are_micro_batched() -> None:
+    gate = threading.Event()
+    recorder = Recorder(gate)
+    sink = BatchingSink(recorder, batch_size=16)
+    orchestrator = Orchestrator(sink=sink)
+
+    orchestrator.orchestrate(make_request("first"))
+    assert recorder.started.wait(5)  # worker is busy with the first batch
+    for i in range(40):
+        orchestrator.orchestrate(make_request(f"n{i}"))
+    gate.set()
+    sink.close()
+
+    assert [len(b) for b in recorder.batches] == [1, 16, 16, 8]
+    assert sink.stats().batches == 4
+
+
+def test_drop_oldest_keeps_the_newest_reports() -> None:
+    gate = threading.Event()
+    recorder = Recorder(gate)
+    sink = BatchingSink(recorder, max_queue=4, policy="drop_oldest", batch_size=1)
+    orchestrator = Orchestrator(sink=sink)
+
+    orchestrator.orchestrate(make_request("first"))
+    assert recorder.started.wait(5)
+    for i in range(10):
+        orchestrator.orchestrate(make_request(f"n{i}"))  # never waits
+    gate.set()
+    sink.close()
+
+    delivered = [r.request for batch in recorder.batches for r in batch]
+    assert delivered[1:] == [CanonicalRequest.from_request(make_request(f"n{i}")).canonical for i in range(6, 10)]
+    assert sink.stats().dropped == 6
+
+
+def test_block_policy_applies_backpressure() -> None:
+    gate = threading.Event()
+    recorder = Recorder(gate)
+    sink = BatchingSink(recorder, max_queue=2, batch_size=1)
+    orchestrator = Orchestrator(sink=sink)
+
+    orchestrator.orchestrate(make_request("first"))
+    assert recorder.started.wait(5)
+    orchestrator.orchestrate(make_request("a"))
+    orchestrator.orchestrate(make_request("b"))
+
+    blocked = threading.Thread(target=orchestrator.orchestrate, args=(make_request("c"),))
+    blocked.start()
+    blocked.join(0.1)
+    assert blocked.is_alive()
+
+    gate.set()
+    blocked.join(5)
+    sink.close()
+    assert sink.stats().delivered == 4
+    assert sink.stats().dropped == 0
+
+
+def test_delivery_failures_and_late_reports_never_affect_responses() -> None:
+    sink = BatchingSink(Recorder(fail=True))
+    orchestrator = Orchestrator(sink=sink)
+
+    assert orchestrator.orchestrate(make_request()) == orchestrate(make_request())
+    assert sink.flush(timeout=5)
+    assert sink.stats().failed == 1
+
+    sink.close()
+    sink.close()
+    assert orchestrator.orchestrate(make_request()) == orchestrate(make_request())
+    assert sink.stats().dropped == 1
+
+
+def test_invalid_configuration_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        BatchingSink(Recorder(), policy="drop_newest")
+    with pytest.raises(ValueError):
+        BatchingSink(Recorder(), max_queue=0)
@@ -0,0 +1,37 @@
+import hashlib
+
+import pytest
+
+from shield_orchestrator.v3.canonical_json import iter_canonical_json, to_canonical_json
+from shield_orchestrator.v3.context_hash import (
+    compute_context_hash,
+    compute_context_hash_streaming,
+    update_canonical,
+)
+
+CORPUS = [
+    {},
+    [],
+    None,
+    "é \x00\"\\",
+    {"b": [1, 2.5, -0.0, 1e16, True, None], "a": {"z": "ż", "y": (1, "2")}},
+    {"outputs": [{"idx": i, "memo": "x" * 40} for i in range(2000)]},
+]
+
+
+@pytest.mark.parametrize("obj", CORPUS)
+def test_streaming_encoder_matches_canonical_json(obj) -> None:
+    assert "".join(iter_canonical_json(obj)) == to_canonical_json(obj)
+    assert compute_context_hash_streaming(obj) == compute_context_hash(obj)
+
+
+def test_update_canonical_small_chunks_match_one_shot_digest() -> None:
+    obj = CORPUS[-1]
+    h = hashlib.sha256()
+    update_canonical(h, obj, chunk_size=7)
+    assert h.hexdigest() == compute_context_hash(obj)
+
+
+def test_streaming_hash_rejects_non_serializable() -> None:
+    with pytest.raises(TypeError):
+        compute_context_hash_streaming({"bad": object()})
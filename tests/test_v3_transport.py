@@ -0,0 +1,137 @@
+import json
+import threading
+import time
+
+import pytest
+
+from shield_orchestrator.v3.contracts.envelope import OrchestratorV3Request
+from shield_orchestrator.v3.deadlines import timeout_entry
+from shield_orchestrator.v3.executors import ThreadExecutor
+from shield_orchestrator.v3.loopback import LoopbackComponentServer, stub_responder
+from shield_orchestrator.v3.orchestrate import Orchestrator, orchestrate
+from shield_orchestrator.v3.registry import CANONICAL_COMPONENTS
+from shield_orchestrator.v3.transport import ConnectionPool, RemoteBridge, Transport
+
+from conftest import make_request
+
+
+def _remote(transport: Transport, **kwargs) -> Orchestrator:
+    return Orchestrator(tuple(RemoteBridge(c, transport) for c in CANONICAL_COMPONENTS), **kwargs)
+
+
+def test_remote_bridges_match_in_process_stubs() -> None:
+    with LoopbackComponentServer() as server, Transport(server.endpoints()) as transport:
+        with _remote(transport) as orchestrator:
+            assert orchestrator.orchestrate(make_request()) == orchestrate(make_request())
+            requests = [make_request(f"n{i}") for i in range(20)]
+            assert orchestrator.orchestrate_many(requests) == [orchestrate(r) for r in requests]
+
+        # One keep-alive connection served every sequential call.
+        assert len(transport.pool("sentinel_ai")) == 1
+
+
+def test_concurrent_callers_pipeline_over_a_bounded_pool() -> None:
+    with LoopbackComponentServer() as server, Transport(
+        server.endpoints(), max_connections=2, max_pipeline=4
+    ) as transport, ThreadExecutor(max_workers=8) as executor:
+        orchestrator = _remote(transport, executor=executor)
+        results: list = []
+
+        def worker(i: int) -> None:
+            results.append(orchestrator.orchestrate(make_request(f"n{i}")))
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(16)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(results) == 16
+        assert all(r.reason_ids == ("DENY_BY_POLICY",) for r in results)
+        assert all(len(transport.pool(c)) <= 2 for c in CANONICAL_COMPONENTS)
+
+
+@pytest.mark.parametrize(
+    "reply",
+    [
+        b"not json",
+        b"[]",
+        b'{"stage":"sentinel_ai"}',
+        lambda body: json.loads(stub_responder("sentinel_ai", body)) | {"status": "MAYBE"},
+        lambda body: json.loads(stub_responder("sentinel_ai", body)) | {"reason_ids": ["MADE_UP"]},
+        lambda body: json.loads(stub_responder("sentinel_ai", body)) | {"component": "qwg"},
+        lambda body: json.loads(stub_responder("sentinel_ai", body)) | {"component_context_hash": "zz"},
+        lambda body: json.loads(stub_responder("sentinel_ai", body)) | {"notes": 7},
+    ],
+)
+def test_malformed_replies_map_to_invalid_response(reply) -> None:
+    def responder(component: str, body: bytes) -> bytes:
+        if component != "sentinel_ai":
+            return stub_responder(component, body)
+        return reply if isinstance(reply, bytes) else json.dumps(reply(body)).encode()
+
+    with LoopbackComponentServer(responder) as server, Transport(server.endpoints()) as transport:
+        resp = _remote(transport).orchestrate(make_request())
+
+    assert resp.outcome == "DENY"
+    assert resp.reason_ids == ("COMPONENT_INVALID_RESPONSE",)
+
+
+def test_slow_component_times_out_and_its_connection_is_replaced() -> None:
+    delays = [0.5]
+
+    def responder(component: str, body: bytes) -> bytes:
+        if component == "qwg" and delays:
+            time.sleep(delays.pop())
+        return stub_responder(component, body)
+
+    with LoopbackComponentServer(responder) as server, Transport(server.endpoints()) as transport:
+        bridges = tuple(RemoteBridge(c, transport, timeout_seconds=0.1) for c in CANONICAL_COMPONENTS)
+        orchestrator = Orchestrator(bridges)
+
+        resp = orchestrator.orchestrate(make_request())
+        assert resp.reason_ids == ("COMPONENT_TIMEOUT",)
+        # Recorded like a component abandoned at the deadline, not as a fail-closed error.
+        assert resp.trace[5] == timeout_entry(bridges[4])
+        assert [t.status for t in resp.trace[1:5]] == ["OK"] * 4
+        # The timed-out connection is closed rather than left to pair the late reply.
+        assert len(transport.pool("qwg")) == 0
+        assert orchestrator.orchestrate(make_request()) == orchestrate(make_request())
+        assert len(transport.pool("qwg")) == 1
+
+
+def test_requests_up_to_the_default_limits_fit_a_frame() -> None:
+    big = OrchestratorV3Request(**{**make_request().to_hash_material(), "payload": {"blob": "x" * (3 << 20)}})
+
+    with LoopbackComponentServer() as server:
+        with Transport(server.endpoints()) as transport:
+            assert _remote(transport).orchestrate(big) == orchestrate(big)
+
+        # A request over the frame cap is rejected up front, not as a component error.
+        with Transport(server.endpoints(), max_frame_bytes=1 << 20) as transport:
+            resp = _remote(transport).orchestrate(big)
+    assert resp.reason_ids == ("INVALID_REQUEST",)
+    assert resp.trace[0].stage == "fail_closed"
+
+
+def test_unreachable_and_missing_components_fail_closed() -> None:
+    with LoopbackComponentServer() as server:
+        without_qwg = {c: a for c, a in server.endpoints().items() if c != "qwg"}
+        with Transport(without_qwg) as transport:
+            assert _remote(transport).orchestrate(make_request()).reason_ids == ("COMPONENT_MISSING",)
+
+    # The server is gone: connecting fails.
+    with Transport(server.endpoints()) as transport:
+        assert _remote(transport).orchestrate(make_request()).reason_ids == ("COMPONENT_ERROR",)
+
+
+def test_pool_rejects_invalid_bounds_and_use_after_close() -> None:
+    with pytest.raises(ValueError):
+        ConnectionPool(("127.0.0.1", 1), max_connections=0)
+
+    with LoopbackComponentServer() as server:
+        pool = ConnectionPool(server.address)
+        pool.warm_up()
+        pool.close()
+        with pytest.raises(ConnectionError):
+            pool.call(b"{}", timeout=1)